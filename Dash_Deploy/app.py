@@ -1,20 +1,27 @@
 import os
 import sys
 import subprocess
+import json
 
 # Dash imports
-from dash import Dash, dcc, html, callback, Output, Input, State
+from dash import Dash, dcc, html, callback, ctx, no_update, Output, Input, Patch, State
 import datetime as dt
+from functools import lru_cache
 from datetime import date, timedelta
 import pandas as pd
 import plotly.graph_objects as go
 
 # Other imports
 import support.nba_teams as teams
+import support.rankings_store as rankings_store
+import support.rankings_tables as rankings_tables
+import support.seasons as seasons
+import support.frame_cache as frame_cache
+import support.rank_matrix as rank_matrix
+import support.week_buckets as week_buckets
+import support.rankings_db as rankings_db
 from dateutil.parser import parse
 import pytz
-import requests
-from io import StringIO
 import plotly.io as pio
 from plotly.subplots import make_subplots
 
@@ -37,41 +44,94 @@ def find_file(file_name):
     return None  # File not found in either path
 
 
-WEEK_REFERENCE_PATH = find_file("nba_weeks_ref")
+def read_nba_week(season=None):
+    """NBA weeks (sunday, nba_week) of a season, generated from its opening night."""
+    return seasons.season_weeks(season or current_season())
 
 
-def read_nba_week():
-    """Read NBA Week from reference file."""
-    return pd.read_csv(
-        WEEK_REFERENCE_PATH, parse_dates=["sunday"], dtype={"nba_week": int}
-    )
+# season -> (full ranking file, its rows of that season)
+_season_cuts = {}
 
 
-def read_ranking_file():
-    """Read NBA Ranking file from GitHub first, then local if unavailable."""
+def read_ranking_file(season=None):
+    """Read one season's rankings from the partitioned store, else the normalized tables, else the ranking file (GitHub, then local).
 
-    github_url = "https://raw.githubusercontent.com/keegangm/nba-power-rankings/main/Dash_Deploy/support/data/latest_powerrankings.csv"
+    Every source comes from an in-memory cache (support/frame_cache.py), so the same frame is returned
+    until the data changes: don't modify the result in place.
+    """
+    season = season or current_season()
 
-    # Start with GitHub
-    try:
-        response = requests.get(github_url, timeout=5)
-        response.raise_for_status()
+    # Partitioned store (only this season's files are opened), GitHub first, then local
+    for location in (rankings_store.GITHUB_STORE_URL, rankings_store.STORE_DIR):
+        try:
+            rk = rankings_store.read_season(season, location)
+        except frame_cache.LOAD_ERRORS as e:
+            print(f"Rankings store not loaded from {location}: {e}")
+            continue
+        if rk is not None:
+            return rk
 
-        csv_content = StringIO(response.text)
+    # Normalized tables (articles + integer ranks), GitHub first, then local
+    for location in (rankings_tables.GITHUB_TABLES_URL, rankings_tables.TABLES_DIR):
+        try:
+            return rankings_tables.read_rankings(season, location)
+        except frame_cache.LOAD_ERRORS as e:
+            print(f"Rankings tables not loaded from {location}: {e}")
+
+    # Whole ranking file, cut to the season (the cut is kept until the file reloads)
+    rk = read_full_ranking_file()
+    cached = _season_cuts.get(season)
+    if cached is None or cached[0] is not rk:
+        first_day, last_day = seasons.season_bounds(season)
+        cached = _season_cuts[season] = (rk, rk[(rk["date"] >= first_day) & (rk["date"] <= last_day)])
+    return cached[1]
 
-        from_github = pd.read_csv(
-            csv_content, parse_dates=["date"], date_format="%y%m%d"
-        )
 
-        # print("Loaded rankings from GitHub.")
-        return from_github
-    except (requests.RequestException, pd.errors.ParserError) as e:
+def parse_ranking_file(source):
+    return pd.read_csv(source, parse_dates=["date"], date_format="%y%m%d")  # 02-Dec-24
+
+
+def read_full_ranking_file():
+    """Read the ranking file (every season) from GitHub, else the local copy (both cached in memory)."""
+    github_url = "https://raw.githubusercontent.com/keegangm/nba-power-rankings/main/Dash_Deploy/support/data/latest_powerrankings.csv"
+
+    # Start with GitHub (revalidated in the background once per TTL)
+    try:
+        return frame_cache.read_frame(github_url, parse_ranking_file)
+    except frame_cache.LOAD_ERRORS as e:
         print(f"GitHub fetch failed: {e}. Falling back to local file.")
     # Fallback to local file
-    rk = pd.read_csv(
-        find_file("latest_powerrankings"), parse_dates=["date"], date_format="%y%m%d"
-    )  # 02-Dec-24
-    return rk
+    return frame_cache.read_frame(find_file("latest_powerrankings"), parse_ranking_file)
+
+
+# a season is offered once it has rankings from this many weeks (one week is a single point, not a trend)
+MIN_SEASON_WEEKS = 2
+
+
+def ranked_weeks(season):
+    """Number of NBA weeks of a season with at least one ranking."""
+    days = read_ranking_file(season)["date"].unique()
+    return pd.Series(seasons.get_calendar(season).weeks_of(days)).nunique()
+
+
+def list_seasons():
+    """Seasons with enough rankings to plot, oldest first (from the store or table listings when available)."""
+    found = rankings_store.list_seasons() or rankings_tables.list_seasons()
+    if not found:
+        found = read_full_ranking_file()["date"].map(seasons.season_of).unique()
+    return [season for season in seasons.started_seasons()
+            if season in set(found) and ranked_weeks(season) >= MIN_SEASON_WEEKS]
+
+
+@lru_cache(maxsize=None)
+def get_seasons():
+    """Seasons offered by the season selector (found on first use, not at import); the newest is shown first."""
+    return tuple(list_seasons())
+
+
+def current_season():
+    """Newest season with rankings: the default wherever no season is given."""
+    return get_seasons()[-1]
 
 
 us_central_tz = pytz.timezone("US/Central")
@@ -84,17 +144,13 @@ def get_max_pr_date():
     """Get date of most recent power rankings set present in 'latest_powerrankings.csv' file."""
     rk = read_ranking_file()
     # print(rk)
-    sorted_df = rk.sort_values(by="date", ascending=False)
-    max_date = sorted_df.max()["date"]
+    max_date = rk["date"].max()
     return max_date
 
 
-def nba_week_from_date(date=today):
-    """Get NBA Week number"""
-    wk_df = read_nba_week()
-    nba_week_no = wk_df[wk_df["sunday"] <= date].nba_week.max()
-
-    return int(nba_week_no)
+def nba_week_from_date(date=today, season=None):
+    """Get NBA Week number (counted within the date's season, or from the given season's week 1)."""
+    return seasons.nba_week(date, season)
 
 
 def most_recent_sunday(date):
@@ -106,16 +162,21 @@ def most_recent_sunday(date):
         return date - pd.to_timedelta(date.weekday() + 1, unit="D")
 
 
-def create_and_merge_rank_week():
+def create_and_merge_rank_week(start=None, end=None, teamnames=None, season=None):
+    """Merge a season's rankings and weeks (filtered in the indexed database when it is built)."""
+    season = season or current_season()
+    if rankings_db.available():
+        first_day, last_day = seasons.season_bounds(season)
+        start = most_recent_sunday(start) if start is not None else first_day
+        end = end if end is not None else last_day
+        return rankings_db.read_rankings(start, end, teamnames)
 
-    rk = read_ranking_file()
-    wk = read_nba_week()
+    rk = read_ranking_file(season)
 
-    rk["sunday"] = rk["date"].apply(most_recent_sunday)
-    rk["sunday"] = pd.to_datetime(rk["sunday"])
-    wk["sunday"] = pd.to_datetime(wk["sunday"])
-
-    df = pd.merge(rk, wk[["sunday", "nba_week"]], on="sunday", how="left")
+    # Sunday and week of every row in one vectorized pass (added to a copy: rk may be the cached frame)
+    df = week_buckets.add_weeks(rk, season=season)
+    if teamnames is not None:
+        df = df[df["teamname"].isin(teamnames)]
     return df
 
 
@@ -151,7 +212,7 @@ def create_source_pt(df: pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame")
 
     return pd.pivot_table(
-        df, values=["nba_week"], index=["source"], aggfunc=pd.Series.nunique
+        df, values=["nba_week"], index=["source"], aggfunc=pd.Series.nunique, observed=True
     ).rename(columns={"nba_week": "rankings_count"})
 
 
@@ -160,26 +221,26 @@ def create_rk_pt(df: pd.DataFrame):
     if not isinstance(df, pd.DataFrame):
         raise TypeError("Input must be a pandas DataFrame")
 
-    rk_pt = pd.pivot_table(df, index="teamname", columns="nba_week", values="ranking")
+    rk_pt = pd.pivot_table(df, index="teamname", columns="nba_week", values="ranking", observed=True)
     rk_pt = rk_pt.round(2)
 
     # rk_pt will be input for graphs
     return rk_pt
 
 
-def create_filtered_df(
-    df: pd.DataFrame, start_date="2024-10-20", end_date=dt.datetime.today()
-):
-    """Filter the DataFrame to only include rows with specified NBA weeks."""
-
-    start_adjust = most_recent_sunday(start_date)  # find most recent sunday
-    end_adjust = end_date
+def create_filtered_df(df: pd.DataFrame, start_date=None, end_date=None):
+    """Filter the DataFrame to only include rows with specified NBA weeks (no bound when a date is None)."""
 
     df["date"] = pd.to_datetime(df["date"])
     df = df[df["nba_week"].notna()]
     df["nba_week"] = df["nba_week"].astype(int)
 
-    filtered_df = df[(df.date >= start_adjust) & (df.date <= end_adjust)]
+    filtered_df = df
+    if start_date is not None:
+        start_adjust = most_recent_sunday(start_date)  # find most recent sunday
+        filtered_df = filtered_df[filtered_df.date >= start_adjust]
+    if end_date is not None:
+        filtered_df = filtered_df[filtered_df.date <= pd.Timestamp(end_date)]
 
     return filtered_df
 
@@ -192,47 +253,82 @@ def df_string_for_graph():
     return rk_pt
 
 
-data_points = len(create_season_rks_df(create_and_merge_rank_week()))
+def count_data_points():
+    return len(create_season_rks_df(create_and_merge_rank_week()))
 
 
-def df_string_for_graph_2(start="2024-10-20", end=dt.datetime.today()):
-    ranking_file = find_file("latest_powerrankings")
-    df = create_filtered_df(create_and_merge_rank_week(), start, end)
-    rk_pt = create_rk_pt(df)
+def season_range(start=None, end=None, season=None):
+    """Fill in missing range bounds with the season's week 1 and last day."""
+    season = season or current_season()
+    if start is None:
+        start = seasons.week_one_sunday(season)
+    if end is None:
+        end = seasons.season_bounds(season)[1]
+    return start, end
+
+
+def rankings_version(season):
+    """(rankings frame, version) of a season: the database's version when it is built, else the cached frame's identity."""
+    if rankings_db.available():
+        return None, rankings_db.version()
+    # read_ranking_file returns the same cached frame until the data changes
+    # (callers keep the frame with their cache entry so its id can't be reused)
+    rk = read_ranking_file(season)
+    return rk, id(rk)
 
-    return rk_pt
 
+# season -> (data version, rankings frame it was built from, RankMatrix)
+_matrices = {}
 
-def get_max_min_week(start="2024-10-20", end=dt.datetime.today()):
+
+def season_matrix(season=None):
+    """A season's team x week rank matrices, rebuilt only when its rankings change."""
+    season = season or current_season()
+    rk, version = rankings_version(season)
+
+    cached = _matrices.get(season)
+    if cached is None or cached[0] != version:
+        df = create_filtered_df(create_and_merge_rank_week(season=season))
+        _matrices[season] = (version, rk, rank_matrix.RankMatrix.from_rankings(df))
+    return _matrices[season][2]
+
+
+def df_string_for_graph_2(start=None, end=None, season=None):
+    """Mean rank per team and week between two dates, sliced from the season's matrix."""
+    max_week, min_week = get_max_min_week(start, end, season)
+    return season_matrix(season).pivot(first_week=min_week, last_week=max_week)
+
+
+def get_max_min_week(start=None, end=None, season=None):
     """Get NBA WEEK # for start and end date"""
+    season = season or current_season()
+    start, end = season_range(start, end, season)
 
-    return nba_week_from_date(end), nba_week_from_date(start)
+    return nba_week_from_date(end, season), nba_week_from_date(start, season)
 
 
-def sunday_from_nba_week(week: int):
-    """Lookup date for Sunday of week number."""
+def sunday_from_nba_week(week: int, season=None):
+    """Date of the Sunday starting a season's week number."""
     try:
-        wk = read_nba_week()
-        return (wk.loc[wk["nba_week"] == week, "sunday"]).item()
-    except:
+        return seasons.sunday_of_week(week, season or current_season())
+    except (TypeError, ValueError, KeyError):
         return None
 
 
-def create_sundays_array():
+def create_sundays_array(season=None):
     """Create arrays of Sundays and corresponding NBA week #s."""
-    weeks_array = []
-    sundays_array = []
-    for i in range(1, 30):
-        weeks_array.append(i)
-        # sundays_array.append(sunday_lookup(i)+1)
-        sundays_array.append(sunday_from_nba_week(i))
+    weeks_array = list(range(1, 30))
+    sundays_array = list(seasons.get_calendar(season or current_season()).sundays_of(weeks_array))
 
     return weeks_array, sundays_array
 
 
-date_strings = [d.strftime("%b %-d") for d in create_sundays_array()[1]]
+def make_date_strings(season=None):
+    """Labels for the Sundays of weeks 1-29 of a season."""
+    return [d.strftime("%b %-d") for d in create_sundays_array(season)[1]]
 
 
+@lru_cache(maxsize=None)
 def make_dropdown_options():
     teams = read_nba_teams_ref()
     dropdown_options = []
@@ -272,18 +368,19 @@ def make_dropdown_options():
     return dropdown_options
 
 
-# Define date range
-start_date = dt.datetime(2024, 10, 20)
-# end_date = dt.datetime.today()
-end_date = sunday_from_nba_week(df_string_for_graph_2().columns.max())
-
-# Convert to integer timestamps
-start_timestamp = int(start_date.timestamp())
-end_timestamp = int(end_date.timestamp())
+def season_dates(season=None):
+    """Week 1 Sunday and the Sunday of the latest ranked week of a season."""
+    season = season or current_season()
+    start = seasons.week_one_sunday(season).to_pydatetime()
+    end = sunday_from_nba_week(df_string_for_graph_2(season=season).columns.max(), season).to_pydatetime()
+    return start, end
 
 
-def get_datemarks_from_wk(start=start_date, end=end_date, step=7):
+# Define date range
+def get_datemarks_from_wk(start=None, end=None, step=7):
     """Generate date marks with start, end, and up to 2 evenly spaced intermediates."""
+    if start is None or end is None:
+        start, end = season_dates()
     marks = {}
 
     start_week = nba_week_from_date(start)
@@ -312,261 +409,314 @@ def get_datemarks_from_wk(start=start_date, end=end_date, step=7):
     return dict(sorted(marks.items()))
 
 
+def make_season_options():
+    return [{"label": season, "value": season} for season in reversed(get_seasons())]
+
+
+# season -> (data version, rankings frame they were computed from, layout values)
+_layout_values = {}
+
+
+def layout_values(season=None):
+    """What a page load shows for a season (selectors, week range, footer), recomputed only when its rankings change."""
+    season = season or current_season()
+    rk, version = rankings_version(season)
+
+    cached = _layout_values.get(season)
+    if cached is None or cached[0] != version:
+        start_date, end_date = season_dates(season)
+        values = dict(
+            season=season,
+            season_options=make_season_options(),
+            team_options=make_dropdown_options(),
+            week_one=start_date.date().isoformat(),
+            week_range=(nba_week_from_date(start_date), nba_week_from_date(end_date)),
+            marks=get_datemarks_from_wk(start=start_date, end=end_date),
+            updated=f"data updated {clean_date(str(get_max_pr_date()))} ({count_data_points()} observations)",
+        )
+        _layout_values[season] = (version, rk, values)
+    return _layout_values[season][2]
+
+
 ##### APP #####
 app = Dash(__name__)
 # buffer - io.StringIO()
 server = app.server
 app.title = "DEV: NBA Power Rankings Viz"
 
-app.layout = html.Div(
-    [
-        html.Div(
-            [
-                html.H1("Visualizing NBA Power Rankings", id="page-title"),
-                html.H3(
-                    f"Tracking NBA.com, ESPN, BR, and other top sources to make sense of the league's glorious chaos.",
-                    id="page-subtitle",
-                ),
-                # html.Div(className="shape-sep"),
-                html.Hr(),
-                html.H5("Created by Keegan Morris", className="byline"),
-            ],
-            id="header-div",
-        ),
-        html.Div(
-            [
-                # Comment
-                html.Div(
-                    [
-                        # html.H5('Select Conference/Division', className="button-label"),
-                        html.Div(
-                            [
-                                html.Div(id="graph-title"),
-                                html.Div(
-                                    [
-                                        dcc.Checklist(
-                                            id="all-teams-checkbox",
-                                            options=[
-                                                {"label": "  All Teams", "value": "all"}
-                                            ],
-                                            value=["all"],
-                                        ),
-                                        dcc.Dropdown(
-                                            make_dropdown_options(),
-                                            id="team-dropdown",
-                                            className="check-label",
-                                            value=["West", "East"],
-                                            # clearable=False,
-                                            multi=True,
-                                            disabled=False,
-                                        ),
-                                    ],
-                                    id="team-dropdown-subdiv",
-                                    className="button-grp",
-                                ),
-                                dcc.Store(id="previous-all-teams-checkbox", data=[]),
-                            ],
-                            id="team-dropdown-select-div",
-                        )
-                    ],
-                    id="graph-header",
-                ),
-                # ],
-                # id="team-dropdown-div"),
-                # html.Div([
-                html.Div(
-                    [
-                        dcc.Graph(
-                            # figure=make_fig(df_string_for_graph_2()),
-                            id="pr-graph",
-                        ),
-                        dcc.Store(id="trace-visibility-store", data=[True] * 30),
-                    ],
-                    id="graph-subdiv",
-                ),
-                html.Div(
-                    [
-                        html.Div(
-                            [
-                                dcc.RangeSlider(
-                                    step=1,
-                                    id="date-range-slider-wk",
-                                    min=nba_week_from_date(start_date),
-                                    max=nba_week_from_date(end_date),
-                                    marks=get_datemarks_from_wk(
-                                        start=start_date, end=end_date
+def build_layout(season=None, season_options=(), team_options=(), week_one=None,
+                 week_range=(1, 1), marks=None, updated=""):
+    """Page layout for the given values (the defaults give the same components with nothing filled in)."""
+    return html.Div(
+        [
+            html.Div(
+                [
+                    html.H1("Visualizing NBA Power Rankings", id="page-title"),
+                    html.H3(
+                        f"Tracking NBA.com, ESPN, BR, and other top sources to make sense of the league's glorious chaos.",
+                        id="page-subtitle",
+                    ),
+                    # html.Div(className="shape-sep"),
+                    html.Hr(),
+                    html.H5("Created by Keegan Morris", className="byline"),
+                ],
+                id="header-div",
+            ),
+            html.Div(
+                [
+                    # Comment
+                    html.Div(
+                        [
+                            # html.H5('Select Conference/Division', className="button-label"),
+                            html.Div(
+                                [
+                                    html.Div(id="graph-title"),
+                                    html.Div(
+                                        [
+                                            dcc.Checklist(
+                                                id="all-teams-checkbox",
+                                                options=[
+                                                    {"label": "  All Teams", "value": "all"}
+                                                ],
+                                                value=["all"],
+                                            ),
+                                            dcc.Dropdown(
+                                                team_options,
+                                                id="team-dropdown",
+                                                className="check-label",
+                                                value=["West", "East"],
+                                                # clearable=False,
+                                                multi=True,
+                                                disabled=False,
+                                            ),
+                                        ],
+                                        id="team-dropdown-subdiv",
+                                        className="button-grp",
                                     ),
-                                    tooltip={
-                                        "always_visible": True,
-                                        "placement": "bottom",
-                                        "transform": "getSundayByNBAWeek",
-                                    },
-                                ),
-                            ],
-                            id="slider-div",
-                        ),
-                    ]
-                ),
-                html.Div(
-                    [
-                        html.Div(
-                            [
-                                dcc.RadioItems(
-                                    [
-                                        {
-                                            "label": "Default View",
-                                            "value": "def-view",
-                                        },
-                                        {
-                                            "label": "His/Lows",
-                                            "value": "his-los",
-                                        },
-                                        {
-                                            "label": "Ranking vs Record",
-                                            "value": "record",
-                                        },
-                                        {
-                                            "label": "Rises/Drops",
-                                            "value": "rises",
+                                    dcc.Store(id="previous-all-teams-checkbox", data=[]),
+                                    dcc.Dropdown(
+                                        season_options,
+                                        id="season-dropdown",
+                                        className="check-label",
+                                        value=season,
+                                        clearable=False,
+                                    ),
+                                    dcc.Store(
+                                        id="season-week-one",
+                                        data=week_one,
+                                    ),
+                                ],
+                                id="team-dropdown-select-div",
+                            )
+                        ],
+                        id="graph-header",
+                    ),
+                    # ],
+                    # id="team-dropdown-div"),
+                    # html.Div([
+                    html.Div(
+                        [
+                            dcc.Graph(
+                                # figure=make_fig(df_string_for_graph_2()),
+                                id="pr-graph",
+                            ),
+                            # legend state: bit i of "hidden" set = trace i hidden from the legend
+                            dcc.Store(id="trace-visibility-store", data={"traces": 30, "hidden": 0}),
+                        ],
+                        id="graph-subdiv",
+                    ),
+                    html.Div(
+                        [
+                            html.Div(
+                                [
+                                    dcc.RangeSlider(
+                                        step=1,
+                                        id="date-range-slider-wk",
+                                        min=week_range[0],
+                                        max=week_range[1],
+                                        marks=marks or {},
+                                        tooltip={
+                                            "always_visible": True,
+                                            "placement": "bottom",
+                                            "transform": "getSundayByNBAWeek",
                                         },
-                                    ],id='graph-layouts-options', value='def-view',
-                                ),
-                                html.Div(id='view-output')
-                            ],
-                            id="graph-layouts",
+                                    ),
+                                ],
+                                id="slider-div",
+                            ),
+                        ]
+                    ),
+                    html.Div(
+                        [
+                            html.Div(
+                                [
+                                    dcc.RadioItems(
+                                        [
+                                            {
+                                                "label": "Default View",
+                                                "value": "def-view",
+                                            },
+                                            {
+                                                "label": "His/Lows",
+                                                "value": "his-los",
+                                            },
+                                            {
+                                                "label": "Ranking vs Record",
+                                                "value": "record",
+                                            },
+                                            {
+                                                "label": "Rises/Drops",
+                                                "value": "rises",
+                                            },
+                                        ],id='graph-layouts-options', value='def-view',
+                                    ),
+                                    html.Div(id='view-output')
+                                ],
+                                id="graph-layouts",
                             
-                        ),
-                    ]
-                ),
-            ],
-            id="graph-div",
-        ),
-        html.Div(
-            [
-                html.Div(
-                    [
-                        html.Details(
-                            [
-                                html.Summary("Filters"),
-                                html.Div(
-                                    className="button-array-html",
-                                    children=[
-                                        html.Div(
-                                            [
-                                                html.H5(
-                                                    "Display Range",
-                                                    id="range-header",
-                                                    className="button-label",
-                                                ),
-                                                dcc.RadioItems(
-                                                    [
-                                                        {
-                                                            "label": "Full Range*",
-                                                            "value": "def-range",
-                                                        },
-                                                        {
-                                                            "label": "Top 5",
-                                                            "value": "bot-5",
-                                                        },
-                                                        {
-                                                            "label": "Bottom 5",
-                                                            "value": "top-5",
+                            ),
+                        ]
+                    ),
+                ],
+                id="graph-div",
+            ),
+            html.Div(
+                [
+                    html.Div(
+                        [
+                            html.Details(
+                                [
+                                    html.Summary("Filters"),
+                                    html.Div(
+                                        className="button-array-html",
+                                        children=[
+                                            html.Div(
+                                                [
+                                                    html.H5(
+                                                        "Display Range",
+                                                        id="range-header",
+                                                        className="button-label",
+                                                    ),
+                                                    dcc.RadioItems(
+                                                        [
+                                                            {
+                                                                "label": "Full Range*",
+                                                                "value": "def-range",
+                                                            },
+                                                            {
+                                                                "label": "Top 5",
+                                                                "value": "bot-5",
+                                                            },
+                                                            {
+                                                                "label": "Bottom 5",
+                                                                "value": "top-5",
+                                                            },
+                                                        ],
+                                                        "def-range",
+                                                        id="rank-radio",
+                                                        labelStyle={
+                                                            "display": "inline-block"
                                                         },
-                                                    ],
-                                                    "def-range",
-                                                    id="rank-radio",
-                                                    labelStyle={
-                                                        "display": "inline-block"
-                                                    },
-                                                    className="radio-label",
-                                                ),
-                                                html.P(
-                                                    "*default",
-                                                    id="note1",
-                                                    className="footnote",
-                                                ),
-                                            ],
-                                            id="rank-range",
-                                            className="button-grp",
-                                        ),
-                                        html.Div(
-                                            [
-                                                html.H5(
-                                                    "Update XTicks Labels",
-                                                    className="button-label",
-                                                ),
-                                                html.Div(
-                                                    [
-                                                        dcc.Checklist(
-                                                            id="week-day-check",
-                                                            className="check-label",
-                                                            options=[
-                                                                {
-                                                                    "label": "Display Weeks",
-                                                                    "value": "linear",
-                                                                }
-                                                            ],
-                                                            value=["dates"],
-                                                        ),
-                                                    ],
-                                                ),
-                                            ],
-                                            id="xticks-labels",
-                                            className="button-grp",
-                                        ),
-                                        html.Div(
-                                            [
-                                                html.H5(
-                                                    "Mark Scatter Points",
-                                                    className="button-label",
-                                                ),
-                                                html.Div(
-                                                    [
-                                                        dcc.Checklist(
-                                                            id="dot-check",
-                                                            className="check-label",
-                                                            options=[
-                                                                {
-                                                                    "label": "Show Marks",
-                                                                    "value": "show",
-                                                                }
-                                                            ],
-                                                            value=[],
-                                                        ),
-                                                    ],
-                                                ),
-                                            ],
-                                            id="show-dots",
-                                            className="button-grp",
-                                        ),
-                                    ],
-                                    id="button_groups",
-                                ),
-                            ],
-                            id="lower-section",
-                        ),
-                    ]
-                ),
-            ]
-        ),
-        html.Div(
-            id="text-attribution",
-            children=[
-                html.A(
-                    f"keegan-morris.com",
-                    href="https://keegan-morris.com/2025/02/25/dash-deploy-power-rankings/",
-                    target="_blank",
-                    id="attrib-url",
-                ),
-                html.P(
-                    f"data updated {clean_date(str(get_max_pr_date()))} ({data_points} observations)",
-                    id="attrib-date",
-                ),
-                # html.P(f"", id='observations'),
-            ],
-        ),
-    ]
-)
+                                                        className="radio-label",
+                                                    ),
+                                                    html.P(
+                                                        "*default",
+                                                        id="note1",
+                                                        className="footnote",
+                                                    ),
+                                                ],
+                                                id="rank-range",
+                                                className="button-grp",
+                                            ),
+                                            html.Div(
+                                                [
+                                                    html.H5(
+                                                        "Update XTicks Labels",
+                                                        className="button-label",
+                                                    ),
+                                                    html.Div(
+                                                        [
+                                                            dcc.Checklist(
+                                                                id="week-day-check",
+                                                                className="check-label",
+                                                                options=[
+                                                                    {
+                                                                        "label": "Display Weeks",
+                                                                        "value": "linear",
+                                                                    }
+                                                                ],
+                                                                value=["dates"],
+                                                            ),
+                                                        ],
+                                                    ),
+                                                ],
+                                                id="xticks-labels",
+                                                className="button-grp",
+                                            ),
+                                            html.Div(
+                                                [
+                                                    html.H5(
+                                                        "Mark Scatter Points",
+                                                        className="button-label",
+                                                    ),
+                                                    html.Div(
+                                                        [
+                                                            dcc.Checklist(
+                                                                id="dot-check",
+                                                                className="check-label",
+                                                                options=[
+                                                                    {
+                                                                        "label": "Show Marks",
+                                                                        "value": "show",
+                                                                    }
+                                                                ],
+                                                                value=[],
+                                                            ),
+                                                        ],
+                                                    ),
+                                                ],
+                                                id="show-dots",
+                                                className="button-grp",
+                                            ),
+                                        ],
+                                        id="button_groups",
+                                    ),
+                                ],
+                                id="lower-section",
+                            ),
+                        ]
+                    ),
+                ]
+            ),
+            html.Div(
+                id="text-attribution",
+                children=[
+                    html.A(
+                        f"keegan-morris.com",
+                        href="https://keegan-morris.com/2025/02/25/dash-deploy-power-rankings/",
+                        target="_blank",
+                        id="attrib-url",
+                    ),
+                    html.P(
+                        updated,
+                        id="attrib-date",
+                    ),
+                    # html.P(f"", id='observations'),
+                ],
+            ),
+        ]
+    )
+
+
+def serve_layout():
+    """Page layout, built per page load (from values cached until the data changes) so importing the app reads no data."""
+    return build_layout(**layout_values())
+
+
+# callback ids are validated against an empty copy of the page; with it set,
+# Dash doesn't call serve_layout when it is assigned
+app.validation_layout = build_layout()
+app.layout = serve_layout
 
 
 def dropdown_update_layout(value):
@@ -589,28 +739,32 @@ def dropdown_update_layout(value):
     return [{"visible": v} for v in visibility]
 
 
+# rank-radio presets (the clientside view callback applies them in the browser too)
+CHART_YRANGES = {
+    "bot-5": {
+        "yrange": [5.5, 0.5],
+        "dtick": 1,
+        "tickvals": [1, 3, 5],
+        "title_standoff": 22.8,
+    },
+    "top-5": {
+        "yrange": [30.5, 25.5],
+        "dtick": 1,
+        "tickvals": [30, 28, 26],
+        "title_standoff": 12,
+    },
+    "def-range": {
+        "yrange": [30.5, 0.5],
+        "dtick": 5,
+        "tickvals": [1, 10, 20, 30],
+        "title_standoff": 12,
+    },
+}
+
+
 def set_chart_yrange(value):
     """Update chart y_range based from radio button input."""
-    options = {
-        "bot-5": {
-            "yrange": [5.5, 0.5],
-            "dtick": 1,
-            "tickvals": [1, 3, 5],
-            "title_standoff": 22.8,
-        },
-        "top-5": {
-            "yrange": [30.5, 25.5],
-            "dtick": 1,
-            "tickvals": [30, 28, 26],
-            "title_standoff": 12,
-        },
-        "def-range": {
-            "yrange": [30.5, 0.5],
-            "dtick": 5,
-            "tickvals": [1, 10, 20, 30],
-            "title_standoff": 12,
-        },
-    }
+    options = CHART_YRANGES
     settings = options.get(value, options[value])
     return (
         settings["yrange"],
@@ -632,9 +786,9 @@ def set_hovertemplate_format(value):
     return hovertemplate_btmlines
 
 
-def set_xticks(value):
+def set_xticks(value, season=None):
     """Alternate between date and nba_week # XTick labels."""
-    weeks_array, sundays_array = create_sundays_array()
+    weeks_array, sundays_array = create_sundays_array(season)
     sundays_str = [date.strftime("%b. %-d") for date in sundays_array]
 
     if value == ["dates", "linear"]:
@@ -663,22 +817,49 @@ def set_xticks(value):
     return xticks_set
 
 
-def df_string_for_graph_subset(team_input):
-    """Filter dataframe based on input."""
+def patch_leaves(patched, values):
+    """Assign each leaf of a nested dict into a Patch (sibling keys already in the figure are kept)."""
+    for key, value in values.items():
+        if isinstance(value, dict):
+            patch_leaves(patched[key], value)
+        else:
+            patched[key] = value
+
+
+def week_labels_patch(filtered_df, week_day_check, season=None):
+    """Switch the x-axis labels and hover text between dates and week numbers without rebuilding the traces."""
+    patched = Patch()
+    hover = set_hovertemplate_format(week_day_check) + "<extra></extra>"
+    for i, team in enumerate(filtered_df.index):
+        patched["data"][i]["hovertemplate"] = f"<b>{team.upper()}</b>" + hover
+
+    # the date axis keeps the title and tick angle the figure was built with
+    xaxis = go.layout.XAxis(title=dict(text="<b>Date</b>", font_size=18))
+    xaxis.update(set_xticks(week_day_check, season))
+    xaxis = xaxis.to_plotly_json()
+    patch_leaves(patched["layout"]["xaxis"], xaxis)
+    if "tickangle" not in xaxis:
+        del patched["layout"]["xaxis"]["tickangle"]
+    return patched
+
+
+def df_string_for_graph_subset(team_input, start=None, end=None, season=None):
+    """Filter dataframe based on input (only the selected teams' rows are read)."""
     applicable_teams = set()
-    df = df_string_for_graph_2()
+    start, end = season_range(start, end, season)
 
     # Check if "All Teams" is selected (case-insensitive)
     if any(i.lower() == "all teams" for i in team_input):
-        return df  # Return the entire DataFrame
+        return df_string_for_graph_2(start, end, season)  # Return the entire DataFrame
 
+    all_teams = read_nba_teams_ref()["teamname"]
     for i in team_input:
         team = teams.find_team(i)
         if team:
             applicable_teams.add(team)
         # Handle conferences
         elif i in ["East", "West"]:
-            applicable_teams.update(t for t in df.index if teams.nba_conf(t) == i)
+            applicable_teams.update(t for t in all_teams if teams.nba_conf(t) == i)
         # Handle divisions
         elif i in [
             "Southwest",
@@ -688,11 +869,11 @@ def df_string_for_graph_subset(team_input):
             "Northwest",
             "Central",
         ]:
-            applicable_teams.update(t for t in df.index if teams.nba_div(t) == i)
+            applicable_teams.update(t for t in all_teams if teams.nba_div(t) == i)
 
-    # Filter the DataFrame to include only rows where the index (teamname) is in applicable_teams
-    filtered_df = df[df.index.isin(applicable_teams)]
-    return filtered_df
+    # Slice only the applicable teams from the season's matrix
+    max_week, min_week = get_max_min_week(start, end, season)
+    return season_matrix(season).pivot(applicable_teams, min_week, max_week)
 
 
 def show_title(team_input, checkbox):
@@ -721,13 +902,13 @@ def show_title(team_input, checkbox):
         return " ".join(["Power Rankings:", team_input[0]])
 
 
-def date_range_slider_set(slider):
+def date_range_slider_set(slider, season=None):
     # print(slider==None)
     if slider is None:
         start_date = 0.85
         end_date = (
             nba_week_from_date(
-                sunday_from_nba_week(df_string_for_graph_2().columns.max())
+                sunday_from_nba_week(df_string_for_graph_2(season=season).columns.max(), season)
             )
             + 0.15
         )
@@ -741,22 +922,26 @@ def date_range_slider_set(slider):
             start_date = 1
             end_date = (
                 nba_week_from_date(
-                    sunday_from_nba_week(df_string_for_graph_2().columns.max())
+                    sunday_from_nba_week(df_string_for_graph_2(season=season).columns.max(), season)
                 )
                 + 0.15
             )
 
     return start_date, end_date
 
+
 def create_weekly_summary():
     games_df = pd.read_csv('250408games_df.csv')
     games_df = games_df.reset_index()
-    games_df['most_recent_sunday'] = games_df['date'].apply(lambda x: most_recent_sunday(pd.to_datetime(x)))
+    games_df['most_recent_sunday'] = week_buckets.sundays(games_df['date'])
     weekly_summary = games_df.groupby(['team_name_abbr','most_recent_sunday'])[['rolling_20', 'rolling_10', 'rolling_15']].mean().reset_index()
 
     return weekly_summary
 
-print(create_weekly_summary())
+@lru_cache(maxsize=None)
+def get_weekly_summary():
+    """create_weekly_summary(), read on first use."""
+    return create_weekly_summary()
 
 def create_hi_graph(filtered_df):
     """Create graph for highs and lows for individual team."""
@@ -816,6 +1001,7 @@ def create_record_graph():
 
 
 
+    weekly_summary = get_weekly_summary()
     weekly_summary_filtered = weekly_summary.loc[weekly_summary['team_name_abbr'] == teams.nba_abbrname(team)]
     fig.add_trace(go.Scatter(
         x=weekly_summary_filtered['nba_week'],
@@ -872,40 +1058,91 @@ def choose_team_graph(radio_options):
         # Return normal graph
         pass
 
+@app.callback(
+    Output("date-range-slider-wk", "min"),
+    Output("date-range-slider-wk", "max"),
+    Output("date-range-slider-wk", "marks"),
+    Output("date-range-slider-wk", "value"),
+    Output("season-week-one", "data"),
+    Input("season-dropdown", "value"),
+    prevent_initial_call=True,
+)
+def update_season(season):
+    """Fit the week slider to the selected season (only that season's rankings are read)."""
+    start, end = season_dates(season)
+    return (
+        nba_week_from_date(start),
+        nba_week_from_date(end),
+        get_datemarks_from_wk(start=start, end=end),
+        None,
+        start.date().isoformat(),
+    )
+
+
+# the slider tooltip counts weeks from the selected season's week 1 (see assets/tooltip.js)
+app.clientside_callback(
+    """
+    function(weekOne, tooltip) {
+        window.nbaWeekOneSunday = weekOne;
+        return Object.assign({}, tooltip);
+    }
+    """,
+    Output("date-range-slider-wk", "tooltip"),
+    Input("season-week-one", "data"),
+    State("date-range-slider-wk", "tooltip"),
+)
+
+
+# inputs that change the traces rebuild the figure; the view-only ones
+# (week range, rank range, markers) are read as State here and applied in the browser below,
+# and the date/week label toggle and layout picker are patched without a rebuild
 @app.callback(
     Output("pr-graph", "figure"),
     Output("trace-visibility-store", "data"),
     Output("team-dropdown", "disabled"),
     Output("graph-title", "children"),
     Output("view-output", "children"),
-    Input("date-range-slider-wk", "value"),
-    Input("rank-radio", "value"),
     Input("week-day-check", "value"),
     Input("all-teams-checkbox", "value"),
     Input("team-dropdown", "value"),
     Input("graph-layouts-options", "value"),
-    Input("dot-check", "value"),
-    Input("pr-graph", "restyleData"),
+    Input("season-dropdown", "value"),
+    State("date-range-slider-wk", "value"),
+    State("rank-radio", "value"),
+    State("dot-check", "value"),
     State("trace-visibility-store", "data"),
-    State("pr-graph", "figure"),
 )
 def update_graph(
-    date_range_slider,
-    rank_radio,
     week_day_check,
     all_teams_checkbox,
     team_dropdown,
     graph_layouts_options,
+    season,
+    date_range_slider,
+    rank_radio,
     dot_check,
-    restyle_data,
     visibility_state,
-    figure,
 ):
-    
-    
+    triggered = set(ctx.triggered_prop_ids.values())
+    if triggered == {"graph-layouts-options"}:
+        # the layout picker doesn't touch the figure
+        return no_update, no_update, no_update, no_update, graph_layouts_options
+    if ctx.triggered_id == "season-dropdown":
+        date_range_slider = None  # update_season is resetting the slider to the new season
+
+    # Step 1: Create df (the whole matrix with all teams checked, else the dropdown's teams)
+    if all_teams_checkbox:
+        # DROPDOWN IS INACTIVE
+        dropdown_disabled = True
+        filtered_df = df_string_for_graph_2(season=season)
+    else:
+        dropdown_disabled = False
+        filtered_df = df_string_for_graph_subset(team_dropdown, season=season)
 
-    # Step 1: Create df
-    df = df_string_for_graph_2()
+    teams_no = len(filtered_df.index)
+    if triggered == {"week-day-check"} and teams_no != 1:
+        # same traces, relabelled (the single-team chart has its own traces and is rebuilt)
+        return week_labels_patch(filtered_df, week_day_check, season), no_update, no_update, no_update, no_update
 
     chart_settings = set_chart_yrange(rank_radio)
     chart_yrange = chart_settings[0]
@@ -913,26 +1150,12 @@ def update_graph(
     chart_tickvals = chart_settings[2]
 
     graph_title = show_title(team_dropdown, all_teams_checkbox)
-    filtered_df = df_string_for_graph_subset(team_dropdown)
-    weeks_array, sundays_array = create_sundays_array()
+    weeks_array, sundays_array = create_sundays_array(season)
     sundays_str = [date.strftime("%b. %-d") for date in sundays_array]
-
-    # if checkbox selected
-    if all_teams_checkbox:
-        # DROPDOWN IS INACTIVE
-        dropdown_disabled = True
-        filtered_df = df_string_for_graph_2()
-    else:
-        dropdown_disabled = False
-
-    if isinstance(team_dropdown, list):
-        selected_teams = team_dropdown
+    date_strings = make_date_strings(season)
 
     fig = go.Figure()
     
-    teams_no = len(filtered_df.index)
-    #print(teams_no)
-    
     if teams_no == 1:
         fig = create_hi_graph(filtered_df)
         #return fig
@@ -961,35 +1184,16 @@ def update_graph(
                 )
             )
 
-    # Step 3: Handle legend interactions (update visibility_state)
-    if restyle_data:
-        if isinstance(restyle_data[0], dict) and "visible" in restyle_data[0]:
-            new_visibility = restyle_data[0]["visible"]
-            trace_indices = restyle_data[1]
-
-            for i, trace_idx in enumerate(trace_indices):
-                if trace_idx < len(visibility_state):
-                    visibility_state[trace_idx] = new_visibility[i]
-
-    # Step 4: Initialize visibility_state if it's None or invalid
-    if visibility_state is None or len(visibility_state) != len(fig.data):
-        visibility_state = [True] * len(fig.data)  # Default to all traces visible
-
-    # Step 5: Apply team dropdown filtering
-    dropdown_visibility = dropdown_update_layout(team_dropdown)
-    for i, trace in enumerate(fig.data):
-        trace.visible = dropdown_visibility[i]["visible"] and visibility_state[i]
-
-    # Step 6: Reapply the visibility state to preserve legend-selected traces
-    if visibility_state and len(visibility_state) == len(fig.data):
-        for i, trace in enumerate(fig.data):
-            trace.visible = visibility_state[i]
+    # Step 3: Reapply the legend state (kept up to date in the browser, see below)
+    # to preserve legend-selected traces; a different set of traces starts all visible
+    if visibility_state and visibility_state["traces"] == len(fig.data):
+        hidden = visibility_state["hidden"]
     else:
-        # If visibility_state is invalid, ensure all traces are visible
-        for trace in fig.data:
-            trace.visible = True
+        hidden = 0
+    for i, trace in enumerate(fig.data):
+        trace.visible = "legendonly" if hidden >> i & 1 else True
 
-    start_week, end_week = date_range_slider_set(date_range_slider)
+    start_week, end_week = date_range_slider_set(date_range_slider, season)
     # Update layout for better visualization
     fig.update_layout(
         autosize=True,
@@ -1079,13 +1283,98 @@ def update_graph(
             # title_standoff=title_standoff
         ),
         xaxis=dict(
-            **set_xticks(week_day_check),  # Apply x-ticks settings
+            **set_xticks(week_day_check, season),  # Apply x-ticks settings
         ),
     )
 
     #pio.write_html(fig, file="nba_plot.html", full_html=False)
-    return fig, [trace.visible for trace in fig.data], dropdown_disabled, graph_title, graph_layouts_options
+    return fig, {"traces": len(fig.data), "hidden": hidden}, dropdown_disabled, graph_title, graph_layouts_options
+
+
+# legend clicks only update the legend state: Plotly has already redrawn the
+# traces, so the restyleData delta is folded into the bitmask in the browser
+app.clientside_callback(
+    """
+    function(restyleData, visibility) {
+        if (!restyleData || !visibility || !("visible" in restyleData[0])) {
+            return window.dash_clientside.no_update;
+        }
+        const values = restyleData[0].visible;
+        const traces = restyleData[1] || Array.from({length: visibility.traces}, (_, i) => i);
+        let hidden = visibility.hidden;
+        traces.forEach((trace, i) => {
+            const value = Array.isArray(values) ? values[i % values.length] : values;
+            hidden = value === true ? hidden & ~(1 << trace) : hidden | (1 << trace);
+        });
+        return {traces: visibility.traces, hidden: hidden};
+    }
+    """,
+    Output("trace-visibility-store", "data", allow_duplicate=True),
+    Input("pr-graph", "restyleData"),
+    State("trace-visibility-store", "data"),
+    prevent_initial_call=True,
+)
+
+
+# the view-only inputs are applied in the browser to the figure on screen: the
+# week range sets xaxis.range (no slider value: the whole season, as in
+# date_range_slider_set), the rank presets the yaxis, the marker toggle each
+# trace's mode. Nothing is sent to the server.
+app.clientside_callback(
+    """
+    function(slider, rankRadio, dotCheck, sliderMax, figure, visibility) {
+        if (!figure || !figure.layout) {
+            return window.dash_clientside.no_update;
+        }
+        const changed = window.dash_clientside.callback_context.triggered.map(t => t.prop_id.split(".")[0]);
+        const layout = Object.assign({}, figure.layout);
+        let data = figure.data;
+
+        if (changed.includes("date-range-slider-wk")) {
+            const range = Array.isArray(slider) && slider.length === 2 ? slider : [0.85, sliderMax + 0.15];
+            layout.xaxis = Object.assign({}, layout.xaxis, {range: range});
+        }
+        if (changed.includes("rank-radio")) {
+            const preset = CHART_YRANGES[rankRadio];
+            layout.yaxis = Object.assign({}, layout.yaxis, {range: preset.yrange, dtick: preset.dtick, tickvals: preset.tickvals});
+        }
+        if (changed.includes("dot-check")) {
+            const show = Array.isArray(dotCheck) && dotCheck.length === 1 && dotCheck[0] === "show";
+            data = data.map(trace => show
+                ? Object.assign({}, trace, {mode: "lines+markers", marker: Object.assign({}, trace.marker, {size: 6})})
+                : Object.assign({}, trace, {mode: "lines"}));
+        }
+        if (visibility && visibility.traces === data.length) {
+            // the figure prop doesn't follow legend clicks: keep the traces hidden there
+            data = data.map((trace, i) => Object.assign({}, trace, {visible: visibility.hidden >> i & 1 ? "legendonly" : true}));
+        }
+        return Object.assign({}, figure, {layout: layout, data: data});
+    }
+    """.replace("CHART_YRANGES", json.dumps(CHART_YRANGES)),
+    Output("pr-graph", "figure", allow_duplicate=True),
+    Input("date-range-slider-wk", "value"),
+    Input("rank-radio", "value"),
+    Input("dot-check", "value"),
+    State("date-range-slider-wk", "max"),
+    State("pr-graph", "figure"),
+    State("trace-visibility-store", "data"),
+    prevent_initial_call=True,
+)
+
+
+def warm(snapshot_path=frame_cache.SNAPSHOT_FILE):
+    """Load the data before the first request (gunicorn.conf.py runs this once, before forking the workers)."""
+    if snapshot_path and frame_cache.load_snapshot(snapshot_path):
+        print(f"Loaded data snapshot '{snapshot_path}'")
+    for season in get_seasons():
+        season_matrix(season)
+    get_max_pr_date()
 
 
 if __name__ == "__main__":
-    app.run_server(debug=True, dev_tools_hot_reload=False)
+    if "--write-snapshot" in sys.argv:
+        # deploy step: fetch everything once so the server's cold start is one local file read
+        warm(snapshot_path=None)
+        frame_cache.write_snapshot(frame_cache.SNAPSHOT_FILE)
+    else:
+        app.run_server(debug=True, dev_tools_hot_reload=False)
@@ -0,0 +1,18 @@
+# gunicorn.conf.py
+
+# Picked up automatically when gunicorn is started from this folder
+# (`gunicorn app:server`). The app is imported once in the master process,
+# which reads no data; `warm()` then loads it there (from the deploy-time
+# snapshot when `python app.py --write-snapshot` has been run) before the
+# workers are forked, so every worker starts warm and shares those pages.
+import importlib
+
+preload_app = True
+
+
+def when_ready(server):
+    """Warm the preloaded app module before the workers are forked."""
+    module_name = (getattr(server.app, "app_uri", None) or server.cfg.wsgi_app).split(":")[0]
+    module = importlib.import_module(module_name)
+    if hasattr(module, "warm"):
+        module.warm()
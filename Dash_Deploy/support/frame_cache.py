@@ -0,0 +1,157 @@
+# frame_cache.py
+
+# In-memory cache of the parsed frames the apps read from GitHub (and from
+# their local fallback files). Each source is downloaded and parsed once; after
+# TTL_SECONDS it is revalidated with If-None-Match, so an unchanged file costs
+# a 304 and no parse. Revalidation runs on a background thread: a callback
+# always gets the frame already in memory and only the very first load of a
+# source blocks. A failed load is remembered for the TTL as well, so an
+# unreachable GitHub doesn't cost a timeout per callback. Local files are
+# re-read only when their mtime/size change. A source's parse function gets a
+# path (local) or a binary file object (URL), and may return any object.
+#
+# `write_snapshot` saves every loaded frame (with its ETag) to one file at
+# deploy time; `load_snapshot` seeds the cache from it at startup, so a cold
+# start is one local read instead of a round trip per source, and the first
+# revalidation a TTL later is a cheap 304.
+#
+# Frames returned here are shared between callbacks: never modify them in place.
+import json
+import os
+import pickle
+import threading
+import time
+from io import BytesIO
+
+import pandas as pd
+import requests
+
+# seconds before a source is checked for changes (RANKINGS_CACHE_TTL overrides)
+TTL_SECONDS = float(os.environ.get("RANKINGS_CACHE_TTL", 600))
+
+LOAD_ERRORS = (OSError, requests.RequestException, pd.errors.ParserError, json.JSONDecodeError)
+
+# written at deploy time (`python app.py --write-snapshot`), read by the apps' warm()
+SNAPSHOT_FILE = os.path.join(os.path.dirname(__file__), "data", "warm_snapshot.pkl")
+
+
+def is_remote(source):
+    return source.startswith(("http://", "https://"))
+
+
+class CachedFrame:
+    """One source (URL or file path) parsed into a frame and kept in memory."""
+
+    def __init__(self, source, parse, ttl=None, timeout=5):
+        self.source = source
+        self.parse = parse
+        self.ttl = TTL_SECONDS if ttl is None else ttl
+        self.timeout = timeout
+        self.frame = None
+        self.error = None
+        self.validator = None  # ETag of a URL, (mtime, size) of a file
+        self.checked_at = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def get(self):
+        """The cached frame (raises the last load error if there is none; parse may return None)."""
+        if self.checked_at is None:
+            with self._lock:  # first caller loads, concurrent ones wait for it
+                if self.checked_at is None:
+                    self.refresh()
+        elif time.monotonic() - self.checked_at >= self.ttl:
+            if is_remote(self.source):
+                self._refresh_in_background()
+            else:
+                self.refresh()  # a stat, unless the file changed
+        if self.frame is None and self.error is not None:
+            raise self.error
+        return self.frame
+
+    def refresh(self):
+        """Revalidate the source and re-parse it if it changed; keep serving the old frame on failure."""
+        try:
+            if is_remote(self.source):
+                self._refresh_remote()
+            else:
+                self._refresh_local()
+            self.error = None
+        except LOAD_ERRORS as e:
+            self.error = e
+            if self.frame is not None:
+                print(f"Could not revalidate {self.source}: {e}. Keeping the cached copy.")
+        self.checked_at = time.monotonic()
+
+    def _refresh_remote(self):
+        headers = {"If-None-Match": self.validator} if self.frame is not None and self.validator else {}
+        response = requests.get(self.source, headers=headers, timeout=self.timeout)
+        if response.status_code == 304:
+            return
+        response.raise_for_status()
+        self.frame = self.parse(BytesIO(response.content))  # bytes: CSV, JSON or Parquet
+        self.validator = response.headers.get("ETag")
+
+    def _refresh_local(self):
+        stat = os.stat(self.source)
+        validator = (stat.st_mtime_ns, stat.st_size)
+        if self.frame is not None and validator == self.validator:
+            return
+        self.frame = self.parse(self.source)
+        self.validator = validator
+
+    def _refresh_in_background(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, daemon=True).start()
+
+    def _background_refresh(self):
+        try:
+            self.refresh()
+        finally:
+            self._refreshing = False
+
+
+_frames = {}
+_frames_lock = threading.Lock()
+
+
+def get_frame(source, parse, ttl=None, key=None):
+    """The shared CachedFrame for a source (created on first use; key tells apart several frames parsed from one source)."""
+    with _frames_lock:
+        if (source, key) not in _frames:
+            _frames[(source, key)] = CachedFrame(source, parse, ttl)
+        entry = _frames[(source, key)]
+        if entry.parse is None:  # seeded from a snapshot
+            entry.parse = parse
+        return entry
+
+
+def read_frame(source, parse, ttl=None, key=None):
+    """Parsed frame of a URL or file, from memory when it is fresh (see CachedFrame.get)."""
+    return get_frame(source, parse, ttl, key).get()
+
+
+def write_snapshot(path):
+    """Save every loaded frame and its validator to one file (atomically: temp file + rename)."""
+    entries = {k: (entry.frame, entry.validator) for k, entry in _frames.items() if entry.frame is not None}
+    with open(path + ".tmp", "wb") as snapshot_file:
+        pickle.dump(entries, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(path + ".tmp", path)
+    print(f"Wrote {len(entries)} cached frames to '{path}'")
+
+
+def load_snapshot(path):
+    """Seed the cache from a snapshot; each frame counts as just checked. False if there is no snapshot."""
+    try:
+        with open(path, "rb") as snapshot_file:
+            entries = pickle.load(snapshot_file)
+    except FileNotFoundError:
+        return False
+    for (source, key), (frame, validator) in entries.items():
+        entry = get_frame(source, None, key=key)
+        if entry.frame is None:
+            entry.frame, entry.validator, entry.checked_at = frame, validator, time.monotonic()
+    return True
@@ -2,16 +2,22 @@
 
 # DONE: modules
 import os
+from functools import lru_cache
 import pandas as pd
 
 # DONE: import 'NBA_Teams.csv' file
 base_dir = os.path.dirname(__file__)  # Gets the directory of the current script
 csv_path = os.path.join(base_dir, "data", "nba_teams_data.csv")
-df = pd.read_csv(csv_path)
+
+@lru_cache(maxsize=None)
+def read_teams():
+    """ Teams reference, read on first use (not at import). """
+    return pd.read_csv(csv_path)
 
 # define find_team() method for agnostic search term
 def find_team(query, property_name='teamname') -> str:
     """ Return desired property_name for teamname query in almost any form. """
+    df = read_teams()
     query = query.lower()
     matching_teams = df[(df['aliases'].str.contains(query, case=False)) | 
                         (df['teamname'].str.contains(query, case=False)) |
@@ -23,6 +29,7 @@ def find_team(query, property_name='teamname') -> str:
 
 def find_team_colors(team_qry: str, color_rank=1):
     """ Match team input to team color scheme. """
+    df = read_teams()
     matching_team = find_team(team_qry, 'teamname')
 
     if matching_team:
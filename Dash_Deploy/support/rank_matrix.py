@@ -0,0 +1,86 @@
+# rank_matrix.py
+
+# A season's rankings aggregated once into team x week NumPy matrices (sum,
+# count, min and max of the ranks, and the mean from them), with sorted team
+# and week indexes. The apps keep one per season and rebuild it only when the
+# rankings change, so a callback slices rows (teams) and a column range
+# (weeks) instead of grouping and pivoting the long-form frame again.
+import numpy as np
+import pandas as pd
+
+
+class RankMatrix:
+    """Mean/count/min/max rank of each team (rows) in each NBA week (columns)."""
+
+    def __init__(self, teams, weeks, sundays, total, count, low, high):
+        self.teams = teams  # sorted team names
+        self.weeks = weeks  # sorted week numbers
+        self.sundays = sundays  # Sunday of each week
+        self.count = count
+        self.low = low
+        self.high = high
+        self.mean = np.full(count.shape, np.nan)
+        np.divide(total, count, out=self.mean, where=count > 0)
+
+    @classmethod
+    def from_rankings(cls, df: pd.DataFrame):
+        """Aggregate ranking rows with teamname, nba_week, sunday and ranking columns."""
+        team_codes, teams = pd.factorize(df["teamname"].astype(str), sort=True)
+        week_codes, weeks = pd.factorize(df["nba_week"].astype(int), sort=True)
+        cells = (team_codes, week_codes)
+        shape = (len(teams), len(weeks))
+        ranking = df["ranking"].to_numpy(dtype=float)
+
+        total = np.zeros(shape)
+        np.add.at(total, cells, ranking)
+        count = np.zeros(shape, dtype=np.int32)
+        np.add.at(count, cells, 1)
+        low = np.full(shape, np.inf)
+        np.minimum.at(low, cells, ranking)
+        high = np.full(shape, -np.inf)
+        np.maximum.at(high, cells, ranking)
+        low[count == 0] = np.nan
+        high[count == 0] = np.nan
+
+        sundays = pd.to_datetime(df["sunday"]).groupby(week_codes).first().to_numpy()
+        return cls(teams.to_numpy(), weeks.to_numpy(), sundays, total, count, low, high)
+
+    @property
+    def last_week(self):
+        return self.weeks[-1] if len(self.weeks) else None
+
+    def select(self, teamnames=None, first_week=None, last_week=None):
+        """(row, column) indexes of the teams and weeks in range that have at least one ranking."""
+        lo = 0 if first_week is None else np.searchsorted(self.weeks, first_week, side="left")
+        hi = len(self.weeks) if last_week is None else np.searchsorted(self.weeks, last_week, side="right")
+        cols = np.arange(lo, hi)
+        if teamnames is None:
+            rows = np.arange(len(self.teams))
+        else:
+            rows = np.flatnonzero(np.isin(self.teams, list(teamnames)))
+
+        ranked = self.count[np.ix_(rows, cols)] > 0
+        return rows[ranked.any(axis=1)], cols[ranked.any(axis=0)]
+
+    def pivot(self, teamnames=None, first_week=None, last_week=None):
+        """Mean rank per team and week, rounded to 2 places (what `create_rk_pt()` returns)."""
+        rows, cols = self.select(teamnames, first_week, last_week)
+        return pd.DataFrame(
+            self.mean[np.ix_(rows, cols)].round(2),
+            index=pd.Index(self.teams[rows], name="teamname"),
+            columns=pd.Index(self.weeks[cols], name="nba_week"),
+        )
+
+    def summary(self, teamnames=None, first_week=None, last_week=None):
+        """One row per ranked team and week with mean/min/max rank (what `df_hi_los()` returns)."""
+        rows, cols = self.select(teamnames, first_week, last_week)
+        r, c = np.nonzero(self.count[np.ix_(rows, cols)])
+        r, c = rows[r], cols[c]
+        return pd.DataFrame({
+            "teamname": self.teams[r],
+            "nba_week": self.weeks[c],
+            "sunday": self.sundays[c],
+            "ranking_mean": self.mean[r, c],
+            "ranking_min": self.low[r, c].astype(int),
+            "ranking_max": self.high[r, c].astype(int),
+        })
@@ -0,0 +1,122 @@
+# rankings_db.py
+
+# Read side of the optional SQLite rankings database (built by
+# `Modules/rankings_db.py`). Team, week, date and source filters run as indexed
+# queries, so a callback reads only the slice it shows instead of the whole
+# history. The schema is the writer's (checked by `tests/test_module_drift.py`).
+import os
+import sqlite3
+
+import pandas as pd
+
+base_dir = os.path.dirname(__file__)
+DB_FILE = os.path.join(base_dir, "data", "rankings.sqlite3")
+
+RANKING_COLUMNS = """
+    r.entryname, s.source, r.author, r.date, r.url, t.teamname, r.ranking, r.sunday, r.nba_week
+"""
+
+FROM_RANKINGS = """
+    FROM rankings r
+    JOIN sources s ON s.source_id = r.source_id
+    JOIN teams t ON t.team_id = r.team_id
+"""
+
+
+def available(path=DB_FILE):
+    """Check whether the optional database has been built."""
+    return os.path.isfile(path)
+
+
+def version(path=DB_FILE):
+    """Changes whenever the database is rebuilt or appended to."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def connect(path=DB_FILE):
+    """Open the database read-only (one connection per call; callbacks run on many threads)."""
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+
+def iso_day(value):
+    """'YYYY-MM-DD' for a date, datetime, or date string."""
+    return pd.Timestamp(value).strftime("%Y-%m-%d")
+
+
+def build_filters(conn, start=None, end=None, teamnames=None, sources=None, weeks_only=False):
+    """WHERE clause and parameters for the given filters.
+
+    Teams are always given as an id list (all teams when not filtering) so the
+    (team_id, sunday) index serves the date range.
+    """
+    clauses, params = [], []
+
+    if teamnames is None:
+        team_ids = [row[0] for row in conn.execute("SELECT team_id FROM teams")]
+    else:
+        marks = ",".join("?" * len(teamnames))
+        team_ids = [row[0] for row in conn.execute(
+            f"SELECT team_id FROM teams WHERE teamname IN ({marks})", list(teamnames))]
+    clauses.append(f"r.team_id IN ({','.join('?' * len(team_ids))})" if team_ids else "0")
+    params.extend(team_ids)
+
+    if sources is not None:
+        marks = ",".join("?" * len(sources))
+        clauses.append(f"r.source_id IN (SELECT source_id FROM sources WHERE source IN ({marks}))")
+        params.extend(sources)
+
+    if weeks_only:
+        clauses.append("r.nba_week IS NOT NULL")
+
+    # Sundays bound the index range scan (week numbers restart every season);
+    # the date test keeps exact day boundaries
+    if start is not None:
+        start_day = pd.Timestamp(start)
+        clauses.append("r.sunday >= ?")
+        clauses.append("r.date >= ?")
+        params.extend([iso_day(start_day - pd.Timedelta(days=(start_day.weekday() + 1) % 7)), iso_day(start)])
+    if end is not None:
+        clauses.append("r.sunday <= ?")
+        clauses.append("r.date <= ?")
+        params.extend([iso_day(end), iso_day(end)])
+
+    return " AND ".join(clauses), params
+
+
+def read_rankings(start=None, end=None, teamnames=None, sources=None, path=DB_FILE):
+    """Ranking rows (with sunday and nba_week) matching the filters, like `create_and_merge_rank_week()`."""
+    conn = connect(path)
+    try:
+        where, params = build_filters(conn, start, end, teamnames, sources)
+        df = pd.read_sql_query(f"SELECT {RANKING_COLUMNS} {FROM_RANKINGS} WHERE {where}", conn, params=params)
+    finally:
+        conn.close()
+
+    df["date"] = pd.to_datetime(df["date"])
+    df["sunday"] = pd.to_datetime(df["sunday"])
+    return df
+
+
+def team_week_summary(start=None, end=None, teamnames=None, path=DB_FILE):
+    """Mean/min/max rank per team and week, aggregated in SQLite (the `df_hi_los()` frame)."""
+    conn = connect(path)
+    try:
+        where, params = build_filters(conn, start, end, teamnames, weeks_only=True)
+        df = pd.read_sql_query(
+            f"""
+            SELECT t.teamname, r.nba_week, r.sunday,
+                   AVG(r.ranking) AS ranking_mean, MIN(r.ranking) AS ranking_min, MAX(r.ranking) AS ranking_max
+            {FROM_RANKINGS}
+            WHERE {where}
+            GROUP BY t.teamname, r.nba_week, r.sunday
+            ORDER BY t.teamname, r.nba_week, r.sunday
+            """,
+            conn,
+            params=params,
+        )
+    finally:
+        conn.close()
+
+    df["sunday"] = pd.to_datetime(df["sunday"])
+    return df
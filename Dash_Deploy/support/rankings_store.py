@@ -0,0 +1,111 @@
+# rankings_store.py
+
+# Read side of the partitioned rankings store written by the scraper
+# (`Modules/rankings_store.py`): the manifest says which Parquet files hold
+# which season/source/week, so only the files a view needs are opened. The
+# manifest is revalidated like any other cached source (see `frame_cache`);
+# part files are never rewritten, so each is fetched once and kept. A season's
+# frame is rebuilt only when the manifest lists different files. The layout
+# must match the writer's (checked by `tests/test_module_drift.py`).
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+import support.frame_cache as frame_cache
+
+base_dir = os.path.dirname(__file__)
+STORE_DIR = os.path.join(base_dir, "data", "rankings_store")
+GITHUB_STORE_URL = "https://raw.githubusercontent.com/keegangm/nba-power-rankings/main/Dash_Deploy/support/data/rankings_store"
+MANIFEST_FILE = "manifest.json"
+
+# part files are immutable: once loaded they never need revalidating
+PART_TTL = float("inf")
+
+
+def store_source(relative, location=STORE_DIR):
+    """URL or path of the manifest or of one part file."""
+    if frame_cache.is_remote(location):
+        return f"{location}/{relative}"
+    return os.path.join(location, *relative.split("/"))
+
+
+def parse_manifest(source):
+    if isinstance(source, str):
+        with open(source, "r") as manifest_file:
+            return json.load(manifest_file)
+    return json.load(source)
+
+
+def parse_part(source):
+    import pyarrow.parquet as pq
+
+    return pq.read_table(source)
+
+
+def read_manifest(location=STORE_DIR):
+    """The store manifest (cached; raises one of frame_cache.LOAD_ERRORS if there is no store there)."""
+    return frame_cache.read_frame(store_source(MANIFEST_FILE, location), parse_manifest)
+
+
+def list_seasons(location=STORE_DIR):
+    """Seasons with partitions in the local store, oldest first (empty if there is no store)."""
+    if not os.path.isfile(store_source(MANIFEST_FILE, location)):
+        return []
+    return sorted({part["season"] for part in read_manifest(location)["partitions"]})
+
+
+def select_partitions(manifest, seasons=None, sources=None, start=None, end=None):
+    """Manifest entries matching seasons/sources whose dates overlap [start, end] (ISO date strings)."""
+    selected = []
+    for part in manifest["partitions"]:
+        if seasons is not None and part["season"] not in seasons:
+            continue
+        if sources is not None and part["source"] not in sources:
+            continue
+        if start is not None and part["max_date"] < start:
+            continue
+        if end is not None and part["min_date"] > end:
+            continue
+        selected.append(part)
+    return selected
+
+
+def read_parts(parts, location=STORE_DIR):
+    """Arrow tables of the given manifest entries (parts not loaded yet are fetched in parallel)."""
+    sources = [store_source(part["path"], location) for part in parts]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        return list(pool.map(lambda source: frame_cache.read_frame(source, parse_part, ttl=PART_TTL), sources))
+
+
+def to_frame(tables):
+    """One frame of rankings: categorical strings, datetime dates, int8 ranks (entryname left out)."""
+    import pyarrow as pa
+
+    rk = pa.concat_tables(tables).to_pandas(strings_to_categorical=True, date_as_object=False)
+    rk["date"] = rk["date"].astype("datetime64[ns]")
+    return rk[["source", "author", "date", "url", "teamname", "ranking"]]
+
+
+# (season, location) -> (part tables, joined frame)
+_seasons = {}
+
+
+def read_season(season, location=STORE_DIR):
+    """A season's rankings from only its partitions; None if the store has none for it.
+
+    Raises one of frame_cache.LOAD_ERRORS if the store can't be read there.
+    """
+    parts = select_partitions(read_manifest(location), seasons=[season])
+    if not parts:
+        return None
+    tables = read_parts(parts, location)
+
+    # concatenate again only when the manifest listed other files
+    cached = _seasons.get((season, location))
+    if cached is not None and len(cached[0]) == len(tables) and all(a is b for a, b in zip(cached[0], tables)):
+        return cached[1]
+    rk = to_frame(tables)
+    _seasons[(season, location)] = (tables, rk)
+    return rk
@@ -0,0 +1,90 @@
+# rankings_tables.py
+
+# Read side of the normalized rankings tables (built by
+# `Modules/rankings_tables.py`). Articles are read once per ranking set and
+# joined onto the integer ranks table, so the frame the apps work with has
+# categorical source/author/teamname columns and int8 team/rank columns instead
+# of a Python string per cell. Articles and ranks are stored per season; only
+# the requested season's pair is read. Tables are parsed once and kept in memory
+# (see `frame_cache`), and so is each season's joined frame. The layout must
+# match the writer's (checked by `tests/test_module_drift.py`).
+import os
+
+import pandas as pd
+
+import support.frame_cache as frame_cache
+
+base_dir = os.path.dirname(__file__)
+TABLES_DIR = os.path.join(base_dir, "data", "rankings_tables")
+GITHUB_TABLES_URL = "https://raw.githubusercontent.com/keegangm/nba-power-rankings/main/Dash_Deploy/support/data/rankings_tables"
+
+
+def table_source(name, location=TABLES_DIR, season=None):
+    """URL or path of teams.csv or one season's table."""
+    relative = f"{name}.csv" if season is None else f"season={season}/{name}.csv"
+    if frame_cache.is_remote(location):
+        return f"{location}/{relative}"
+    return os.path.join(location, *relative.split("/"))
+
+
+def list_seasons(location=TABLES_DIR):
+    """Seasons with local tables, oldest first."""
+    try:
+        return sorted(name.split("=", 1)[1] for name in os.listdir(location) if name.startswith("season="))
+    except FileNotFoundError:
+        return []
+
+
+def parse_articles(source):
+    return pd.read_csv(
+        source,
+        dtype={"article_id": "int32", "source": "category", "author": "category", "url": "category", "date": str},
+    ).assign(date=lambda df: pd.to_datetime(df["date"], format="%y%m%d"))
+
+
+def parse_teams(source):
+    return pd.read_csv(source, dtype={"team_id": "int8"})
+
+
+def parse_ranks(source):
+    return pd.read_csv(source, dtype={"article_id": "int32", "team_id": "int8", "ranking": "int8"})
+
+
+def read_articles(season, location=TABLES_DIR):
+    """One row per ranking set: article_id (int32), source/author/url (category), date."""
+    return frame_cache.read_frame(table_source("articles", location, season), parse_articles)
+
+
+def read_teams(location=TABLES_DIR):
+    """team_id (int8) -> teamname."""
+    return frame_cache.read_frame(table_source("teams", location), parse_teams)
+
+
+def read_ranks(season, location=TABLES_DIR):
+    """One row per team per ranking set, as three small integers."""
+    return frame_cache.read_frame(table_source("ranks", location, season), parse_ranks)
+
+
+# (season, location) -> (articles, teams, ranks, joined frame)
+_joined = {}
+
+
+def read_rankings(season, location=TABLES_DIR):
+    """A season's ranks joined to their article and team: source, author, date, url, teamname, ranking (entryname left out)."""
+    articles = read_articles(season, location)
+    teams = read_teams(location)
+    ranks = read_ranks(season, location)
+
+    # rejoin only when the cache handed back a reloaded table
+    cached = _joined.get((season, location))
+    if cached is not None and all(a is b for a, b in zip(cached, (articles, teams, ranks))):
+        return cached[3]
+
+    rk = ranks.join(articles.set_index("article_id"), on="article_id")
+    teamnames = pd.Series(teams["teamname"].values, index=teams["team_id"]).sort_index()
+    rk["teamname"] = pd.Categorical.from_codes(
+        teamnames.index.get_indexer(rk["team_id"]), categories=teamnames.values
+    )
+    rk = rk[["source", "author", "date", "url", "teamname", "ranking", "article_id", "team_id"]]
+    _joined[(season, location)] = (articles, teams, ranks, rk)
+    return rk
@@ -0,0 +1,143 @@
+# seasons.py
+
+# Season calendars for the apps, generated from `data/nba_seasons_ref.csv`
+# (one row per season: opening night and last day of the regular season).
+# Weeks start on Sundays and are numbered from the Sunday on or before opening
+# night (week 1); a season's calendar runs from the rollover date (rankings
+# published after the Finals count toward the next season) to the day before
+# the next one. Mirrors `Modules/seasons.py` on the scraper side
+# (`tests/test_module_drift.py` fails if the two disagree).
+#
+# Each season's calendar is a WeekCalendar built once (`get_calendar`): week
+# number <-> Sunday lookups are arithmetic on its week 1, for one value or a
+# whole array at a time, so callbacks never go back to the reference file.
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+base_dir = os.path.dirname(__file__)
+SEASONS_CSV = os.path.join(base_dir, "data", "nba_seasons_ref.csv")
+
+# rankings published after the Finals count toward the next season
+SEASON_ROLLOVER = (6, 20)
+
+
+def most_recent_sunday(day):
+    """Sunday on or before a date."""
+    day = pd.Timestamp(day).normalize()
+    return day - pd.Timedelta(days=(day.weekday() + 1) % 7)
+
+
+@lru_cache(maxsize=None)
+def read_seasons(path=SEASONS_CSV):
+    """Season reference with week_one (Sunday of week 1), first_sunday and last_sunday of each calendar."""
+    df = pd.read_csv(path, parse_dates=["opening_night", "regular_season_end"]).set_index("season")
+    df["week_one"] = df["opening_night"].map(most_recent_sunday)
+    rollovers = [pd.Timestamp(int(season[:4]), *SEASON_ROLLOVER) for season in df.index]
+    # first Sunday on or after this season's rollover, last Sunday before the next one's
+    df["first_sunday"] = [most_recent_sunday(day + pd.Timedelta(days=6)) for day in rollovers]
+    df["last_sunday"] = [most_recent_sunday(day + pd.DateOffset(years=1) - pd.Timedelta(days=1)) for day in rollovers]
+    return df
+
+
+def epoch_days(days):
+    """Dates as integer days since 1970-01-01 (a Thursday)."""
+    days = np.asarray(days)
+    if not np.issubdtype(days.dtype, np.datetime64):
+        days = np.asarray(pd.to_datetime(days), dtype="datetime64[ns]")
+    return days.astype("datetime64[D]").astype(np.int64)
+
+
+class WeekCalendar:
+    """One season's weeks: NBA week number <-> Sunday, for scalars and arrays."""
+
+    def __init__(self, season, week_one, first_sunday, last_sunday, regular_season_end):
+        self.season = season
+        self.week_one = week_one  # Sunday of week 1
+        self.first_sunday = first_sunday
+        self.last_sunday = last_sunday
+        self.regular_season_end = regular_season_end
+        self._week_one_day = int(epoch_days([week_one])[0])
+
+    def week_of(self, day):
+        """NBA week of a date, counted from this season's week 1."""
+        return (most_recent_sunday(day) - self.week_one).days // 7 + 1
+
+    def sunday_of(self, week):
+        """Sunday starting an NBA week."""
+        return self.week_one + pd.Timedelta(weeks=int(week) - 1)
+
+    def weeks_of(self, days):
+        """NBA week of each date (int array)."""
+        days = epoch_days(days)
+        sundays = days - (days + 4) % 7
+        return (sundays - self._week_one_day) // 7 + 1
+
+    def sundays_of(self, weeks):
+        """Sunday starting each NBA week (DatetimeIndex)."""
+        weeks = np.asarray(weeks, dtype=np.int64)
+        return pd.DatetimeIndex((self._week_one_day + 7 * (weeks - 1)).astype("datetime64[D]"))
+
+    def bounds(self):
+        """(first day, last day) of the calendar."""
+        return self.first_sunday, self.last_sunday + pd.Timedelta(days=6)
+
+    def weeks(self):
+        """Every week of the calendar as a new frame of sunday and nba_week."""
+        sundays = pd.date_range(self.first_sunday, self.last_sunday, freq="7D")
+        return pd.DataFrame({"sunday": sundays, "nba_week": self.weeks_of(sundays)})
+
+
+@lru_cache(maxsize=None)
+def get_calendar(season):
+    """The shared WeekCalendar of a season (KeyError if it isn't in the reference file)."""
+    row = read_seasons().loc[season]
+    return WeekCalendar(season, row["week_one"], row["first_sunday"], row["last_sunday"], row["regular_season_end"])
+
+
+def season_of(day):
+    """Season label for a date, e.g. 2024-11-04 -> '2024-25'."""
+    day = pd.Timestamp(day)
+    start_year = day.year if (day.month, day.day) >= SEASON_ROLLOVER else day.year - 1
+    return f"{start_year}-{(start_year + 1) % 100:02d}"
+
+
+def season_bounds(season):
+    """(first day, last day) of a season's calendar."""
+    return get_calendar(season).bounds()
+
+
+def week_one_sunday(season):
+    return get_calendar(season).week_one
+
+
+def regular_season_end(season):
+    return get_calendar(season).regular_season_end
+
+
+def nba_week(day, season=None):
+    """NBA week number of a date within its season, or counted from another season's week 1 (None if the season isn't in the reference file)."""
+    try:
+        calendar = get_calendar(season or season_of(day))
+    except KeyError:
+        return None
+    return calendar.week_of(day)
+
+
+def sunday_of_week(week, season):
+    """Sunday starting a season's NBA week."""
+    return get_calendar(season).sunday_of(week)
+
+
+def season_weeks(season):
+    """Every week of a season's calendar as a frame of sunday and nba_week (like the old nba_weeks_ref.csv)."""
+    return get_calendar(season).weeks()
+
+
+def started_seasons(today=None):
+    """Seasons in the reference file whose calendar has begun, oldest first."""
+    today = pd.Timestamp.today() if today is None else pd.Timestamp(today)
+    seasons = read_seasons()
+    return list(seasons.index[seasons["first_sunday"] <= today])
@@ -0,0 +1,55 @@
+# week_buckets.py
+
+# Date -> (Sunday, NBA week) bucketing for a whole column in one pass. The
+# Sunday of each date is datetime64 day arithmetic; its week number is either
+# arithmetic on one season's week 1 or a binary search (searchsorted) in the
+# Sunday -> week table of every calendar in the reference file. Dates whose
+# Sunday isn't in the calendar get no week (NaN), like the left merge with
+# the weeks table this replaces.
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+import support.seasons as seasons
+
+
+def sundays(dates):
+    """Sunday on or before each date (datetime64[ns] array)."""
+    days = seasons.epoch_days(dates)
+    return (days - (days + 4) % 7).astype("datetime64[D]").astype("datetime64[ns]")
+
+
+@lru_cache(maxsize=None)
+def week_table():
+    """(Sundays as epoch days, their NBA weeks) over every season's calendar, sorted."""
+    weeks = pd.concat([seasons.season_weeks(season) for season in seasons.read_seasons().index])
+    weeks = weeks.sort_values("sunday")
+    return seasons.epoch_days(weeks["sunday"]), weeks["nba_week"].to_numpy()
+
+
+def with_missing(weeks, found):
+    """Int weeks, or float with NaN where a Sunday had no week."""
+    if found.all():
+        return weeks.astype(np.int64)
+    return np.where(found, weeks, np.nan)
+
+
+def nba_weeks(dates, season=None):
+    """NBA week of each date: within the given season's calendar, or within whichever calendar has its Sunday."""
+    week_sundays = sundays(dates)
+    days = seasons.epoch_days(week_sundays)
+    if season is not None:
+        calendar = seasons.get_calendar(season)
+        first, last = seasons.epoch_days([calendar.first_sunday, calendar.last_sunday])
+        return with_missing(calendar.weeks_of(week_sundays), (days >= first) & (days <= last))
+
+    table_days, table_weeks = week_table()
+    positions = np.searchsorted(table_days, days).clip(max=len(table_days) - 1)
+    return with_missing(table_weeks[positions], table_days[positions] == days)
+
+
+def add_weeks(df, date_column="date", season=None):
+    """Copy of df with sunday and nba_week columns for its dates."""
+    week_sundays = sundays(df[date_column])
+    return df.assign(sunday=week_sundays, nba_week=nba_weeks(week_sundays, season))
@@ -0,0 +1,96 @@
+# batch_commit.py
+
+# Unattended commits for the ingest pipeline: each article's rows are checked
+# (30 distinct teams, ranks 1-30 each used once, a parseable date, a known
+# source) in place of the human Y/N prompt. Whole files are replaced atomically
+# (temp file + rename); appends write only the new rows and fsync, and callers
+# record the size each append committed so a torn tail left by a crash is cut
+# off before the next one.
+import csv
+import io
+import os
+import shutil
+import sqlite3
+from datetime import datetime
+
+from Modules.sources import SOURCE_LABELS
+
+TEAM_COUNT = 30
+KNOWN_SOURCES = frozenset(SOURCE_LABELS.values())
+
+# failures writing the snapshot log or a read model; any of them fails the commit
+WRITE_ERRORS = (OSError, csv.Error, sqlite3.Error)
+
+
+def article_problems(rows):
+    """List what is wrong with one article's rows (empty if they can be committed)."""
+    problems = []
+
+    teamnames = {row['teamname'] for row in rows}
+    if len(rows) != TEAM_COUNT or len(teamnames) != TEAM_COUNT or None in teamnames:
+        problems.append(f"{len(rows)} rows for {len(teamnames - {None})} distinct teams (expected {TEAM_COUNT})")
+
+    try:
+        ranks = sorted(int(row['ranking']) for row in rows)
+    except (TypeError, ValueError):
+        problems.append("non-numeric rank")
+    else:
+        if ranks != list(range(1, TEAM_COUNT + 1)):
+            problems.append(f"ranks are not 1-{TEAM_COUNT} each used once")
+
+    dates = {row['date'] for row in rows}
+    if len(dates) != 1:
+        problems.append(f"{len(dates)} different dates")
+    for date in dates:
+        try:
+            datetime.strptime(str(date), '%y%m%d')
+        except ValueError:
+            problems.append(f"unparseable date {date!r}")
+
+    unknown = {row['source'] for row in rows} - KNOWN_SOURCES
+    if unknown:
+        problems.append(f"unknown source {', '.join(sorted(map(str, unknown)))}")
+
+    return problems
+
+
+def validate_rankings(rows):
+    """Split rows into those of valid articles and {url: problems} for the rest (grouped by article URL)."""
+    articles = {}
+    for row in rows:
+        articles.setdefault(row['url'], []).append(row)
+
+    valid, rejected = [], {}
+    for url, article_rows in articles.items():
+        problems = article_problems(article_rows)
+        if problems:
+            rejected[url] = problems
+        else:
+            valid.extend(article_rows)
+    return valid, rejected
+
+
+def truncate_to(path, committed_size):
+    """Cut off anything past committed_size (rows a crashed append wrote but never committed)."""
+    if committed_size is not None and os.path.getsize(path) > committed_size:
+        os.truncate(path, committed_size)
+
+
+def append_rows_atomic(csv_path, rows, fieldnames, committed_size=None):
+    """Append rows in one write + fsync after truncating to committed_size; return the new size to record as committed."""
+    truncate_to(csv_path, committed_size)
+
+    buffer = io.StringIO()
+    csv.DictWriter(buffer, fieldnames=fieldnames).writerows(rows)
+    with open(csv_path, 'a', newline='') as csvfile:
+        csvfile.write(buffer.getvalue())
+        csvfile.flush()
+        os.fsync(csvfile.fileno())
+    return os.path.getsize(csv_path)
+
+
+def copy_atomic(src_path, dest_path):
+    """Copy src_path to dest_path so dest_path is never seen half-written."""
+    tmp_path = dest_path + '.tmp'
+    shutil.copyfile(src_path, tmp_path)
+    os.replace(tmp_path, dest_path)
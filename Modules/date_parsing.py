@@ -0,0 +1,45 @@
+# date_parsing.py
+
+# Article dates -> 'YYMMDD' for entrynames. Each source plugin lists the
+# byline formats it publishes (`DATE_FORMATS`); those are tried with
+# `strptime` (whose compiled patterns Python caches per format) and only a
+# string none of them match goes to `dateparser`, imported on first use and
+# memoized per string.
+from datetime import datetime
+from functools import lru_cache
+
+FILE_DATE_FORMAT = '%y%m%d'
+
+# suffixes bylines tack on that no format needs to see
+_TIMEZONE_SUFFIXES = (' ET', ' EST', ' EDT')
+
+
+def clean_date_text(text):
+    """Collapse whitespace and drop a trailing US Eastern timezone label."""
+    text = ' '.join(str(text).split())
+    for suffix in _TIMEZONE_SUFFIXES:
+        if text.endswith(suffix):
+            return text[:-len(suffix)]
+    return text
+
+
+@lru_cache(maxsize=1024)
+def fallback_date(text):
+    """Parse a date string no known format matched, with dateparser (loaded lazily)."""
+    import dateparser
+
+    parsed = dateparser.parse(text)
+    if parsed is None:
+        raise ValueError(f"Unrecognized article date: {text!r}")
+    return parsed.strftime(FILE_DATE_FORMAT)
+
+
+def file_date(text, formats=()):
+    """Convert an article date string to 'YYMMDD', trying the source's known formats first."""
+    text = clean_date_text(text)
+    for date_format in formats:
+        try:
+            return datetime.strptime(text, date_format).strftime(FILE_DATE_FORMAT)
+        except ValueError:
+            continue
+    return fallback_date(text)
@@ -0,0 +1,97 @@
+# entry_index.py
+
+# Persistent set of every entryname already written to the weekly rankings
+# snapshot log, so duplicate checks are set lookups instead of rescans.
+# Entrynames live in a SQLite table (loaded into memory once); the `snapshot`
+# rows record which manifest version the index mirrors, so a change made
+# outside the scraper (e.g. a compaction run elsewhere) triggers a rebuild
+# instead of silently going stale.
+import os
+import sqlite3
+
+INDEX_FILE = 'Entry_Index.sqlite3'
+
+
+class EntryIndex:
+    """Entrynames present in the current weekly rankings snapshot, kept in step with each append."""
+
+    def __init__(self, path=INDEX_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        with self.conn:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS entries (entryname TEXT PRIMARY KEY) WITHOUT ROWID")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS snapshot (key TEXT PRIMARY KEY, value TEXT)")
+        self.entries = {row[0] for row in self.conn.execute("SELECT entryname FROM entries")}
+
+    def __contains__(self, entryname):
+        return entryname in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _snapshot(self):
+        return dict(self.conn.execute("SELECT key, value FROM snapshot"))
+
+    def _save_snapshot(self, log):
+        """Record which snapshot log version the index mirrors (call inside the write transaction)."""
+        self.conn.executemany("INSERT OR REPLACE INTO snapshot (key, value) VALUES (?, ?)", [
+            ('manifest', os.path.abspath(log.manifest_path)),
+            ('version', str(log.version)),
+        ])
+
+    def is_current(self, log):
+        """Check whether the index mirrors the snapshot log as it is now."""
+        snapshot = self._snapshot()
+        return (snapshot.get('manifest') == os.path.abspath(log.manifest_path)
+                and snapshot.get('version') == str(log.version))
+
+    def rebuild(self, log):
+        """Reload every entryname from the snapshot log (one full read)."""
+        entries = {row['entryname'] for row in log.iter_rows() if row.get('entryname')}
+
+        with self.conn:
+            self.conn.execute("DELETE FROM entries")
+            self.conn.executemany("INSERT INTO entries (entryname) VALUES (?)", ((e,) for e in entries))
+            self._save_snapshot(log)
+        self.entries = entries
+        print(f"Rebuilt entry index from '{log.manifest_path}' ({len(entries)} entries)")
+
+    def sync(self, log):
+        """Make the index mirror the snapshot log (a manifest version check unless it changed elsewhere)."""
+        if not self.is_current(log):
+            self.rebuild(log)
+
+    def new_rows(self, rows):
+        """Split rows into (new, duplicate): already indexed, or repeated earlier in rows, counts as duplicate."""
+        new, duplicates = [], []
+        seen = set()
+        for row in rows:
+            entryname = row['entryname']
+            if entryname in self.entries or entryname in seen:
+                duplicates.append(row)
+            else:
+                seen.add(entryname)
+                new.append(row)
+        return new, duplicates
+
+    def append(self, rows, log, day, fieldnames):
+        """Append rows to the log's delta for day and index their entrynames in one transaction (rolled back if the write fails)."""
+        with self.conn:
+            self.conn.executemany("INSERT INTO entries (entryname) VALUES (?)", ((row['entryname'],) for row in rows))
+            log.append(rows, day, fieldnames)
+            self._save_snapshot(log)
+        self.entries.update(row['entryname'] for row in rows)
+
+    def close(self):
+        self.conn.close()
+
+
+_index = None
+
+
+def get_index(path=INDEX_FILE):
+    """Get the shared EntryIndex, opening it on first use."""
+    global _index
+    if _index is None:
+        _index = EntryIndex(path)
+    return _index
@@ -0,0 +1,54 @@
+# extract.py
+
+# Targeted extraction: lxml parses the page in C, XPath picks out only the
+# elements a source's parsers read, and BeautifulSoup builds a tree from just
+# those fragments (instead of materializing every node of the article page).
+from bs4 import BeautifulSoup
+import lxml.etree
+import lxml.html
+
+# XPaths -> compiled union XPath; a union returns matches in document order
+_compiled = {}
+
+
+def compiled_xpath(xpaths):
+    """Get the compiled union of xpaths (None if there are none)."""
+    key = tuple(xpaths or ())
+    if key not in _compiled:
+        _compiled[key] = lxml.etree.XPath(' | '.join(key)) if key else None
+    return _compiled[key]
+
+
+def select_fragments(content, xpaths):
+    """Return serialized HTML for the elements matching xpaths, in document order."""
+    xpath = compiled_xpath(xpaths)
+    root = lxml.html.document_fromstring(content)
+    nodes = xpath(root)
+
+    # skip nodes already inside a selected ancestor; that subtree carries them
+    selected = set(nodes)
+    fragments = []
+    for node in nodes:
+        if any(ancestor in selected for ancestor in node.iterancestors()):
+            continue
+        fragments.append(lxml.html.tostring(node, encoding='unicode', with_tail=False))
+    return fragments
+
+
+def targeted_soup(content, xpaths):
+    """Parse only the parts of the page a source's parsers use (its plugin's `XPATHS`)."""
+    if compiled_xpath(xpaths) is None or not content:
+        return BeautifulSoup(content, "lxml")
+    return BeautifulSoup(''.join(select_fragments(content, xpaths)), "lxml")
+
+
+def page_links(content, base_url):
+    """Return (absolute URL, link text) for every <a href> on a page, fragments dropped, in document order."""
+    root = lxml.html.document_fromstring(content)
+    root.make_links_absolute(base_url)
+
+    links = []
+    for anchor in root.iterfind('.//a[@href]'):
+        url = anchor.get('href').split('#', 1)[0]
+        links.append((url, ' '.join(anchor.text_content().split())))
+    return links
@@ -0,0 +1,143 @@
+# rankings_db.py
+
+# Optional SQLite copy of the rankings for the Dash apps' filtered queries
+# (`Dash_Deploy/support/rankings_db.py`). Sources and teams are small lookup
+# tables; each ranking row carries its Sunday and NBA week (from the season
+# calendar in `Modules/seasons.py`) so dashboards can query by team/week or
+# source/date through indexes. Weeks are numbered per season, so ranges are
+# scanned by Sunday. A ranking is stored once per entryname and URL (the rule
+# `Modules/rankings_tables.py` applies too), so re-appending rows is harmless.
+# (`tests/test_module_drift.py` checks the reader gets every row back on the
+# apps' calendar.)
+# Created by `--rebuild` (rebuild a database made before entryname and URL were unique);
+# once the file exists, every ingest also writes to it in one transaction.
+#
+#   python -m Modules.rankings_db --rebuild Dash_Deploy/support/data/latest_powerrankings.csv
+import argparse
+import csv
+import os
+import sqlite3
+
+import Modules.seasons as seasons
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'Dash_Deploy', 'support', 'data')
+DB_FILE = os.path.join(DATA_DIR, 'rankings.sqlite3')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    source_id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS teams (
+    team_id INTEGER PRIMARY KEY,
+    teamname TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS weeks (
+    sunday TEXT PRIMARY KEY,
+    season TEXT NOT NULL,
+    nba_week INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rankings (
+    ranking_id INTEGER PRIMARY KEY,
+    entryname TEXT NOT NULL,
+    source_id INTEGER NOT NULL REFERENCES sources (source_id),
+    author TEXT,
+    date TEXT NOT NULL,
+    url TEXT,
+    team_id INTEGER NOT NULL REFERENCES teams (team_id),
+    ranking INTEGER NOT NULL,
+    sunday TEXT NOT NULL,
+    nba_week INTEGER,
+    UNIQUE (entryname, url)
+);
+CREATE INDEX IF NOT EXISTS rankings_team_sunday ON rankings (team_id, sunday);
+CREATE INDEX IF NOT EXISTS rankings_source_date ON rankings (source_id, date);
+"""
+
+
+def exists(path=DB_FILE):
+    """Check whether the optional database has been created."""
+    return os.path.isfile(path)
+
+
+def connect(path=DB_FILE):
+    """Open (creating if needed) the database with its schema and week calendar."""
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    with conn:
+        conn.executescript(SCHEMA)
+        load_weeks(conn)
+    return conn
+
+
+def load_weeks(conn):
+    """Write every season's calendar (sunday -> season, nba_week) into the weeks table."""
+    weeks = [(sunday.isoformat(), season, week)
+             for season in seasons.week_one_sundays()
+             for sunday, week in seasons.season_weeks(season)]
+    conn.executemany("INSERT OR REPLACE INTO weeks (sunday, season, nba_week) VALUES (?, ?, ?)", weeks)
+
+
+def ranking_values(row):
+    """(entryname, source, author, ISO date, url, teamname, ranking, ISO sunday) for one entry."""
+    day = seasons.parse_file_date(row['date'])
+    sunday = seasons.week_of(day)
+    return (row['entryname'], row['source'], row['author'], day.isoformat(), row['url'],
+            row['teamname'], int(row['ranking']), sunday.isoformat())
+
+
+def insert_rankings(conn, rows):
+    """Insert entries in a single transaction, skipping entryname/URL pairs already present (so a retried append is a no-op)."""
+    values = [ranking_values(row) for row in rows]
+    with conn:
+        conn.executemany("INSERT OR IGNORE INTO sources (source) VALUES (?)", {(v[1],) for v in values})
+        conn.executemany("INSERT OR IGNORE INTO teams (teamname) VALUES (?)", {(v[5],) for v in values})
+        conn.executemany("""
+            INSERT OR IGNORE INTO rankings
+                (entryname, source_id, author, date, url, team_id, ranking, sunday, nba_week)
+            VALUES (
+                ?,
+                (SELECT source_id FROM sources WHERE source = ?),
+                ?, ?, ?,
+                (SELECT team_id FROM teams WHERE teamname = ?),
+                ?, ?,
+                (SELECT nba_week FROM weeks WHERE sunday = ?)
+            )""", [v + (v[7],) for v in values])
+    return len(values)
+
+
+def append(rows, path=DB_FILE):
+    """Write freshly ingested entries to the database, if it has been created."""
+    if not exists(path):
+        return None
+    conn = connect(path)
+    try:
+        return insert_rankings(conn, rows)
+    finally:
+        conn.close()
+
+
+def rebuild(csv_path, path=DB_FILE):
+    """Create the database from scratch with the rows of a rankings CSV."""
+    with open(csv_path, 'r', newline='') as csvfile:
+        rows = [row for row in csv.DictReader(csvfile) if row.get('entryname')]
+
+    tmp_path = path + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = connect(tmp_path)
+    insert_rankings(conn, rows)
+    conn.execute("ANALYZE")
+    stored = conn.execute("SELECT COUNT(*) FROM rankings").fetchone()[0]
+    conn.close()
+    os.replace(tmp_path, path)
+    print(f"Rebuilt rankings database '{path}' from '{csv_path}' ({stored} of {len(rows)} rows, repeats skipped)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Maintain the optional SQLite rankings database.")
+    parser.add_argument('--rebuild', metavar='CSV', required=True, help="rankings CSV to build the database from")
+    parser.add_argument('--db', default=DB_FILE, help="database file")
+    args = parser.parse_args()
+
+    rebuild(args.rebuild, args.db)
@@ -0,0 +1,186 @@
+# rankings_store.py
+
+# Append-only Parquet store of scraped rankings for the Dash apps, partitioned
+# as `season=2024-25/source=ESPN/week=2024-10-20/part-<n>.parquet` (week is the
+# Sunday starting that week). Each ingest writes new files for only the
+# partitions its rows fall in; `manifest.json` lists every file with its
+# partition keys, row count and date range so readers
+# (`Dash_Deploy/support/rankings_store.py`) can pick what they need without
+# listing folders or opening files. The manifest is saved last, so a file it
+# doesn't list belongs to an append that never finished: readers ignore it and
+# the next append to that partition removes it. A ranking is stored once per
+# entryname and URL (the rule the tables and database apply too), so a retried
+# append writes nothing. Created by `--rebuild`; once the store exists, every
+# ingest appends to it. (`tests/test_module_drift.py` checks the apps read back
+# exactly what is written here.)
+#
+#   python -m Modules.rankings_store --rebuild Dash_Deploy/support/data/latest_powerrankings.csv
+import argparse
+import csv
+import json
+import os
+import shutil
+import time
+
+from Modules.seasons import parse_file_date, season_of, week_of
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'Dash_Deploy', 'support', 'data')
+STORE_DIR = os.path.join(DATA_DIR, 'rankings_store')
+MANIFEST_FILE = 'manifest.json'
+
+FIELDNAMES = ['entryname', 'source', 'author', 'date', 'url', 'teamname', 'ranking']
+
+
+def partition_key(row):
+    """(season, source, week) for one ranking entry."""
+    day = parse_file_date(row['date'])
+    return season_of(day), row['source'], week_of(day).isoformat()
+
+
+def partition_folder(key):
+    season, source, week = key
+    return f"season={season}/source={source}/week={week}"
+
+
+def row_key(row):
+    """What identifies one stored ranking."""
+    return row['entryname'], row['url']
+
+
+def exists(store_dir=STORE_DIR):
+    """Check whether the store has been created."""
+    return os.path.isfile(os.path.join(store_dir, MANIFEST_FILE))
+
+
+class RankingsStore:
+    """Partitioned Parquet files plus a manifest describing them."""
+
+    def __init__(self, store_dir=STORE_DIR):
+        self.store_dir = store_dir
+        self.manifest_path = os.path.join(store_dir, MANIFEST_FILE)
+        try:
+            with open(self.manifest_path, 'r') as manifest_file:
+                self.manifest = json.load(manifest_file)
+        except FileNotFoundError:
+            self.manifest = {'version': 1, 'partitions': []}
+
+    def _save_manifest(self):
+        """Write the manifest atomically (temp file + rename); this commits an append."""
+        os.makedirs(self.store_dir, exist_ok=True)
+        with open(self.manifest_path + '.tmp', 'w') as manifest_file:
+            json.dump(self.manifest, manifest_file, indent=1)
+        os.replace(self.manifest_path + '.tmp', self.manifest_path)
+
+    def listed(self, folder):
+        """Manifest entries of one partition folder."""
+        return [part for part in self.manifest['partitions'] if part['path'].rsplit('/', 1)[0] == folder]
+
+    def _drop_unlisted(self, folder):
+        """Remove files of a partition that the manifest doesn't list (left by an unfinished append)."""
+        full_folder = os.path.join(self.store_dir, *folder.split('/'))
+        if not os.path.isdir(full_folder):
+            return
+        listed = {part['path'].rsplit('/', 1)[1] for part in self.listed(folder)}
+        for filename in os.listdir(full_folder):
+            if filename not in listed:
+                os.remove(os.path.join(full_folder, filename))
+
+    def stored_keys(self, folder):
+        """Row keys already stored in one partition."""
+        import pyarrow.parquet as pq
+
+        keys = set()
+        for part in self.listed(folder):
+            table = pq.read_table(os.path.join(self.store_dir, *part['path'].split('/')), columns=['entryname', 'url'])
+            keys.update(zip(table.column('entryname').to_pylist(), table.column('url').to_pylist()))
+        return keys
+
+    def _write_part(self, key, rows):
+        """Write rows of one partition to a new Parquet file and return its manifest entry."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        season, source, week = key
+        folder = partition_folder(key)
+        path = f"{folder}/part-{time.time_ns()}.parquet"
+        full_path = os.path.join(self.store_dir, *path.split('/'))
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+
+        dates = [parse_file_date(row['date']) for row in rows]
+        table = pa.table({
+            'entryname': [row['entryname'] for row in rows],
+            'source': [row['source'] for row in rows],
+            'author': [row['author'] for row in rows],
+            'date': pa.array(dates, pa.date32()),
+            'url': [row['url'] for row in rows],
+            'teamname': [row['teamname'] for row in rows],
+            'ranking': pa.array([int(row['ranking']) for row in rows], pa.int8()),
+        })
+        pq.write_table(table, full_path + '.tmp')
+        os.replace(full_path + '.tmp', full_path)
+
+        return {
+            'path': path,
+            'season': season,
+            'source': source,
+            'week': week,
+            'rows': len(rows),
+            'min_date': min(dates).isoformat(),
+            'max_date': max(dates).isoformat(),
+        }
+
+    def append(self, rows):
+        """Write rows not stored yet into their partitions (new files only), then record them in the manifest.
+
+        Returns the number of rows written.
+        """
+        groups = {}
+        for row in rows:
+            groups.setdefault(partition_key(row), []).append(row)
+
+        written = []
+        for key, group in sorted(groups.items()):
+            folder = partition_folder(key)
+            self._drop_unlisted(folder)
+            seen = self.stored_keys(folder)
+            new_rows = []
+            for row in group:
+                if row_key(row) not in seen:
+                    seen.add(row_key(row))
+                    new_rows.append(row)
+            if new_rows:
+                written.append(self._write_part(key, new_rows))
+
+        if written:
+            self.manifest['partitions'].extend(written)
+            self._save_manifest()
+        return sum(part['rows'] for part in written)
+
+    def rebuild(self, csv_path):
+        """Replace the whole store with the rows of a rankings CSV."""
+        with open(csv_path, 'r', newline='') as csvfile:
+            rows = [row for row in csv.DictReader(csvfile) if row.get('entryname')]
+
+        if os.path.isdir(self.store_dir):
+            shutil.rmtree(self.store_dir)
+        self.manifest = {'version': 1, 'partitions': []}
+        written = self.append(rows)
+        self._save_manifest()
+        print(f"Rebuilt rankings store in '{self.store_dir}' from '{csv_path}' "
+              f"({written} of {len(rows)} rows, repeats skipped, in {len(self.manifest['partitions'])} partitions)")
+
+
+def append(rows, store_dir=STORE_DIR):
+    """Write freshly ingested entries to the store, if it has been created."""
+    if not exists(store_dir):
+        return None
+    return RankingsStore(store_dir).append(rows)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Maintain the partitioned rankings store.")
+    parser.add_argument('--rebuild', metavar='CSV', required=True, help="rankings CSV to rebuild the store from")
+    parser.add_argument('--store-dir', default=STORE_DIR, help="store folder")
+    args = parser.parse_args()
+
+    RankingsStore(args.store_dir).rebuild(args.rebuild)
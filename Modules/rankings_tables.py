@@ -0,0 +1,226 @@
+# rankings_tables.py
+
+# Normalized copy of the rankings for the Dash apps, in
+# `Dash_Deploy/support/data/rankings_tables/`:
+#   teams.csv                    team_id, teamname
+#   season=2024-25/articles.csv  article_id, source, author, date, url   (one row per ranking set)
+#   season=2024-25/ranks.csv     article_id, team_id, ranking            (three small integers per row)
+#   manifest.json                committed size of each table
+# An article's metadata is stored once instead of on each of its 30 rows, and
+# entryname is left out (it is source + date + team abbreviation). Each season
+# has its own articles/ranks pair (article ids count from 0 per season), so a
+# dashboard loads one season no matter how much history accumulates. Created
+# by `--rebuild`; once the tables exist, every ingest appends to them (articles
+# already in a season's table are skipped, so a retried append adds nothing).
+# A team is ranked once per article: repeated rows (same entryname and URL, the
+# rule `Modules/rankings_db.py` applies too) keep the first one.
+# An append writes only the new rows, then records every table's size in the
+# manifest; bytes past a recorded size belong to an append that never finished
+# and are cut off before the next one.
+# (`Dash_Deploy/support/rankings_tables.py` loads them as categorical/int frames;
+# `tests/test_module_drift.py` checks it reads back exactly what is written here.)
+#
+#   python -m Modules.rankings_tables --rebuild Dash_Deploy/support/data/latest_powerrankings.csv
+import argparse
+import csv
+import json
+import os
+import shutil
+
+from Modules.batch_commit import append_rows_atomic, truncate_to
+from Modules.seasons import parse_file_date, season_of
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'Dash_Deploy', 'support', 'data')
+TABLES_DIR = os.path.join(DATA_DIR, 'rankings_tables')
+TEAMS_CSV = os.path.join(DATA_DIR, 'nba_teams_data.csv')
+MANIFEST_FILE = 'manifest.json'
+
+ARTICLE_FIELDS = ['article_id', 'source', 'author', 'date', 'url']
+TEAM_FIELDS = ['team_id', 'teamname']
+RANK_FIELDS = ['article_id', 'team_id', 'ranking']
+
+
+def table_path(name, tables_dir=TABLES_DIR, season=None):
+    """Path of teams.csv (season=None) or of one season's articles/ranks table."""
+    if season is None:
+        return os.path.join(tables_dir, f"{name}.csv")
+    return os.path.join(tables_dir, f"season={season}", f"{name}.csv")
+
+
+def exists(tables_dir=TABLES_DIR):
+    """Check whether the tables have been created."""
+    return os.path.isfile(table_path('teams', tables_dir))
+
+
+def read_sizes(tables_dir=TABLES_DIR):
+    """{table path relative to tables_dir: committed size} (empty for tables built before sizes were recorded)."""
+    try:
+        with open(os.path.join(tables_dir, MANIFEST_FILE), 'r') as manifest_file:
+            return json.load(manifest_file)['sizes']
+    except FileNotFoundError:
+        return {}
+
+
+def save_sizes(sizes, tables_dir=TABLES_DIR):
+    """Record committed table sizes atomically (temp file + rename); this commits an append."""
+    manifest_path = os.path.join(tables_dir, MANIFEST_FILE)
+    with open(manifest_path + '.tmp', 'w') as manifest_file:
+        json.dump({'sizes': sizes}, manifest_file, indent=1, sort_keys=True)
+    os.replace(manifest_path + '.tmp', manifest_path)
+
+
+def table_sizes(tables_dir=TABLES_DIR):
+    """Current size of every table file, keyed like the manifest."""
+    sizes = {}
+    for folder, _, filenames in os.walk(tables_dir):
+        for filename in filenames:
+            if filename.endswith('.csv'):
+                path = os.path.join(folder, filename)
+                sizes[os.path.relpath(path, tables_dir).replace(os.sep, '/')] = os.path.getsize(path)
+    return sizes
+
+
+def drop_torn_tails(sizes, tables_dir=TABLES_DIR):
+    """Undo an unfinished append: truncate committed tables to their recorded size, remove tables it started."""
+    if not sizes:
+        return
+    for relative, size in table_sizes(tables_dir).items():
+        path = os.path.join(tables_dir, relative)
+        if relative not in sizes:
+            os.remove(path)
+        elif size > sizes[relative]:
+            truncate_to(path, sizes[relative])
+
+
+def article_key(row):
+    """What identifies one ranking set (some outlets reuse a URL for later weeks)."""
+    return row['source'], row['author'], str(row['date']), row['url']
+
+
+def read_table(name, tables_dir=TABLES_DIR, season=None):
+    try:
+        with open(table_path(name, tables_dir, season), 'r', newline='') as csvfile:
+            return list(csv.DictReader(csvfile))
+    except FileNotFoundError:
+        return []
+
+
+def group_by_season(rows):
+    """{season: rows} in first-seen order."""
+    groups = {}
+    for row in rows:
+        groups.setdefault(season_of(parse_file_date(row['date'])), []).append(row)
+    return groups
+
+
+def normalize(rows, article_ids, team_ids):
+    """Split entries into (new article rows, new team rows, rank rows), adding new keys to the id maps.
+
+    A team already ranked in the same article is skipped.
+    """
+    new_articles, new_teams, ranks = [], [], []
+    ranked = set()
+    for row in rows:
+        key = article_key(row)
+        if (key, row['teamname']) in ranked:
+            continue
+        ranked.add((key, row['teamname']))
+        if key not in article_ids:
+            article_ids[key] = len(article_ids)
+            new_articles.append(dict(zip(ARTICLE_FIELDS, (article_ids[key],) + key)))
+        if row['teamname'] not in team_ids:
+            team_ids[row['teamname']] = len(team_ids)
+            new_teams.append({'team_id': team_ids[row['teamname']], 'teamname': row['teamname']})
+        ranks.append({'article_id': article_ids[key], 'team_id': team_ids[row['teamname']],
+                      'ranking': int(row['ranking'])})
+    return new_articles, new_teams, ranks
+
+
+def append_table(name, rows, fieldnames, sizes, tables_dir=TABLES_DIR, season=None):
+    """Append rows to a table, starting it (header included) if this is its season's first; update its size in sizes."""
+    path = table_path(name, tables_dir, season)
+    relative = os.path.relpath(path, tables_dir).replace(os.sep, '/')
+    if os.path.isfile(path):
+        sizes[relative] = append_rows_atomic(path, rows, fieldnames, sizes.get(relative))
+    else:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_table(path, rows, fieldnames)
+        sizes[relative] = os.path.getsize(path)
+
+
+def append(rows, tables_dir=TABLES_DIR):
+    """Write freshly ingested entries to their seasons' tables, if the tables have been created."""
+    if not exists(tables_dir):
+        return None
+    sizes = read_sizes(tables_dir)
+    drop_torn_tails(sizes, tables_dir)
+    sizes = sizes or table_sizes(tables_dir)
+    team_ids = {t['teamname']: int(t['team_id']) for t in read_table('teams', tables_dir)}
+
+    written = 0
+    for season, season_rows in group_by_season(rows).items():
+        article_ids = {article_key(a): int(a['article_id']) for a in read_table('articles', tables_dir, season)}
+        season_rows = [row for row in season_rows if article_key(row) not in article_ids]
+        if not season_rows:
+            continue
+        new_articles, new_teams, ranks = normalize(season_rows, article_ids, team_ids)
+
+        # ranks last: a rank row never points at an article or team that wasn't written
+        if new_teams:
+            append_table('teams', new_teams, TEAM_FIELDS, sizes, tables_dir)
+        if new_articles:
+            append_table('articles', new_articles, ARTICLE_FIELDS, sizes, tables_dir, season)
+        append_table('ranks', ranks, RANK_FIELDS, sizes, tables_dir, season)
+        written += len(ranks)
+
+    if written:
+        save_sizes(sizes, tables_dir)
+    return written
+
+
+def write_table(path, rows, fieldnames):
+    """Write a whole table atomically (temp file + rename)."""
+    with open(path + '.tmp', 'w', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(path + '.tmp', path)
+
+
+def rebuild(csv_path, tables_dir=TABLES_DIR, teams_csv=TEAMS_CSV):
+    """Create the tables from scratch with the rows of a rankings CSV (team ids follow nba_teams_data.csv)."""
+    with open(csv_path, 'r', newline='') as csvfile:
+        rows = [row for row in csv.DictReader(csvfile) if row.get('entryname')]
+    with open(teams_csv, 'r', newline='') as csvfile:
+        teamnames = [row['teamname'] for row in csv.DictReader(csvfile)]
+
+    team_ids = {teamname: team_id for team_id, teamname in enumerate(teamnames)}
+    if os.path.isdir(tables_dir):
+        shutil.rmtree(tables_dir)
+    os.makedirs(tables_dir)
+
+    groups = group_by_season(rows)
+    article_count = rank_count = 0
+    for season, season_rows in groups.items():
+        articles, new_teams, ranks = normalize(season_rows, {}, team_ids)
+        os.makedirs(os.path.dirname(table_path('articles', tables_dir, season)), exist_ok=True)
+        write_table(table_path('articles', tables_dir, season), articles, ARTICLE_FIELDS)
+        write_table(table_path('ranks', tables_dir, season), ranks, RANK_FIELDS)
+        article_count += len(articles)
+        rank_count += len(ranks)
+
+    # teams last: its presence marks the tables as built
+    teams = [{'team_id': team_id, 'teamname': teamname} for teamname, team_id in team_ids.items()]
+    write_table(table_path('teams', tables_dir), teams, TEAM_FIELDS)
+    save_sizes(table_sizes(tables_dir), tables_dir)
+    print(f"Rebuilt rankings tables in '{tables_dir}' from '{csv_path}' "
+          f"({len(groups)} seasons, {article_count} articles, {len(teams)} teams, {rank_count} of {len(rows)} ranks, repeats skipped)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Maintain the normalized rankings tables.")
+    parser.add_argument('--rebuild', metavar='CSV', required=True, help="rankings CSV to build the tables from")
+    parser.add_argument('--tables-dir', default=TABLES_DIR, help="tables folder")
+    args = parser.parse_args()
+
+    rebuild(args.rebuild, args.tables_dir)
@@ -0,0 +1,134 @@
+# response_cache.py
+
+# Persistent, content-addressed store for scraped article HTML.
+# Bodies live in `objects/<sha256>`; `index.json` maps each URL to its body's
+# hash plus the ETag/Last-Modified needed to revalidate it. Reads only bump
+# an entry's `accessed` time in memory; `flush()`/`close()` persist them so the
+# LRU order survives between runs (including `--offline` replays).
+import hashlib
+import json
+import os
+import threading
+import time
+
+CACHE_DIR = 'Scrape_Cache'
+MAX_BYTES = 256 * 1024 * 1024
+
+
+class CacheMiss(LookupError):
+    """Raised when an offline replay asks for a URL that was never cached."""
+
+
+class ResponseCache:
+    """On-disk HTTP response cache keyed by URL and content hash, with LRU eviction."""
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.objects_dir = os.path.join(cache_dir, 'objects')
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        self._lock = threading.Lock()
+        # access times changed since the index was last written
+        self._dirty = False
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+        try:
+            with open(self.index_path, 'r') as index_file:
+                self.index = json.load(index_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.index = {}
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest)
+
+    def _save_index(self):
+        """Write the index atomically (temp file + rename)."""
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w') as index_file:
+            json.dump(self.index, index_file, indent=1)
+        os.replace(tmp_path, self.index_path)
+        self._dirty = False
+
+    def lookup(self, url):
+        """Get the index entry for url, or None."""
+        with self._lock:
+            entry = self.index.get(url)
+            return dict(entry) if entry else None
+
+    def read(self, url):
+        """Get cached bytes for url, or None if it isn't cached."""
+        with self._lock:
+            entry = self.index.get(url)
+            if entry is None:
+                return None
+            try:
+                with open(self._object_path(entry['sha256']), 'rb') as body_file:
+                    content = body_file.read()
+            except FileNotFoundError:
+                del self.index[url]
+                self._save_index()
+                return None
+            entry['accessed'] = time.time()
+            self._dirty = True
+            return content
+
+    def store(self, url, content, etag=None, last_modified=None):
+        """Save content for url and evict least-recently-used entries over budget."""
+        digest = hashlib.sha256(content).hexdigest()
+        now = time.time()
+
+        with self._lock:
+            object_path = self._object_path(digest)
+            if not os.path.exists(object_path):
+                tmp_path = object_path + '.tmp'
+                with open(tmp_path, 'wb') as body_file:
+                    body_file.write(content)
+                os.replace(tmp_path, object_path)
+
+            self.index[url] = {
+                'sha256': digest,
+                'size': len(content),
+                'etag': etag,
+                'last_modified': last_modified,
+                'fetched': now,
+                'accessed': now,
+            }
+            self._evict()
+            self._save_index()
+        return digest
+
+    def _evict(self):
+        """Drop least-recently-used URLs until stored bodies fit in max_bytes."""
+        sizes = {entry['sha256']: entry['size'] for entry in self.index.values()}
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+
+        for url, entry in sorted(self.index.items(), key=lambda item: item[1]['accessed']):
+            if total <= self.max_bytes:
+                break
+            del self.index[url]
+
+            # the same body can back several URLs; only delete it once unreferenced
+            digest = entry['sha256']
+            if not any(other['sha256'] == digest for other in self.index.values()):
+                total -= sizes[digest]
+                try:
+                    os.remove(self._object_path(digest))
+                except FileNotFoundError:
+                    pass
+
+    def flush(self):
+        """Persist access times recorded since the index was last written."""
+        with self._lock:
+            if self._dirty:
+                self._save_index()
+
+    def close(self):
+        """Flush pending index changes."""
+        self.flush()
+
+    def urls(self):
+        """List cached URLs."""
+        with self._lock:
+            return list(self.index)
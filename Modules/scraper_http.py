@@ -0,0 +1,175 @@
+# scraper_http.py
+
+# Shared HTTP client for the power rankings scrapers: one keep-alive session,
+# pooled per host, with retries/backoff, timeouts, and conditional GETs
+# revalidated against the on-disk response cache. Bodies are not kept in
+# memory: a repeat request for a cached page is a 304 (or, offline, a cache
+# read), so a long backfill's memory stays flat.
+import atexit
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from Modules.response_cache import CacheMiss, ResponseCache
+
+USER_AGENT = "Mozilla/5.0"
+
+# defaults (override with `configure()`)
+RETRIES = 3
+BACKOFF = 0.5
+TIMEOUT = 10
+POOL_MAXSIZE = 4
+MIN_INTERVAL = 0  # seconds between requests to one domain (0 = no limit)
+
+
+def url_domain(url):
+    """Registrable domain of url ('www.espn.com' -> 'espn.com')."""
+    return '.'.join(urlparse(url).netloc.split(':')[0].split('.')[-2:])
+
+
+def mirror_url(url, mirror):
+    """Map url onto a mirror server laid out as '<mirror>/<host>/<path>' (e.g. saved pages served locally)."""
+    parts = urlparse(url)
+    mirrored = f"{mirror.rstrip('/')}/{parts.netloc}{parts.path or '/'}"
+    if parts.query:
+        mirrored += f"?{parts.query}"
+    return mirrored
+
+
+class ScraperClient:
+    """Pooled HTTP session that revalidates cached pages instead of downloading them again."""
+
+    def __init__(self, retries=RETRIES, backoff=BACKOFF, timeout=TIMEOUT,
+                 pool_maxsize=POOL_MAXSIZE, headers=None, cache=None, offline=False,
+                 min_interval=MIN_INTERVAL, domain_intervals=None, mirror=None):
+        self.timeout = timeout
+        # optional `response_cache.ResponseCache`; `offline` replays it without any network
+        self.cache = cache
+        self.offline = offline
+        # polite crawling: at least `min_interval` seconds between requests to a domain
+        # (`domain_intervals` overrides it per domain, e.g. {'espn.com': 2.0})
+        self.min_interval = min_interval
+        self.domain_intervals = dict(domain_intervals or {})
+        self._next_slot = {}
+        # optional base URL standing in for every site (requests still cached under the real URL)
+        self.mirror = mirror
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET", "HEAD"),
+            respect_retry_after_header=True,
+        )
+        # one connection pool per host, each keeping up to `pool_maxsize` sockets alive
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"User-Agent": USER_AGENT})
+        if headers:
+            self.session.headers.update(headers)
+
+        self._lock = threading.Lock()
+
+    def conditional_headers(self, url):
+        """Build If-None-Match / If-Modified-Since headers for a cached url."""
+        entry = self.cache.lookup(url) if self.cache is not None else None
+        if entry is None:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def wait_turn(self, url):
+        """Sleep until url's domain may be requested again, reserving the next slot."""
+        domain = url_domain(url)
+        interval = self.domain_intervals.get(domain, self.min_interval)
+        if not interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(domain, now))
+            self._next_slot[domain] = slot + interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def get(self, url):
+        """GET url and return its body, reusing the cached copy on a 304."""
+        if self.offline:
+            content = self.cache.read(url) if self.cache is not None else None
+            if content is None:
+                raise CacheMiss(f"{url} is not in the response cache (offline mode)")
+            return content
+
+        headers = self.conditional_headers(url)
+        request_url = mirror_url(url, self.mirror) if self.mirror else url
+        self.wait_turn(url)
+        response = self.session.get(request_url, headers=headers, timeout=self.timeout)
+
+        content = None
+        if response.status_code == 304 and headers:
+            content = self.cache.read(url)
+
+        if content is None:
+            if response.status_code == 304:
+                # cached body went missing; fetch it again unconditionally
+                self.wait_turn(url)
+                response = self.session.get(request_url, timeout=self.timeout)
+            response.raise_for_status()
+            content = response.content
+            if self.cache is not None:
+                self.cache.store(url, content, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return content
+
+    def close(self):
+        """Close pooled connections and flush the response cache's access times."""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Get the shared ScraperClient, creating it with defaults on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = ScraperClient(cache=ResponseCache())
+        return _client
+
+
+def configure(**kwargs):
+    """Replace the shared client (e.g. `configure(retries=5, cache=ResponseCache(), offline=True, min_interval=1.0)`)."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = ScraperClient(**kwargs)
+        return _client
+
+
+def fetch(url):
+    """Fetch url through the shared client."""
+    return get_client().get(url)
+
+
+@atexit.register
+def _close_client():
+    """Close the shared client on exit so cache reads made this run are saved."""
+    with _client_lock:
+        if _client is not None:
+            _client.close()
@@ -0,0 +1,74 @@
+# seasons.py
+
+# Season calendar for the scraper's derived stores. A season runs from the
+# rollover date (rankings published after the Finals count toward the next
+# season) to the day before the next one; its weeks start on Sundays and are
+# numbered from the Sunday on or before opening night (week 1), so a week
+# number is plain date arithmetic instead of a lookup in a per-season CSV.
+# Opening nights live in `Dash_Deploy/support/data/nba_seasons_ref.csv`
+# (one row per season); the Dash apps use the same file through
+# `Dash_Deploy/support/seasons.py` (`tests/test_module_drift.py` keeps the two
+# calendars in agreement).
+import csv
+import os
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'Dash_Deploy', 'support', 'data')
+SEASONS_CSV = os.path.join(DATA_DIR, 'nba_seasons_ref.csv')
+
+# rankings published after the Finals count toward the next season
+SEASON_ROLLOVER = (6, 20)
+
+
+def parse_file_date(date_text):
+    """Turn an entry's 'YYMMDD' date into a `datetime.date`."""
+    return datetime.strptime(str(date_text), '%y%m%d').date()
+
+
+def season_of(day):
+    """Season label for a date, e.g. 2024-11-04 -> '2024-25'."""
+    start_year = day.year if (day.month, day.day) >= SEASON_ROLLOVER else day.year - 1
+    return f"{start_year}-{(start_year + 1) % 100:02d}"
+
+
+def week_of(day):
+    """Sunday on or before a date (the start of its week)."""
+    return day - timedelta(days=(day.weekday() + 1) % 7)
+
+
+@lru_cache(maxsize=None)
+def week_one_sundays(path=SEASONS_CSV):
+    """{season: Sunday of NBA week 1} for every season in the reference file."""
+    with open(path, 'r', newline='') as csvfile:
+        return {row['season']: week_of(date.fromisoformat(row['opening_night']))
+                for row in csv.DictReader(csvfile)}
+
+
+def season_span(season):
+    """(first Sunday, last Sunday) of a season's calendar."""
+    start_year = int(season[:4])
+    first = date(start_year, *SEASON_ROLLOVER)
+    first += timedelta(days=(6 - first.weekday()) % 7)
+    last = week_of(date(start_year + 1, *SEASON_ROLLOVER) - timedelta(days=1))
+    return first, last
+
+
+def nba_week(day):
+    """NBA week number of a date within its season (None if the season isn't in the reference file)."""
+    week_one = week_one_sundays().get(season_of(day))
+    if week_one is None:
+        return None
+    return (week_of(day) - week_one).days // 7 + 1
+
+
+def season_weeks(season):
+    """[(sunday, nba_week), ...] for every week of a season's calendar."""
+    week_one = week_one_sundays()[season]
+    first, last = season_span(season)
+    weeks = []
+    sunday = first
+    while sunday <= last:
+        weeks.append((sunday, (sunday - week_one).days // 7 + 1))
+        sunday += timedelta(days=7)
+    return weeks
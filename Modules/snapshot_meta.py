@@ -0,0 +1,89 @@
+# snapshot_meta.py
+
+# Metadata sidecar for each rankings CSV snapshot (`<file>.meta.json`): row
+# count, the ranking sets per source, latest entry date, and a CRC-32 of the
+# file's bytes. The snapshot log (`Modules/snapshots.py`) keeps the same
+# metadata in its manifest, updated from just the appended rows/bytes, so counts
+# and checks never rescan the snapshot; a sidecar whose recorded size doesn't
+# match the file is recomputed once.
+import csv
+import json
+import os
+import zlib
+
+SIDECAR_SUFFIX = '.meta.json'
+
+
+def sidecar_path(csv_path):
+    return csv_path + SIDECAR_SUFFIX
+
+
+def empty_meta():
+    return {'rows': 0, 'sets': {}, 'max_date': None, 'crc32': 0, 'size': 0}
+
+
+def add_rows(meta, rows):
+    """Fold entries into meta's row count, per-source sets ('SOURCE' -> ['YYMMDD', ...]) and max date."""
+    meta['rows'] += len(rows)
+    for row in rows:
+        dates = meta['sets'].setdefault(row['source'], [])
+        if row['date'] not in dates:
+            dates.append(row['date'])
+        if meta['max_date'] is None or row['date'] > meta['max_date']:
+            meta['max_date'] = row['date']
+    return meta
+
+
+def file_crc32(csv_path, start=0, crc=0):
+    """CRC-32 of csv_path's bytes from `start` on, continuing from `crc`."""
+    with open(csv_path, 'rb') as csvfile:
+        csvfile.seek(start)
+        for block in iter(lambda: csvfile.read(1 << 20), b''):
+            crc = zlib.crc32(block, crc)
+    return crc
+
+
+def compute(csv_path):
+    """Build metadata by reading the whole snapshot (only when no valid sidecar exists)."""
+    with open(csv_path, 'r', newline='') as csvfile:
+        rows = [row for row in csv.DictReader(csvfile) if row.get('entryname')]
+
+    meta = add_rows(empty_meta(), rows)
+    meta['crc32'] = file_crc32(csv_path)
+    meta['size'] = os.path.getsize(csv_path)
+    return meta
+
+
+def save(csv_path, meta):
+    """Write csv_path's sidecar atomically (temp file + rename)."""
+    path = sidecar_path(csv_path)
+    with open(path + '.tmp', 'w') as meta_file:
+        json.dump(meta, meta_file, indent=1)
+    os.replace(path + '.tmp', path)
+
+
+def load(csv_path):
+    """Get csv_path's metadata from its sidecar, recomputing it if missing or out of date."""
+    try:
+        with open(sidecar_path(csv_path), 'r') as meta_file:
+            meta = json.load(meta_file)
+        if meta.get('size') == os.path.getsize(csv_path):
+            return meta
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+
+    meta = compute(csv_path)
+    save(csv_path, meta)
+    return meta
+
+
+def copy(src_path, dest_path):
+    """Give a byte-for-byte copy of src_path the same metadata."""
+    save(dest_path, load(src_path))
+
+
+def set_count(meta, source=None):
+    """Number of ranking sets, for one source or all."""
+    if source is not None:
+        return len(meta['sets'].get(source, []))
+    return sum(len(dates) for dates in meta['sets'].values())
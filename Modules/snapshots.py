@@ -0,0 +1,234 @@
+# snapshots.py
+
+# Weekly_PowerRankings as an append-only log instead of a full copy per day:
+#   manifest.json             latest state: base files, deltas, running metadata
+#   deltas/<YYMMDD>.csv       rows ingested that day (only those rows; the manifest
+#                             records each delta's committed size, and bytes past it
+#                             are a torn append, cut off when the log is opened)
+#   compacted_<YYMMDD>.csv    origin + every delta through that day, folded
+# The origin is the full snapshot the log started from (the newest legacy
+# `<YYMMDD>_powerrankings.csv`, referenced in place). Any point-in-time
+# snapshot is a base plus the deltas after it, so storage grows with the rows
+# ingested (not weeks x rows) and finding the latest state is one manifest read.
+#
+#   python -m Modules.snapshots --compact                 # fold deltas into a new compacted base
+#   python -m Modules.snapshots --export OUT.csv [--through YYMMDD]
+import argparse
+import csv
+import json
+import os
+import zlib
+
+import Modules.snapshot_meta as snapshot_meta
+from Modules.batch_commit import append_rows_atomic, truncate_to
+
+SNAPSHOT_DIR = 'Weekly_PowerRankings'
+MANIFEST_FILE = 'manifest.json'
+FIELDNAMES = ['entryname', 'source', 'author', 'date', 'url', 'teamname', 'ranking']
+
+# fold automatically once this many deltas have accumulated since the last base
+COMPACT_EVERY = 8
+
+
+class SnapshotLog:
+    """Base file(s) plus daily delta files, described by a manifest."""
+
+    def __init__(self, folder=SNAPSHOT_DIR):
+        self.folder = folder
+        self.manifest_path = os.path.join(folder, MANIFEST_FILE)
+        try:
+            with open(self.manifest_path, 'r') as manifest_file:
+                self.manifest = json.load(manifest_file)
+        except FileNotFoundError:
+            self.manifest = None
+        else:
+            self._drop_torn_tails()
+
+    def _drop_torn_tails(self):
+        """Truncate each delta to the size the manifest committed (an append may have crashed mid-write)."""
+        for delta in self.manifest['deltas']:
+            path = self._path(delta['file'])
+            if 'size' in delta and os.path.exists(path):
+                truncate_to(path, delta['size'])
+
+    @property
+    def initialized(self):
+        return self.manifest is not None
+
+    @property
+    def version(self):
+        """Counter bumped whenever the snapshot's rows change (lets other indexes tell whether they are current)."""
+        return self.manifest['version']
+
+    @property
+    def meta(self):
+        """Row count, per-source sets, max date and CRC-32 of the full current snapshot (see `snapshot_meta`)."""
+        return self.manifest['meta']
+
+    def _path(self, name):
+        return os.path.join(self.folder, name)
+
+    def _save_manifest(self, rows_changed=True):
+        """Write the manifest atomically (temp file + rename)."""
+        if rows_changed:
+            self.manifest['version'] += 1
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w') as manifest_file:
+            json.dump(self.manifest, manifest_file, indent=1)
+        os.replace(tmp_path, self.manifest_path)
+
+    def init_from(self, csv_path, day):
+        """Start the log from an existing full snapshot (referenced in place, not copied)."""
+        meta = snapshot_meta.compute(csv_path)
+        origin = {'file': os.path.relpath(csv_path, self.folder), 'through': day, 'rows': meta['rows'], 'deltas': 0}
+
+        # delta rows are concatenated after the base, which must end in a line break
+        with open(csv_path, 'rb') as csvfile:
+            csvfile.seek(max(meta['size'] - 1, 0))
+            if meta['size'] and csvfile.read(1) != b'\n':
+                origin['add_newline'] = True
+                meta['crc32'] = zlib.crc32(b'\n', meta['crc32'])
+                meta['size'] += 1
+
+        self.manifest = {
+            'version': 0,
+            'origin': origin,
+            'compacted': None,
+            'deltas': [],
+            'meta': meta,
+        }
+        os.makedirs(self.folder, exist_ok=True)
+        self._save_manifest()
+        print(f"Started snapshot log from '{csv_path}' ({meta['rows']} rows)")
+
+    def init_empty(self):
+        """Start an empty log (no prior snapshot)."""
+        os.makedirs(self.folder, exist_ok=True)
+        origin_path = self._path('origin.csv')
+        with open(origin_path, 'w', newline='') as csvfile:
+            csv.DictWriter(csvfile, fieldnames=FIELDNAMES).writeheader()
+        self.init_from(origin_path, '000000')
+
+    def latest_day(self):
+        """Day of the newest delta (or of the origin if nothing has been appended)."""
+        if self.manifest['deltas']:
+            return self.manifest['deltas'][-1]['day']
+        return self.manifest['origin']['through']
+
+    def _new_delta_path(self, day):
+        path = self._path(os.path.join('deltas', f"{day}.csv"))
+        if os.path.exists(path):
+            # same day, after that day's delta was already folded into a compacted base
+            path = self._path(os.path.join('deltas', f"{day}_{len(self.manifest['deltas'])}.csv"))
+        return path
+
+    def append(self, rows, day, fieldnames=FIELDNAMES):
+        """Append rows to day's delta (creating it) and fold them into the running metadata."""
+        deltas = self.manifest['deltas']
+        base, open_deltas = self._plan()
+        if open_deltas and open_deltas[-1]['day'] == day:
+            path = self._path(open_deltas[-1]['file'])
+        else:
+            if deltas and deltas[-1]['day'] > day:
+                raise ValueError(f"Delta {day} is older than the latest delta {deltas[-1]['day']}")
+            path = self._new_delta_path(day)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path + '.tmp', 'w', newline='') as csvfile:
+                csv.DictWriter(csvfile, fieldnames=fieldnames).writeheader()
+            os.replace(path + '.tmp', path)
+            deltas.append({'file': os.path.relpath(path, self.folder), 'day': day, 'rows': 0,
+                           'size': os.path.getsize(path)})
+
+        # header-less bytes appended to the delta are exactly the bytes the full snapshot gains
+        # (deltas from before sizes were recorded trust the file as it is)
+        old_size = deltas[-1].get('size', os.path.getsize(path))
+        new_size = append_rows_atomic(path, rows, fieldnames, old_size)
+        meta = snapshot_meta.add_rows(self.manifest['meta'], rows)
+        meta['crc32'] = snapshot_meta.file_crc32(path, start=old_size, crc=meta['crc32'])
+        meta['size'] += new_size - old_size
+
+        # the manifest write commits the rows
+        deltas[-1]['rows'] += len(rows)
+        deltas[-1]['size'] = new_size
+        self._save_manifest()
+
+    def _plan(self, through=None):
+        """(base file, deltas to add) for the snapshot as of day `through` (None = latest)."""
+        compacted = self.manifest['compacted']
+        if compacted and (through is None or compacted['through'] <= through):
+            base = compacted
+        else:
+            base = self.manifest['origin']
+        deltas = [d for d in self.manifest['deltas'][base['deltas']:]
+                  if through is None or d['day'] <= through]
+        return base, deltas
+
+    def iter_rows(self, through=None):
+        """Yield every row of the snapshot as of day `through` (None = latest), oldest first."""
+        base, deltas = self._plan(through)
+        for name in [base['file']] + [d['file'] for d in deltas]:
+            with open(self._path(name), 'r', newline='') as csvfile:
+                yield from csv.DictReader(csvfile)
+
+    def materialize(self, dest_path, through=None):
+        """Write the full snapshot as of `through` to dest_path atomically (base bytes + delta rows)."""
+        base, deltas = self._plan(through)
+        tmp_path = dest_path + '.tmp'
+        with open(tmp_path, 'wb') as out:
+            with open(self._path(base['file']), 'rb') as base_file:
+                for block in iter(lambda: base_file.read(1 << 20), b''):
+                    out.write(block)
+            if base.get('add_newline'):
+                out.write(b'\n')
+            for delta in deltas:
+                with open(self._path(delta['file']), 'rb') as delta_file:
+                    delta_file.readline()  # header
+                    for block in iter(lambda: delta_file.read(1 << 20), b''):
+                        out.write(block)
+        os.replace(tmp_path, dest_path)
+        return dest_path
+
+    def deltas_since_base(self):
+        base, deltas = self._plan()
+        return len(deltas)
+
+    def compact(self):
+        """Fold the origin/compacted base and all deltas into a new compacted base (deltas are kept for history)."""
+        if not self.deltas_since_base():
+            print('Nothing to compact')
+            return None
+        day = self.latest_day()
+        name = f"compacted_{day}.csv"
+        self.materialize(self._path(name))
+
+        previous = self.manifest['compacted']
+        self.manifest['compacted'] = {'file': name, 'through': day, 'rows': self.meta['rows'],
+                                      'deltas': len(self.manifest['deltas'])}
+        self._save_manifest(rows_changed=False)
+        if previous and previous['file'] != name:
+            os.remove(self._path(previous['file']))
+        print(f"Compacted snapshot log through {day} into '{name}' ({self.meta['rows']} rows)")
+        return name
+
+    def compact_if_due(self, every=COMPACT_EVERY):
+        if self.deltas_since_base() >= every:
+            return self.compact()
+        return None
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compact or export the Weekly_PowerRankings snapshot log.")
+    parser.add_argument('--folder', default=SNAPSHOT_DIR, help="snapshot folder")
+    parser.add_argument('--compact', action='store_true', help="fold deltas into a new compacted base")
+    parser.add_argument('--export', metavar='CSV', help="write the full snapshot to CSV")
+    parser.add_argument('--through', metavar='YYMMDD', help="with --export: snapshot as of this day")
+    args = parser.parse_args()
+
+    log = SnapshotLog(args.folder)
+    if not log.initialized:
+        parser.error(f"no snapshot log in '{args.folder}' yet (it is created on the next ingest)")
+    if args.compact:
+        log.compact()
+    if args.export:
+        log.materialize(args.export, args.through)
+        print(f"Wrote snapshot{' through ' + args.through if args.through else ''} to '{args.export}'")
@@ -0,0 +1,93 @@
+# sources
+
+# Registry of outlet parsers. Each outlet is its own module under
+# `Modules/sources/`, imported only when a URL from its domain comes in, so a
+# single-source run never loads the others (or bs4/dateparser/requests for an
+# unsupported domain).
+import importlib
+import re
+from urllib.parse import urlparse
+
+# netloc key (e.g. 'espn' for www.espn.com) -> plugin module
+SOURCE_MODULES = {
+    'espn': 'Modules.sources.espn',
+    'bleacherreport': 'Modules.sources.bleacherreport',
+    'cbssports': 'Modules.sources.cbssports',
+    'thescore': 'Modules.sources.thescore',
+    'nba': 'Modules.sources.nba',
+    'foxsports': 'Modules.sources.foxsports',
+}
+
+# registry key -> `source` label the plugin writes on each entry
+SOURCE_LABELS = {
+    'espn': 'ESPN',
+    'bleacherreport': 'BR',
+    'cbssports': 'CBS',
+    'thescore': 'Score',
+    'nba': 'NBA',
+    'foxsports': 'Fox',
+}
+
+UNSUPPORTED_SOURCES = {
+    'si': 'Sports Illustrated',
+    'theringer': 'The Ringer',
+    'yahoo': 'Yahoo',
+}
+
+
+def make_entryname(source, date, team_abbrev):
+    """Create standardized entryname from source, date, and team_abbrev."""
+    entryname = '_'.join([source, date, team_abbrev])
+    return entryname
+
+
+def fetch_html(URL):
+    """Download raw article HTML for URL through the shared scraper client."""
+    import Modules.scraper_http as http
+    return http.fetch(URL)
+
+
+def make_soup(content):
+    """Parse a whole article page (lxml)."""
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(content, "lxml")
+
+
+def source_key(URL):
+    """Get registry key for URL (second-level domain, e.g. 'cbssports')."""
+    return urlparse(URL).netloc.split('.')[-2]
+
+
+def check_source(URL):
+    """Return URL's registry key if a parser exists for it, else print why not and return None."""
+    source = source_key(URL)
+
+    if source in UNSUPPORTED_SOURCES:
+        print(f"Source is {source}... {UNSUPPORTED_SOURCES[source]} not currently supported")
+        return None
+
+    elif source not in SOURCE_MODULES:
+        print('Source not yet defined')
+        return None
+
+    return source
+
+
+def load_source(source):
+    """Import (once) and return the parser module for source."""
+    return importlib.import_module(SOURCE_MODULES[source])
+
+
+def choose_strategy(plugin, soup):
+    """Return the first extractor in plugin whose layout fingerprint matches the parsed page."""
+    for fingerprint, extractor in plugin.STRATEGIES:
+        if fingerprint is None or fingerprint(soup):
+            return extractor
+    return None
+
+
+def is_article_link(plugin, url, text=''):
+    """Check whether a link found on an index page points to one of plugin's ranking articles."""
+    if not re.search(plugin.ARTICLE_URL_PATTERN, url):
+        return False
+    return plugin.ARTICLE_LINK_TEXT is None or bool(re.search(plugin.ARTICLE_LINK_TEXT, text))
@@ -0,0 +1,200 @@
+# bleacherreport.py
+
+# Bleacher Report power rankings parser (bleacherreport.com); loaded by `Modules.sources.load_source('bleacherreport')`
+import re
+import Modules.date_parsing as dates
+import Modules.team_resolver as teams
+from Modules.sources import make_entryname, fetch_html, make_soup
+
+# elements `Modules.extract.targeted_soup()` keeps for this source's fingerprints and extractors
+XPATHS = [
+    "//h2",
+    "//span[contains(@class, 'name')]",
+    "//span[contains(@class, 'date')]",
+    "//span[@id='id/article/header/author']",
+    "//span[@id='id/article/header/post_date']",
+    "//span[contains(@class, 'small__headings__title__large')]",
+]
+
+# byline date formats, tried before `dateparser` (see `Modules.date_parsing.file_date()`)
+DATE_FORMATS = [
+    "%B %d, %Y",
+    "%b %d, %Y",
+    "%B %d, %Y %I:%M %p",
+]
+
+# links on archive/index pages that lead to a power rankings article (`backfill_module.py`)
+ARTICLE_URL_PATTERN = r"^https?://(www\.)?bleacherreport\.com/articles/[^?#]*power-rankings"
+ARTICLE_LINK_TEXT = None
+
+def get_br_soup(URL, br_soup=None):
+
+    cases = []
+    
+    if br_soup is None:
+        br_soup = make_soup(fetch_html(URL))
+
+    # source
+    source = 'BR'
+
+    #teams
+    br_teams = br_soup.find_all('h2')[1:]
+
+    
+    # 3.A.i. author
+    author = br_soup.select('span[class=name]')[0].text
+    
+    # 3.A.ii. date (use 'dates.file_date' for standardized formatting)
+    date_br = br_soup.select('span[class*=date]')[0].text # returns format October 4, 2024
+    date = dates.file_date(date_br, DATE_FORMATS)
+    
+    # 3.B. entry parsing
+    for t in br_teams:
+
+        # 3.B.i. team
+        team_br=t.text.split('. ')
+        if len(team_br) > 1:
+            team_br = team_br[1]
+        else:
+            continue
+        
+        # remove betting odds if present in team name
+        if '(' in team_br:
+            team_br = team_br.split(' (')[0]
+            #print(f"corrected teamname: {team}")
+        else:
+            team_br = team_br
+
+        # uniform team naming across sources (use 'teams.nba_tmname()')
+        team = teams.nba_tmname(team_br)
+
+        # 3.B.i.1a get team abbreviation (use 'teams.nba_abbrname()')
+        team_abbrev = teams.nba_abbrname(team_br)
+        
+        # 3.B.ii. rank
+        rank=t.text.split('. ', 1)[0]
+    
+        # 3.B.iii comments
+        """
+        text = t.find_next_siblings()
+        text = t.find_all("p") # need to join
+        text = t.find_next_siblings()
+        p_sib = text[1].find_all("p")
+        comm_br = '\n'.join(str(p.get_text()) for p in p_sib)
+        comments = comm_br
+        """
+
+        # 3.B.iv entryname
+        entryname = make_entryname(source,date, team_abbrev)
+
+        
+        case = {
+            "entryname":entryname, 
+            "teamname":team, 
+            "ranking": rank,
+            "author": author,
+            "source": source,
+            "date": date, 
+            "url":URL,
+            #"comments": comments
+            }
+        cases.append(case)
+    
+    return(cases)
+
+def get_br_soup2(URL, soup=None):
+    """Extract power rankings information from new CBS Sports format (no table)."""
+    cases = []
+    
+
+    if soup is None:
+        soup = make_soup(fetch_html(URL))
+    
+    # `source` has already been defined
+    source = 'BR'
+
+    # still works
+    # 3.A.i. author
+  
+    author = soup.find("span", {"id":"id/article/header/author"}).text
+ 
+    #print(author)
+
+
+    # still works
+    # 3.A.ii. date (use 'dates.file_date' for standardized formatting)
+
+    # 3.A.ii. date (use 'dates.file_date' for standardized formatting)
+    date_br = soup.find("span", {"id":"id/article/header/post_date"}).get_text().strip()
+    date = dates.file_date(date_br, DATE_FORMATS)
+
+
+    text_article = soup.find_all('span', class_=re.compile(r'small__headings__title__large'))
+
+    # 3.B. entry parsing
+    for section in text_article:
+        
+        entry_comment=[]
+        
+        section_break = section.get_text()
+    
+        try:
+            section_break = section_break.split(' (')[0] # removing the records (w-l)
+            section_break = section_break.split('. ') # splitting by period, giving up clean values for rank and team
+
+
+            # uniform team naming across sources (use 'teams.nba_tmname()')
+            team_br = section_break[1].strip()
+            team_br = teams.nba_tmname(team_br)
+            team = team_br
+            
+            # 3.B.i.1a get team abbreviation (use 'teams.nba_abbrname()')
+            team_abbrev = teams.nba_abbrname(team)
+        
+            # 3.B.ii. rank
+            rank_br = section_break[0].strip()
+            rank = int(rank_br)
+
+            # 3.B. iii comments
+            """
+            for each in section.find_next_siblings('div'):
+                each = each.text.strip()
+                if len(each) >= 2:
+                    entry_comment.append(each)
+                else:
+                    continue
+            
+            comments = entry_comment
+            """
+
+            entryname = make_entryname(source,date, team_abbrev)
+                    
+            case = {
+                "entryname":entryname, 
+                "teamname":team, 
+                "ranking": rank,
+                "author": author,
+                "source": source,
+                "date": date, 
+                "url":URL,
+                #"comments": comments
+                }
+            cases.append(case)
+        
+
+        except:
+            pass
+
+    return cases
+
+# layout fingerprints: cheap checks on the parsed page that pick the right extractor up front
+def is_br_h2_layout(soup):
+    """Old BR layout: numbered `h2` headings with a `span.name` byline."""
+    return bool(soup.select('span[class=name]')) and bool(soup.select('span[class*=date]'))
+
+def is_br_span_layout(soup):
+    """Current BR layout: header spans keyed by `id/article/header/...` ids."""
+    return soup.find("span", {"id":"id/article/header/author"}) is not None
+
+# (fingerprint, extractor) pairs tried in order; `None` fingerprint always matches
+STRATEGIES = [(is_br_span_layout, get_br_soup2), (is_br_h2_layout, get_br_soup)]
@@ -0,0 +1,168 @@
+# cbssports.py
+
+# CBS Sports power rankings parser (www.cbssports.com); loaded by `Modules.sources.load_source('cbssports')`
+import re
+import Modules.date_parsing as dates
+import Modules.team_resolver as teams
+from Modules.sources import make_entryname, fetch_html, make_soup
+
+# elements `Modules.extract.targeted_soup()` keeps for this source's fingerprints and extractors
+XPATHS = [
+    "//a[contains(@class, 'ArticleAuthor-name--link')]",
+    "//time",
+    "//table[contains(@class, 'table-power-rankings')]",
+    "//div[contains(@class, 'Article-content')]",
+]
+
+# byline date formats, tried before `dateparser` (see `Modules.date_parsing.file_date()`)
+DATE_FORMATS = [
+    "%b %d, %Y at %I:%M %p",
+    "%B %d, %Y at %I:%M %p",
+    "%b %d, %Y",
+]
+
+# links on archive/index pages that lead to a power rankings article (`backfill_module.py`)
+ARTICLE_URL_PATTERN = r"^https?://(www\.)?cbssports\.com/nba/news/[^?#]*power-rankings"
+ARTICLE_LINK_TEXT = None
+
+def get_cbs_soup(URL, cbs_soup=None):
+
+    cases = []
+    
+    if cbs_soup is None:
+        cbs_soup = make_soup(fetch_html(URL))
+    
+    cbs_table = cbs_soup.find('table', {"class":"table-power-rankings"})
+
+    # `url` has already been defined
+    source = 'CBS'
+
+    # 3.A.i. author
+    author = cbs_soup.find("a", {"class":"ArticleAuthor-name--link"}).text
+
+    # 3.A.ii. date (use 'dates.file_date' for standardized formatting)
+    date_cbs = cbs_soup.find("time").text.strip()
+    date_cbs = ' '.join(date_cbs.split())
+    date = dates.file_date(date_cbs, DATE_FORMATS)
+    
+    # 3.B. entry parsing
+    rows = cbs_table.select("tr")
+    
+    for r in rows[1:]:
+        # 3.B.i. team
+        team_cbs = r.find('span', {"class":"team-name"}).text.strip()
+        
+        # uniform team naming across sources (use 'teams.nba_tmname()')
+        team = teams.nba_tmname(team_cbs)
+
+        # 3.B.i.1a get team abbreviation (use 'teams.nba_abbrname()')
+        team_abbrev = teams.nba_abbrname(team)
+        
+        # 3.B.ii. rank
+        rank = r.find("span", {"class":"rank"}).text.strip()
+        
+        # 3.B. iii comments
+        #comm_cbs = r.find("td", {"class": "cell-left dek"}).text.strip()
+        #comments = comm_cbs
+
+
+        entryname = make_entryname(source,date, team_abbrev)
+
+        case = {
+            "entryname":entryname, 
+            "teamname":team, 
+            "ranking": rank,
+            "author": author,
+            "source": source,
+            "date": date, 
+            "url":URL,
+            #"comments": comments
+        }
+        cases.append(case)
+    return((cases))
+
+def get_cbs_soup2(URL, soup=None):
+    """Extract power rankings information from new CBS Sports format (no table)."""
+    cases = []
+    
+
+    if soup is None:
+        soup = make_soup(fetch_html(URL))
+    
+    # `source` has already been defined
+    source = 'CBS'
+
+    # still works
+    # 3.A.i. author
+    author = soup.find("a", {"class":"ArticleAuthor-name--link"}).text
+
+
+    # still works
+    # 3.A.ii. date (use 'dates.file_date' for standardized formatting)
+    date_cbs = soup.find("time").text.strip()
+    date_cbs = ' '.join(date_cbs.split()[:-1]) # excluding "ET"
+    date = dates.file_date(date_cbs, DATE_FORMATS)
+
+    # 3.B. entry parsing
+    # in 2nd CBS format, article is nested in a div with class "Article-content"
+    article_div = soup.find_all('div', class_='Article-content')
+
+    # and power rankings are li in uls
+    lis = article_div[0].find_all('li')
+    lis = [li.text for li in lis]
+
+    for li in lis:
+        # rank will be followed by a '.', which will precede a space and a team ranking...
+        li = re.split(r'\. ', li)
+
+        if len(li) >= 2:
+            team_cbs = li[1].strip()
+            rank_cbs = li[0].strip()
+
+            # uniform team naming across sources (use 'teams.nba_tmname()')
+            team = teams.nba_tmname(team_cbs)
+            # 3.B.i.1a get team abbreviation (use 'teams.nba_abbrname()')
+            team_abbrev = teams.nba_abbrname(team)
+        
+            # 3.B.ii. rank
+            rank = int(rank_cbs)
+        
+            # 3.B. iii comments
+            # skipping this since each team doesnt get its own comments
+            """
+            comm_cbs = r.find("td", {"class": "cell-left dek"}).text.strip()
+            comments = comm_cbs
+            comments = ''
+            """
+
+            entryname = make_entryname(source,date, team_abbrev)
+
+            case = {
+                "entryname":entryname, 
+                "teamname":team, 
+                "ranking": rank,
+                "author": author,
+                "source": source,
+                "date": date, 
+                "url":URL,
+                #"comments": comments
+            }
+            cases.append(case)
+            #print(case)
+            
+        else:
+            continue
+
+    return(cases)
+
+# layout fingerprints: cheap checks on the parsed page that pick the right extractor up front
+def is_cbs_table_layout(soup):
+    """CBS layout with a `table-power-rankings` table."""
+    return soup.find('table', {"class":"table-power-rankings"}) is not None
+
+def is_cbs_list_layout(soup):
+    """CBS layout with rankings as `li`s inside `div.Article-content`."""
+    return soup.find('div', class_='Article-content') is not None
+
+# (fingerprint, extractor) pairs tried in order; `None` fingerprint always matches
+STRATEGIES = [(is_cbs_table_layout, get_cbs_soup), (is_cbs_list_layout, get_cbs_soup2)]
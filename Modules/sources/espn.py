@@ -0,0 +1,89 @@
+# espn.py
+
+# ESPN power rankings parser (www.espn.com); loaded by `Modules.sources.load_source('espn')`
+import Modules.date_parsing as dates
+import Modules.team_resolver as teams
+from Modules.sources import make_entryname, fetch_html, make_soup
+
+# elements `Modules.extract.targeted_soup()` keeps for this source's fingerprints and extractors
+XPATHS = [
+    "//span[contains(@class, 'timestamp')]",
+    "//p",
+]
+
+# byline date formats, tried before `dateparser` (see `Modules.date_parsing.file_date()`)
+DATE_FORMATS = [
+    "%b %d, %Y, %I:%M %p",
+    "%B %d, %Y, %I:%M %p",
+    "%b %d, %Y",
+]
+
+# links on archive/index pages that lead to a power rankings article (`backfill_module.py`)
+ARTICLE_URL_PATTERN = r"^https?://(www\.)?espn\.com/nba/story/_/.*power-?rankings"
+ARTICLE_LINK_TEXT = None
+
+def get_espn_soup(URL, espn_soup=None):
+
+    cases = []
+
+    if espn_soup is None:
+        espn_soup = make_soup(fetch_html(URL))
+    #print(espn_soup)
+
+    # `url` has already been defined
+    # 2C source
+    source = 'ESPN'
+
+    # 3.A.i. author
+    author = 'Staff'
+    
+    # 3.A.ii. date (format '12-Oct-24')
+    date_espn = espn_soup.find_all("span", class_="timestamp", string=lambda text: "ET" in text if text else False)
+    date_espn = date_espn[0].get_text(strip=True)
+    date = dates.file_date(str(date_espn), DATE_FORMATS)
+
+    # 3.B. entry parsing
+    espn_teams = []
+    for p in espn_soup.find_all('p'):
+        text = p.text
+        if text and text[0].isdigit() and text.split()[1].isalpha():
+            text_split = text.split('. ', 1)
+
+            # 3.B.i. team
+            team_espn = text_split[1].strip()
+
+            # uniform team naming across sources (use 'teams.nba_tmname()')
+            team = teams.nba_tmname(team_espn)
+
+            # 3.B.i.1a get team abbreviation (use 'teams.nba_abbrname()')
+            team_abbrev = teams.nba_abbrname(team_espn)
+
+            # 3.B.ii. rank
+            rank = text_split[0].strip()
+            
+            # 3.B.iii comments
+            """
+            next_p = p.find_next_sibling("p").get_text()
+            comments_espn = next_p
+            comments = comments_espn
+            """
+
+            # 3.B.iv entryname
+            entryname = make_entryname(source,date, team_abbrev)
+
+            case = {
+                "entryname":entryname, 
+                "teamname":team, 
+                "ranking": rank,
+                "author": author,
+                "source": source,
+                "date": date, 
+                "url":URL,
+                #"comments": comments
+            }
+            cases.append(case)
+    #print(type(cases))
+    return(cases)
+
+# (fingerprint, extractor) pairs tried in order; `None` fingerprint always matches
+STRATEGIES = [(None, get_espn_soup)]
@@ -0,0 +1,186 @@
+# foxsports.py
+
+# FOX Sports power rankings parser (www.foxsports.com); loaded by `Modules.sources.load_source('foxsports')`
+import Modules.date_parsing as dates
+import Modules.team_resolver as teams
+from Modules.sources import make_entryname, fetch_html, make_soup
+
+# elements `Modules.extract.targeted_soup()` keeps for this source's fingerprints and extractors
+XPATHS = [
+    "//div[contains(@class, 'contributor-name')]",
+    "//div[contains(@class, 'info-text')]",
+    "//*[text()='NBA POWER RANKINGS']",
+    "//ol",
+    "//a[contains(@class, 'entity-title')]",
+]
+
+# byline date formats, tried before `dateparser` (see `Modules.date_parsing.file_date()`)
+DATE_FORMATS = [
+    "%b %d, %Y %I:%M %p",
+    "%B %d, %Y %I:%M %p",
+    "%b %d, %Y",
+]
+
+# links on archive/index pages that lead to a power rankings article (`backfill_module.py`)
+ARTICLE_URL_PATTERN = r"^https?://(www\.)?foxsports\.com/stories/nba/[^?#]*power-rankings"
+ARTICLE_LINK_TEXT = None
+
+def get_fox_soup(URL, fox_soup=None):
+
+    cases = []
+
+    if fox_soup is None:
+        fox_soup = make_soup(fetch_html(URL))
+    #response = requests.get(URL)
+    
+    #return fox_soup
+    teams_si = fox_soup.find_all('h2')
+    
+
+    # `url` has already been defined
+    # 2C source 
+    source = 'Fox'
+     
+    # 3.A.i. author 
+    #auth_si_class="link_13bb9r0"
+    author = fox_soup.find("div", {"class":'contributor-name'}).text.strip()
+
+    # 3.A.ii. date (format '241011')
+    div_tag = fox_soup.find("div", {"class":'info-text'})
+    date_fox = div_tag.find_all("span")[1]
+    #date = datemod.file_date(date_fox)
+    date_fox= date_fox.text.strip()[:-3]
+    #date = pd.to_datetime(date_fox)
+    date = dates.file_date(date_fox, DATE_FORMATS)
+
+    # 3.B. entry parsing 
+
+    # featured in numbered list
+    pr_header = fox_soup.find(text='NBA POWER RANKINGS')
+    pr_list = pr_header.find_next("ol")
+    pr_list = pr_list.find_all('li')
+
+    for index, team_fox in enumerate(pr_list):
+
+        # 3.B.i. team 
+        # uniform team naming across sources (use 'teams.nba_tmname()')
+        team_fox = team_fox.get_text().strip()
+        team = teams.nba_tmname(team_fox)
+
+        # 3.B.i.1a get team abbreviation (use 'teams.nba_abbrname()')
+        team_abbrev = teams.nba_abbrname(team)
+
+        # 3.B.ii. rank 
+        rank = index + 1
+
+        # 3.B.iii comments
+        """comm_fox = ""
+        comments = comm_fox
+        """
+
+        # 3.B.iv entryname 
+        entryname = make_entryname(source, str(date), team_abbrev)
+        
+        case = {
+            "entryname":entryname, 
+            "teamname":team, 
+            "ranking": rank,
+            "author": author,
+            "source": source,
+            "date": date, 
+            "url":URL,
+            #"comments": comments
+        }
+        cases.append(case)
+    return(cases)
+
+def get_fox_soup2(URL, fox_soup=None):
+
+    cases = []
+
+    if fox_soup is None:
+        fox_soup = make_soup(fetch_html(URL))
+    #response = requests.get(URL)
+
+    #print(fox_soup)
+    #return fox_soup
+    
+    #return fox_soup
+    teams_fox = fox_soup.find_all('a', {"class": "entity-title"})
+
+    #print(teams_fox)
+    
+
+    # `url` has already been defined
+    # 2C source 
+    source = 'Fox'
+     
+    # 3.A.i. author 
+    #auth_si_class="link_13bb9r0"
+    author = fox_soup.find("div", {"class":'contributor-name'}).text.strip()
+
+    print(author)
+    # 3.A.ii. date (format '241011')
+    div_tag = fox_soup.find("div", {"class":'info-text'})
+    #ic(div_tag.text.strip())
+    #ic(div_tag)
+    date_fox = div_tag.find_all("span")[1].get_text().strip()
+    #date = datemod.file_date(date_fox)
+    date_fox= date_fox[:-3]
+    date = dates.file_date(date_fox, DATE_FORMATS)
+    
+    # 3.B. entry parsing 
+
+    # featured in numbered list
+    pr_header = fox_soup.find(text='NBA POWER RANKINGS')
+
+    #pr_list = pr_header.select("ol")
+    pr_list = fox_soup.find_all('a', {'class':'entity-title'})
+
+    for index, team_fox in enumerate(pr_list):
+
+        # 3.B.i. team 
+        # uniform team naming across sources (use 'teams.nba_tmname()')
+        team_fox = team_fox.get_text().strip()
+        team = teams.nba_tmname(team_fox)
+
+        # 3.B.i.1a get team abbreviation (use 'teams.nba_abbrname()')
+        team_abbrev = teams.nba_abbrname(team)
+
+        # 3.B.ii. rank 
+        rank = index + 1
+
+        #ic(rank, team_abbrev)
+
+        # 3.B.iii comments
+        comm_fox = ""
+        comments = comm_fox
+
+        # 3.B.iv entryname 
+        entryname = make_entryname(source, str(date), team_abbrev)
+        
+        case = {
+            "entryname":entryname, 
+            "teamname":team, 
+            "ranking": rank,
+            "author": author,
+            "source": source,
+            "date": date, 
+            "url":URL,
+            "comments": comments
+        }
+        cases.append(case)
+    return(cases)
+
+# layout fingerprints: cheap checks on the parsed page that pick the right extractor up front
+def is_fox_ol_layout(soup):
+    """FOX layout with an `ol` following the 'NBA POWER RANKINGS' header."""
+    pr_header = soup.find(string='NBA POWER RANKINGS')
+    return pr_header is not None and pr_header.find_next("ol") is not None
+
+def is_fox_entity_layout(soup):
+    """FOX layout with `a.entity-title` team links."""
+    return soup.find('a', {'class':'entity-title'}) is not None
+
+# (fingerprint, extractor) pairs tried in order; `None` fingerprint always matches
+STRATEGIES = [(is_fox_ol_layout, get_fox_soup), (is_fox_entity_layout, get_fox_soup2)]
@@ -0,0 +1,98 @@
+# nba.py
+
+# NBA.com power rankings parser (www.nba.com); loaded by `Modules.sources.load_source('nba')`
+import Modules.date_parsing as dates
+import Modules.team_resolver as teams
+from Modules.sources import make_entryname, fetch_html, make_soup
+
+# elements `Modules.extract.targeted_soup()` keeps for this source's fingerprints and extractors
+XPATHS = [
+    "//p[contains(@class, '_authorName')]",
+    "//time",
+    "//div[contains(@class, 'ArticlePowerRankings_pr_')]",
+]
+
+# byline date formats, tried before `dateparser` (see `Modules.date_parsing.file_date()`)
+DATE_FORMATS = [
+    "%B %d, %Y %I:%M %p",
+    "%B %d, %Y",
+    "%b %d, %Y %I:%M %p",
+]
+
+# links on archive/index pages that lead to a power rankings article (`backfill_module.py`)
+ARTICLE_URL_PATTERN = r"^https?://(www\.)?nba\.com/news/[^?#]*power-rankings"
+ARTICLE_LINK_TEXT = None
+
+def get_nba_soup(URL, nba_soup=None):
+    cases = []
+    
+    if nba_soup is None:
+        nba_soup = make_soup(fetch_html(URL))
+
+    # `url` has already been defined
+    # 2C source
+    source = 'NBA'
+
+    # 3.A.i. author
+    # p with class starting with 'ArticleAuthor_authorName'
+    author = nba_soup.select_one('p[class*="_authorName"]').get_text()
+    
+    
+    # 3.A.ii. date (format '[Updated] October 28, 2024 10:21 AM')
+
+    date_nba = nba_soup.select_one('time').get_text(strip=True)
+    if "Updated " in date_nba:
+        date_nba=date_nba.split("Updated on ")[1]
+        date = dates.file_date(date_nba, DATE_FORMATS)
+
+    else:
+        date = dates.file_date(date_nba, DATE_FORMATS)
+
+
+    # 3.B. entry parsing
+    # entry header contained in div with class _starting_ `ArticlePowerRankings_pr`
+    nba_entries = nba_soup.select('div[class*="ArticlePowerRankings_pr_"]')
+    #print(nba_entries)
+    
+    for count, i in enumerate(nba_entries):
+        # 3.B.i. team
+        # ArticlePowerRankings_prTeam
+        team_nba = i.select_one('a[class*="ArticlePowerRankings_prTeam"]')
+        team_nba = team_nba.get_text(strip=True)
+    
+        # uniform team naming across sources (use 'teams.nba_tmname()')
+        team = teams.nba_tmname(team_nba)
+
+        # 3.B.i.1a get team abbreviation (use 'teams.nba_abbrname()')
+        team_abbrev = teams.nba_abbrname(team_nba)
+        
+        # 3.B.ii. rank just doing it via enumeration — NBA ranks low to hi (meaning most to least powerful)
+        rank = count +1
+
+        # 3.B.iii comments
+        """
+        # in following div with class _starting_ `ArticleContent_article__`
+        comments_nba = i.select('div[class*="ArticleContent_article__"]')
+        comments_nba = '\n'.join([graf.text for graf in comments_nba])
+        comments = comments_nba
+        """   
+        
+        # 3.B.iv entryname
+        entryname = make_entryname(source,date, team_abbrev)
+
+        
+        case = {
+            "entryname":entryname, 
+            "teamname":team, 
+            "ranking": rank,
+            "author": author,
+            "source": source,
+            "date": date, 
+            "url":URL,
+            #"comments": comments
+        }
+        cases.append(case)
+    return(cases)
+
+# (fingerprint, extractor) pairs tried in order; `None` fingerprint always matches
+STRATEGIES = [(None, get_nba_soup)]
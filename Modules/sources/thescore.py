@@ -0,0 +1,95 @@
+# thescore.py
+
+# theScore power rankings parser (www.thescore.com); loaded by `Modules.sources.load_source('thescore')`
+import Modules.date_parsing as dates
+import Modules.team_resolver as teams
+from Modules.sources import make_entryname, fetch_html, make_soup
+
+# elements `Modules.extract.targeted_soup()` keeps for this source's fingerprints and extractors
+XPATHS = [
+    "//time",
+    "//h3",
+]
+
+# byline date formats, tried before `dateparser` (see `Modules.date_parsing.file_date()`)
+DATE_FORMATS = [
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%d",
+]
+
+# links on archive/index pages that lead to a power rankings article (`backfill_module.py`)
+# (article URLs here carry only an id, so the link text has to say it)
+ARTICLE_URL_PATTERN = r"^https?://(www\.)?thescore\.com/nba/news/\d+"
+ARTICLE_LINK_TEXT = r"(?i)power rankings"
+
+def get_score_soup(URL, score_soup=None):
+
+    cases = []
+
+    if score_soup is None:
+        score_soup = make_soup(fetch_html(URL))
+
+
+    # `url` has already been defined
+    # 2C source 
+    source = 'Score'
+     
+    # 3.A.i. author 
+    author = 'Staff'
+
+    # 3.A.ii. date (format '12-Oct-24')
+    date_score = score_soup.find('time').get('datetime')
+    date = dates.file_date(date_score, DATE_FORMATS)
+    
+
+    # 3.B. entry parsing 
+
+    teams_split = score_soup.find_all('h3')
+   
+    for t in teams_split:
+        t1 = t.get_text()
+        t_split = t1.split('. ',1)
+    
+        # 3.B.ii. rank 
+        score_rank = t_split[0]
+        rank = score_rank
+    
+        # 3.B.i. team 
+        score_team = t_split[1].strip()
+        score_team = score_team.split(' (',1)[0].strip()
+        #print(team)
+        
+        # uniform team naming across sources
+        team = teams.nba_tmname(score_team)
+        #print(team)
+        
+        # 3.B.i.1a team_abbrev AND 3.B.i.1b team_abbrev cancel  
+        team_abbrev = teams.nba_abbrname(score_team)
+
+        # 3.B.iii comments
+        """
+        paragraphs = t.find_next_siblings('p', limit=2)
+        comments_score = '\n'.join([p.get_text() for p in paragraphs])
+        comments = comments_score
+        """
+        
+        # 3.B.iv entryname 
+        entryname = '_'.join([source, date, team_abbrev])
+        
+        case = {
+            "entryname":entryname, 
+            "teamname":team, 
+            "ranking": rank,
+            "author": author,
+            "source": source,
+            "date": date, 
+            "url":URL,
+            #"comments": comments
+        }
+        cases.append(case)
+    return(cases)
+
+# (fingerprint, extractor) pairs tried in order; `None` fingerprint always matches
+STRATEGIES = [(None, get_score_soup)]
@@ -0,0 +1,95 @@
+# team_resolver.py
+
+# Drop-in for `Modules.nba_teams.nba_tmname()` / `nba_abbrname()` in the scraper
+# hot loops. Built once from nba_teams_data.csv: exact dict lookups over
+# normalized names, abbreviations and aliases first, a token index second, and
+# the old substring match last; every answer is memoized.
+import csv
+import os
+import re
+from functools import lru_cache
+
+TEAMS_CSV = os.path.join(os.path.dirname(__file__), os.pardir,
+                         'Dash_Deploy', 'support', 'data', 'nba_teams_data.csv')
+
+
+def normalize(name):
+    """Lowercase, drop punctuation, and collapse whitespace ('L.A. Clippers' -> 'l a clippers')."""
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', str(name).lower()).split())
+
+
+def load_teams(path=TEAMS_CSV):
+    """Read team rows (teamname, abbrev, aliases, ...) from the reference CSV."""
+    with open(path, newline='') as csvfile:
+        return list(csv.DictReader(csvfile))
+
+
+def build_indexes(teams):
+    """Build exact-name and token -> team indexes (first team wins on a tie, as in the CSV order)."""
+    exact = {}
+    tokens = {}
+    for team in teams:
+        names = [team['teamname'], team['abbrev']] + team['aliases'].split(',')
+        for name in names:
+            key = normalize(name)
+            if key:
+                exact.setdefault(key, team)
+
+        for token in set(normalize(' '.join(names)).split()):
+            tokens.setdefault(token, []).append(team)
+
+    # only tokens naming a single team are useful ('los', 'angeles', 'new' are not)
+    tokens = {token: matches[0] for token, matches in tokens.items() if len(matches) == 1}
+    return exact, tokens
+
+
+TEAMS = load_teams()
+EXACT_INDEX, TOKEN_INDEX = build_indexes(TEAMS)
+
+# lowercased (aliases, teamname, abbrev) per team for the last-resort substring match
+_SEARCH_ROWS = [(team, (team['aliases'].lower(), team['teamname'].lower(), team['abbrev'].lower()))
+                for team in TEAMS]
+
+
+@lru_cache(maxsize=None)
+def resolve(query):
+    """Return the team row for a name in almost any form, or None."""
+    key = normalize(query)
+    if not key:
+        return None
+
+    # 1. exact name / abbreviation / alias
+    team = EXACT_INDEX.get(key)
+    if team is not None:
+        return team
+
+    # 2. every distinctive token agrees on one team ('Oklahoma City Thunder (50-10)')
+    matches = {TOKEN_INDEX[token]['teamname']: TOKEN_INDEX[token]
+               for token in key.split() if token in TOKEN_INDEX}
+    if len(matches) == 1:
+        return next(iter(matches.values()))
+
+    # 3. same rule as `nba_teams.find_team()`: first team with a column containing the query
+    query = str(query).lower()
+    for team, columns in _SEARCH_ROWS:
+        if any(query in column for column in columns):
+            return team
+    return None
+
+
+def find_team(query, property_name='teamname'):
+    """Return desired property_name for teamname query in almost any form."""
+    team = resolve(query)
+    if team is None:
+        return None
+    return team[property_name]
+
+
+def nba_tmname(query):
+    """Find full team name for NBA team."""
+    return find_team(query, 'teamname')
+
+
+def nba_abbrname(query):
+    """Find abbreviation for NBA team."""
+    return find_team(query, 'abbrev')
@@ -0,0 +1,208 @@
+# Backfill: crawl outlets' archive/index pages for past power rankings articles
+# and ingest them in chunks through `import_module`'s batch pipeline. Progress
+# is checkpointed to a JSON file, so an interrupted crawl picks up where it
+# stopped when run again with the same arguments.
+#
+#   python backfill_module.py seeds.json
+#   python backfill_module.py seeds.json --delay 2 --domain-delay espn.com=5
+#   python backfill_module.py seeds.json --mirror http://127.0.0.1:8000   # saved pages served locally
+#
+# seeds.json lists index pages per source (keys from `Modules.sources.SOURCE_MODULES`):
+#   {"espn": ["https://www.espn.com/nba/powerrankings/archive"],
+#    "nba": ["https://www.nba.com/news/category/power-rankings"]}
+#
+# With --mirror, every request for https://<host>/<path> goes to <mirror>/<host>/<path>,
+# so `python -m http.server --directory saved_pages` serves a folder of saved HTML
+# (e.g. saved_pages/www.espn.com/nba/powerrankings/archive) in place of the live sites.
+import argparse
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import import_module as im
+import Modules.batch_commit as batch_commit
+import Modules.entry_index as entry_index
+import Modules.extract as extract
+import Modules.response_cache as response_cache
+import Modules.sources as sources
+
+CHECKPOINT_FILE = 'Backfill_Checkpoint.json'
+CHUNK_SIZE = 20
+MAX_ATTEMPTS = 3
+
+
+class Checkpoint:
+    """Crawl state on disk: index pages already scanned and each discovered article's status."""
+
+    def __init__(self, path=CHECKPOINT_FILE):
+        self.path = path
+        self.state = {'indexes': {}, 'articles': {}}
+        if os.path.isfile(path):
+            with open(path, 'r') as checkpoint_file:
+                self.state.update(json.load(checkpoint_file))
+
+    def save(self):
+        """Write state atomically (a crash mid-write leaves the previous checkpoint intact)."""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as checkpoint_file:
+            json.dump(self.state, checkpoint_file, indent=1)
+        os.replace(tmp_path, self.path)
+
+    def index_done(self, url):
+        return url in self.state['indexes']
+
+    def mark_index(self, url, article_count):
+        self.state['indexes'][url] = article_count
+
+    def add_article(self, url, source):
+        """Record a discovered article (keeping its status if it is already known)."""
+        if url in self.state['articles']:
+            return False
+        self.state['articles'][url] = {'source': source, 'status': 'pending', 'attempts': 0}
+        return True
+
+    def pending_articles(self, max_attempts=MAX_ATTEMPTS):
+        """Articles not yet ingested that still have attempts left, in discovery order."""
+        return [url for url, article in self.state['articles'].items()
+                if article['status'] != 'done' and article['attempts'] < max_attempts]
+
+    def mark_article(self, url, ok):
+        article = self.state['articles'][url]
+        article['attempts'] += 1
+        article['status'] = 'done' if ok else 'failed'
+
+    def counts(self):
+        """Number of articles per status."""
+        counts = {}
+        for article in self.state['articles'].values():
+            counts[article['status']] = counts.get(article['status'], 0) + 1
+        return counts
+
+
+def load_seeds(path):
+    """Read {source: [index page URLs]} and drop sources without a parser."""
+    with open(path, 'r') as seeds_file:
+        seeds = json.load(seeds_file)
+
+    for source in list(seeds):
+        if source not in sources.SOURCE_MODULES:
+            print(f"Skipping seeds for '{source}': no parser for this source")
+            del seeds[source]
+    return seeds
+
+
+def find_articles(source, index_url, content):
+    """Return ranking article URLs linked from an index page, in page order."""
+    plugin = sources.load_source(source)
+    urls = [url for url, text in extract.page_links(content, index_url)
+            if sources.is_article_link(plugin, url, text)]
+    return list(dict.fromkeys(urls))
+
+
+def discover(seeds, checkpoint, max_fetchers=8):
+    """Scan every index page not yet scanned and add the articles it links to."""
+    todo = [(source, url) for source, urls in seeds.items() for url in urls if not checkpoint.index_done(url)]
+    print(f"Discovering articles on {len(todo)} index pages")
+
+    with ThreadPoolExecutor(max_workers=max_fetchers) as fetch_pool:
+        fetches = {fetch_pool.submit(im.fetch_html_limited, url): (source, url) for source, url in todo}
+        for future in as_completed(fetches):
+            source, index_url = fetches[future]
+            try:
+                content = future.result()
+            except Exception as e:
+                # left unmarked, so the next run tries this page again
+                print(f"Error: Could not fetch index {index_url}. Error message: ---{e}---")
+                continue
+
+            articles = find_articles(source, index_url, content)
+            added = sum(checkpoint.add_article(url, source) for url in articles)
+            checkpoint.mark_index(index_url, len(articles))
+            checkpoint.save()
+            print(f"--{index_url}: {len(articles)} articles ({added} new)")
+
+
+def already_ingested(rankings):
+    """Check whether every row of an article's rankings is in the snapshot log (committed now or by an earlier run)."""
+    index = entry_index.get_index()
+    return bool(rankings) and all(row['entryname'] in index for row in rankings)
+
+
+def ingest(checkpoint, chunk_size=CHUNK_SIZE, max_attempts=MAX_ATTEMPTS, max_fetchers=8):
+    """Fetch, parse and write pending articles chunk by chunk; return the last `writing_rankings()` result that wrote rows."""
+    pending = checkpoint.pending_articles(max_attempts)
+    print(f"Ingesting {len(pending)} articles in chunks of {chunk_size}")
+
+    written = None
+    for start in range(0, len(pending), chunk_size):
+        chunk = pending[start:start + chunk_size]
+        results = im.fetch_and_parse(chunk, max_fetchers)
+        rows = im.merge_rankings(chunk, results)
+
+        committed = []
+        if rows:
+            try:
+                outcome = im.writing_rankings(rows, confirm=False)
+            except batch_commit.WRITE_ERRORS as e:
+                # nothing was committed; stop so this chunk is retried next run
+                print(f"Error: Could not write chunk starting at article {start + 1} ({e}). Stopping backfill")
+                return written
+            # None: every article was rejected or already added, which is no reason to stop
+            if outcome is not None:
+                written = outcome
+                committed = outcome[1]
+
+        # rejected, unparsed or unfetched articles count as a failed attempt
+        for url in chunk:
+            checkpoint.mark_article(url, url in committed or already_ingested(results.get(url)))
+        checkpoint.save()
+        print(f"Checkpoint: {checkpoint.counts()}")
+
+    return written
+
+
+def parse_domain_delays(items):
+    """Turn ['espn.com=5', ...] into {'espn.com': 5.0, ...}."""
+    delays = {}
+    for item in items or []:
+        domain, _, seconds = item.partition('=')
+        delays[domain] = float(seconds)
+    return delays
+
+
+def parse_args(argv=None):
+    """Parse command line: seeds file, checkpoint, politeness and response cache options."""
+    parser = argparse.ArgumentParser(description="Backfill past power rankings from outlets' index pages.")
+    parser.add_argument('seeds', help="JSON file of {source: [index page URLs]}")
+    parser.add_argument('--checkpoint', default=CHECKPOINT_FILE, help="crawl state file (resumes if it exists)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="articles written per commit")
+    parser.add_argument('--max-attempts', type=int, default=MAX_ATTEMPTS, help="give up on an article after this many failures")
+    parser.add_argument('--max-fetchers', type=int, default=8, help="concurrent downloads")
+    parser.add_argument('--delay', type=float, default=1.0, help="minimum seconds between requests to one domain")
+    parser.add_argument('--domain-delay', action='append', metavar='DOMAIN=SECONDS', help="per-domain override of --delay")
+    parser.add_argument('--mirror', help="base URL serving saved pages as <mirror>/<host>/<path> instead of the live sites")
+    parser.add_argument('--publish', action='store_true', help="overwrite the Dash app's latest file when done")
+    parser.add_argument('--offline', action='store_true', help="replay cached responses only (no network)")
+    parser.add_argument('--cache-dir', default=response_cache.CACHE_DIR, help="response cache folder")
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    import Modules.scraper_http as http
+    http.configure(
+        cache=response_cache.ResponseCache(args.cache_dir),
+        offline=args.offline,
+        min_interval=args.delay,
+        domain_intervals=parse_domain_delays(args.domain_delay),
+        mirror=args.mirror,
+    )
+
+    checkpoint = Checkpoint(args.checkpoint)
+    discover(load_seeds(args.seeds), checkpoint, args.max_fetchers)
+    written = ingest(checkpoint, args.chunk_size, args.max_attempts, args.max_fetchers)
+
+    print(f"Backfill finished: {checkpoint.counts()}")
+    if args.publish and written:
+        im.overwrite_latest(written)
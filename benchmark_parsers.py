@@ -0,0 +1,118 @@
+# Benchmark: full BeautifulSoup tree vs. targeted extraction (Modules/extract.py)
+# for each source's parser, on saved HTML. Times cover the whole path a scrape
+# takes after download: building the tree, picking the layout strategy, and
+# running the extractor.
+#
+#   python benchmark_parsers.py                  # committed pages in tests/fixtures/pages/
+#   python benchmark_parsers.py --fixtures DIR   # saved pages named '<source>_*.html', e.g. 'espn_250312.html'
+#   python benchmark_parsers.py --cache          # every page in the response cache (Scrape_Cache/)
+import argparse
+import contextlib
+import io
+import os
+import time
+import tracemalloc
+
+import Modules.extract as extract
+import Modules.response_cache as response_cache
+import Modules.sources as sources
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'fixtures', 'pages')
+
+
+def load_cached_pages(cache_dir):
+    """Yield (source, label, content) for each page in the response cache."""
+    cache = response_cache.ResponseCache(cache_dir)
+    for url in cache.urls():
+        source = sources.source_key(url)
+        content = cache.read(url)
+        if content is not None:
+            yield source, url, content
+
+
+def load_fixture_pages(fixtures_dir):
+    """Yield (source, label, content) for each '<source>_*.html' file in fixtures_dir."""
+    for filename in sorted(os.listdir(fixtures_dir)):
+        if not filename.endswith('.html'):
+            continue
+        source = filename.split('_', 1)[0]
+        with open(os.path.join(fixtures_dir, filename), 'rb') as page_file:
+            yield source, filename, page_file.read()
+
+
+def run_parser(URL, plugin, content, make_tree):
+    """Build the tree with make_tree and run the plugin's matching extractor on it."""
+    page = make_tree(content)
+    extractor = sources.choose_strategy(plugin, page)
+    if extractor is None:
+        return []
+    with contextlib.redirect_stdout(io.StringIO()):
+        return extractor(URL, page)
+
+
+def best_time(fn, repeat):
+    """Best wall time of `repeat` runs, in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def peak_memory(fn):
+    """Peak Python allocations during one run, in KB."""
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def benchmark(pages, repeat=5):
+    """Print full vs. targeted parse-and-extract time and memory for each page, then per-source totals."""
+    totals = {}
+    print(f"{'source':<15}{'page':<40}{'rows':>5}{'full ms':>10}{'tgt ms':>9}{'speedup':>9}{'full KB':>10}{'tgt KB':>9}")
+
+    for source, label, content in pages:
+        if source not in sources.SOURCE_MODULES:
+            continue
+        plugin = sources.load_source(source)
+        make_targeted = lambda c: extract.targeted_soup(c, plugin.XPATHS)
+
+        # time/memory cover parsing plus extraction; rows are checked for parity
+        full = lambda: run_parser(label, plugin, content, sources.make_soup)
+        targeted = lambda: run_parser(label, plugin, content, make_targeted)
+
+        rows_full, rows_targeted = full(), targeted()
+        if [(r['teamname'], str(r['ranking'])) for r in rows_full] != [(r['teamname'], str(r['ranking'])) for r in rows_targeted]:
+            print(f"WARNING: targeted rows differ from full-tree rows for {label}")
+
+        full_ms, targeted_ms = best_time(full, repeat), best_time(targeted, repeat)
+        full_kb, targeted_kb = peak_memory(full), peak_memory(targeted)
+        print(f"{source:<15}{label[-39:]:<40}{len(rows_targeted):>5}{full_ms:>10.1f}{targeted_ms:>9.1f}"
+              f"{full_ms / targeted_ms:>8.1f}x{full_kb:>10.0f}{targeted_kb:>9.0f}")
+
+        total = totals.setdefault(source, [0, 0, 0, 0])
+        for i, value in enumerate((full_ms, targeted_ms, full_kb, targeted_kb)):
+            total[i] += value
+
+    print('-' * 107)
+    for source, (full_ms, targeted_ms, full_kb, targeted_kb) in totals.items():
+        print(f"{source:<15}{'(all pages)':<40}{'':>5}{full_ms:>10.1f}{targeted_ms:>9.1f}"
+              f"{full_ms / targeted_ms:>8.1f}x{full_kb:>10.0f}{targeted_kb:>9.0f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark full vs. targeted parsing per source.")
+    parser.add_argument('--fixtures', default=FIXTURES_DIR, help="folder of saved pages named '<source>_*.html'")
+    parser.add_argument('--cache', action='store_true', help="benchmark the response cache instead of fixtures")
+    parser.add_argument('--cache-dir', default=response_cache.CACHE_DIR, help="response cache folder (with --cache)")
+    parser.add_argument('--repeat', type=int, default=5, help="timed runs per page (best is reported)")
+    args = parser.parse_args()
+
+    if args.cache:
+        pages = load_cached_pages(args.cache_dir)
+    else:
+        pages = load_fixture_pages(args.fixtures)
+    benchmark(pages, args.repeat)
@@ -1,25 +1,29 @@
 # 1A. Dependencies
-from bs4 import BeautifulSoup
+# (bs4, lxml, dateparser and requests load lazily with the outlet plugin in `Modules/sources/`)
 from urllib.parse import urlparse
 from datetime import datetime as dt
-import dateparser
 import csv
-import requests
+import Modules.batch_commit as batch_commit
 import Modules.datemodule as datemod
-import Modules.nba_teams as teams
-import re
+import Modules.entry_index as entry_index
+import Modules.rankings_db as rankings_db
+import Modules.rankings_store as rankings_store
+import Modules.rankings_tables as rankings_tables
+import Modules.response_cache as response_cache
+import Modules.snapshot_meta as snapshot_meta
+import Modules.snapshots as snapshots
+import Modules.sources as sources
+import Modules.team_resolver as teams
 import os
-import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
 #import requests_cache
-import pandas as pd
 import sys
+import argparse
 
-# 1B. def `make_entryname()` function
-def make_entryname(source, date, team_abbrev):
-    """Create standardized entryname from source, date, and team_abbrev."""
-    entryname = '_'.join([source, date, team_abbrev])
-    return entryname
+# 1B. def `make_entryname()`, `fetch_html()`, `make_soup()` (shared with the source plugins)
+from Modules.sources import make_entryname, fetch_html, make_soup
 
 # 1C. def `record_entry()` function
 def record_entry(dest_list, entryname, source, author, date, url, team, rank, mode='print'):
@@ -50,659 +54,11 @@ def record_entry(dest_list, entryname, source, author, date, url, team, rank, mo
         print("Please specify mode")
         return None
 
-# 1D. Source-Specific Parsing Methods
-
-# 1Di
-
-def get_br_soup(URL):
-
-    cases = []
-    
-    response = requests.get(URL)
-    br_soup = BeautifulSoup(response.content, "lxml")
-
-    # source
-    source = 'BR'
-
-    #teams
-    br_teams = br_soup.find_all('h2')[1:]
-
-    
-    # 3.A.i. author
-    author = br_soup.select('span[class=name]')[0].text
-    
-    # 3.A.ii. date (use 'datemod.file_date' for standardized formatting)
-    date_br = br_soup.select('span[class*=date]')[0].text # returns format October 4, 2024
-    date = dateparser.parse(date_br)
-    
-    # 3.B. entry parsing
-    for t in br_teams:
-
-        # 3.B.i. team
-        team_br=t.text.split('. ')
-        if len(team_br) > 1:
-            team_br = team_br[1]
-        else:
-            continue
-        
-        # remove betting odds if present in team name
-        if '(' in team_br:
-            team_br = team_br.split(' (')[0]
-            #print(f"corrected teamname: {team}")
-        else:
-            team_br = team_br
-
-        # uniform team naming across sources (use 'teams.nba_tmname()')
-        team = teams.nba_tmname(team_br)
-
-        # 3.B.i.1a get team abbreviation (use 'teams.nba_abbrname()')
-        team_abbrev = teams.nba_abbrname(team_br)
-        
-        # 3.B.ii. rank
-        rank=t.text.split('. ', 1)[0]
-    
-        # 3.B.iii comments
-        """
-        text = t.find_next_siblings()
-        text = t.find_all("p") # need to join
-        text = t.find_next_siblings()
-        p_sib = text[1].find_all("p")
-        comm_br = '\n'.join(str(p.get_text()) for p in p_sib)
-        comments = comm_br
-        """
-
-        # 3.B.iv entryname
-        entryname = make_entryname(source,date, team_abbrev)
-
-        
-        case = {
-            "entryname":entryname, 
-            "teamname":team, 
-            "ranking": rank,
-            "author": author,
-            "source": source,
-            "date": date, 
-            "url":URL,
-            #"comments": comments
-            }
-        cases.append(case)
-    
-    return(cases)
-
-def get_br_soup2(URL):
-    """Extract power rankings information from new CBS Sports format (no table)."""
-    cases = []
-    
-
-    headers={"User-Agent": "Mozilla/5.0"}
-    response = requests.get(URL, headers=headers)
-    soup = BeautifulSoup(response.content, 'html.parser')
-    
-    # `source` has already been defined
-    source = 'BR'
-
-    # still works
-    # 3.A.i. author
-  
-    author = soup.find("span", {"id":"id/article/header/author"}).text
- 
-    #print(author)
-
-
-    # still works
-    # 3.A.ii. date (use 'datemod.file_date' for standardized formatting)
-
-    # 3.A.ii. date (use 'datemod.file_date' for standardized formatting)
-    date_br = soup.find("span", {"id":"id/article/header/post_date"}).get_text().strip()
-    date = datemod.file_date(date_br)
-
-
-    text_article = soup.find_all('span', class_=re.compile(r'small__headings__title__large'))
-
-    # 3.B. entry parsing
-    for section in text_article:
-        
-        entry_comment=[]
-        
-        section_break = section.get_text()
-    
-        try:
-            section_break = section_break.split(' (')[0] # removing the records (w-l)
-            section_break = section_break.split('. ') # splitting by period, giving up clean values for rank and team
-
-
-            # uniform team naming across sources (use 'teams.nba_tmname()')
-            team_br = section_break[1].strip()
-            team_br = teams.nba_tmname(team_br)
-            team = team_br
-            
-            # 3.B.i.1a get team abbreviation (use 'teams.nba_abbrname()')
-            team_abbrev = teams.nba_abbrname(team)
-        
-            # 3.B.ii. rank
-            rank_br = section_break[0].strip()
-            rank = int(rank_br)
-
-            # 3.B. iii comments
-            """
-            for each in section.find_next_siblings('div'):
-                each = each.text.strip()
-                if len(each) >= 2:
-                    entry_comment.append(each)
-                else:
-                    continue
-            
-            comments = entry_comment
-            """
-
-            entryname = make_entryname(source,date, team_abbrev)
-                    
-            case = {
-                "entryname":entryname, 
-                "teamname":team, 
-                "ranking": rank,
-                "author": author,
-                "source": source,
-                "date": date, 
-                "url":URL,
-                #"comments": comments
-                }
-            cases.append(case)
-        
-
-        except:
-            pass
-
-    return cases
-
-def get_cbs_soup(URL):
-
-    cases = []
-    
-    response = requests.get(URL)
-    cbs_soup = BeautifulSoup(response.content, "lxml") 
-    
-    cbs_table = cbs_soup.find('table', {"class":"table-power-rankings"})
-
-    # `url` has already been defined
-    source = 'CBS'
-
-    # 3.A.i. author
-    author = cbs_soup.find("a", {"class":"ArticleAuthor-name--link"}).text
-
-    # 3.A.ii. date (use 'datemod.file_date' for standardized formatting)
-    date_cbs = cbs_soup.find("time").text.strip()
-    date_cbs = ' '.join(date_cbs.split())
-    date = datemod.file_date(date_cbs)
-    
-    # 3.B. entry parsing
-    rows = cbs_table.select("tr")
-    
-    for r in rows[1:]:
-        # 3.B.i. team
-        team_cbs = r.find('span', {"class":"team-name"}).text.strip()
-        
-        # uniform team naming across sources (use 'teams.nba_tmname()')
-        team = teams.nba_tmname(team_cbs)
-
-        # 3.B.i.1a get team abbreviation (use 'teams.nba_abbrname()')
-        team_abbrev = teams.nba_abbrname(team)
-        
-        # 3.B.ii. rank
-        rank = r.find("span", {"class":"rank"}).text.strip()
-        
-        # 3.B. iii comments
-        #comm_cbs = r.find("td", {"class": "cell-left dek"}).text.strip()
-        #comments = comm_cbs
-
-
-        entryname = make_entryname(source,date, team_abbrev)
-
-        case = {
-            "entryname":entryname, 
-            "teamname":team, 
-            "ranking": rank,
-            "author": author,
-            "source": source,
-            "date": date, 
-            "url":URL,
-            #"comments": comments
-        }
-        cases.append(case)
-    return((cases))
-
-def get_cbs_soup2(URL):
-    """Extract power rankings information from new CBS Sports format (no table)."""
-    cases = []
-    
-
-    headers={"User-Agent": "Mozilla/5.0"}
-    response = requests.get(URL, headers=headers)
-    soup = BeautifulSoup(response.content, 'lxml')
-    
-    # `source` has already been defined
-    source = 'CBS'
-
-    # still works
-    # 3.A.i. author
-    author = soup.find("a", {"class":"ArticleAuthor-name--link"}).text
-
-
-    # still works
-    # 3.A.ii. date (use 'datemod.file_date' for standardized formatting)
-    date_cbs = soup.find("time").text.strip()
-    date_cbs = ' '.join(date_cbs.split()[:-1]) # excluding "ET"
-    date = datemod.file_date(date_cbs)
-
-    # 3.B. entry parsing
-    # in 2nd CBS format, article is nested in a div with class "Article-content"
-    article_div = soup.find_all('div', class_='Article-content')
-
-    # and power rankings are li in uls
-    lis = article_div[0].find_all('li')
-    lis = [li.text for li in lis]
-
-    for li in lis:
-        # rank will be followed by a '.', which will precede a space and a team ranking...
-        li = re.split(r'\. ', li)
-
-        if len(li) >= 2:
-            team_cbs = li[1].strip()
-            rank_cbs = li[0].strip()
-
-            # uniform team naming across sources (use 'teams.nba_tmname()')
-            team = teams.nba_tmname(team_cbs)
-            # 3.B.i.1a get team abbreviation (use 'teams.nba_abbrname()')
-            team_abbrev = teams.nba_abbrname(team)
-        
-            # 3.B.ii. rank
-            rank = int(rank_cbs)
-        
-            # 3.B. iii comments
-            # skipping this since each team doesnt get its own comments
-            """
-            comm_cbs = r.find("td", {"class": "cell-left dek"}).text.strip()
-            comments = comm_cbs
-            comments = ''
-            """
-
-            entryname = make_entryname(source,date, team_abbrev)
-
-            case = {
-                "entryname":entryname, 
-                "teamname":team, 
-                "ranking": rank,
-                "author": author,
-                "source": source,
-                "date": date, 
-                "url":URL,
-                #"comments": comments
-            }
-            cases.append(case)
-            #print(case)
-            
-        else:
-            continue
-
-    return(cases)
-
-def get_espn_soup(URL):
-
-    cases = []
-
-    headers={"User-Agent": "Mozilla/5.0"}
-    response = requests.get(URL, headers=headers)
-    espn_soup = BeautifulSoup(response.content, "lxml")
-    #print(espn_soup)
-
-    # `url` has already been defined
-    # 2C source
-    source = 'ESPN'
-
-    # 3.A.i. author
-    author = 'Staff'
-    
-    # 3.A.ii. date (format '12-Oct-24')
-    date_espn = espn_soup.find_all("span", class_="timestamp", string=lambda text: "ET" in text if text else False)
-    date_espn = date_espn[0].get_text(strip=True)
-    date = datemod.file_date(str(date_espn))
-
-    # 3.B. entry parsing
-    espn_teams = []
-    for p in espn_soup.find_all('p'):
-        text = p.text
-        if text and text[0].isdigit() and text.split()[1].isalpha():
-            text_split = text.split('. ', 1)
-
-            # 3.B.i. team
-            team_espn = text_split[1].strip()
-
-            # uniform team naming across sources (use 'teams.nba_tmname()')
-            team = teams.nba_tmname(team_espn)
-
-            # 3.B.i.1a get team abbreviation (use 'teams.nba_abbrname()')
-            team_abbrev = teams.nba_abbrname(team_espn)
-
-            # 3.B.ii. rank
-            rank = text_split[0].strip()
-            
-            # 3.B.iii comments
-            """
-            next_p = p.find_next_sibling("p").get_text()
-            comments_espn = next_p
-            comments = comments_espn
-            """
-
-            # 3.B.iv entryname
-            entryname = make_entryname(source,date, team_abbrev)
-
-            case = {
-                "entryname":entryname, 
-                "teamname":team, 
-                "ranking": rank,
-                "author": author,
-                "source": source,
-                "date": date, 
-                "url":URL,
-                #"comments": comments
-            }
-            cases.append(case)
-    #print(type(cases))
-    return(cases)
-
-def get_nba_soup(URL):
-    cases = []
-    
-    headers={"User-Agent": "Mozilla/5.0"}
-    response = requests.get(URL, headers=headers)
-    nba_soup = BeautifulSoup(response.content, "lxml")
-
-    # `url` has already been defined
-    # 2C source
-    source = 'NBA'
-
-    # 3.A.i. author
-    # p with class starting with 'ArticleAuthor_authorName'
-    author = nba_soup.select_one('p[class*="_authorName"]').get_text()
-    
-    
-    # 3.A.ii. date (format '[Updated] October 28, 2024 10:21 AM')
-
-    date_nba = nba_soup.select_one('time').get_text(strip=True)
-    if "Updated " in date_nba:
-        date_nba=date_nba.split("Updated on ")[1]
-        date = datemod.file_date(date_nba)
-
-    else:
-        date = datemod.file_date(date_nba)
-
-
-    # 3.B. entry parsing
-    # entry header contained in div with class _starting_ `ArticlePowerRankings_pr`
-    nba_entries = nba_soup.select('div[class*="ArticlePowerRankings_pr_"]')
-    #print(nba_entries)
-    
-    for count, i in enumerate(nba_entries):
-        # 3.B.i. team
-        # ArticlePowerRankings_prTeam
-        team_nba = i.select_one('a[class*="ArticlePowerRankings_prTeam"]')
-        team_nba = team_nba.get_text(strip=True)
-    
-        # uniform team naming across sources (use 'teams.nba_tmname()')
-        team = teams.nba_tmname(team_nba)
-
-        # 3.B.i.1a get team abbreviation (use 'teams.nba_abbrname()')
-        team_abbrev = teams.nba_abbrname(team_nba)
-        
-        # 3.B.ii. rank just doing it via enumeration — NBA ranks low to hi (meaning most to least powerful)
-        rank = count +1
-
-        # 3.B.iii comments
-        """
-        # in following div with class _starting_ `ArticleContent_article__`
-        comments_nba = i.select('div[class*="ArticleContent_article__"]')
-        comments_nba = '\n'.join([graf.text for graf in comments_nba])
-        comments = comments_nba
-        """   
-        
-        # 3.B.iv entryname
-        entryname = make_entryname(source,date, team_abbrev)
-
-        
-        case = {
-            "entryname":entryname, 
-            "teamname":team, 
-            "ranking": rank,
-            "author": author,
-            "source": source,
-            "date": date, 
-            "url":URL,
-            #"comments": comments
-        }
-        cases.append(case)
-    return(cases)
-
-def get_score_soup(URL):
-
-    cases = []
-
-    response = requests.get(URL)
-    score_soup = BeautifulSoup(response.content, "lxml")
-
-
-    # `url` has already been defined
-    # 2C source 
-    source = 'Score'
-     
-    # 3.A.i. author 
-    author = 'Staff'
-
-    # 3.A.ii. date (format '12-Oct-24')
-    date_score = score_soup.find('time').get('datetime')
-    date = datemod.file_date(date_score)
-    
-
-    # 3.B. entry parsing 
-
-    teams_split = score_soup.find_all('h3')
-   
-    for t in teams_split:
-        t1 = t.get_text()
-        t_split = t1.split('. ',1)
-    
-        # 3.B.ii. rank 
-        score_rank = t_split[0]
-        rank = score_rank
-    
-        # 3.B.i. team 
-        score_team = t_split[1].strip()
-        score_team = score_team.split(' (',1)[0].strip()
-        #print(team)
-        
-        # uniform team naming across sources
-        team = teams.nba_tmname(score_team)
-        #print(team)
-        
-        # 3.B.i.1a team_abbrev AND 3.B.i.1b team_abbrev cancel  
-        team_abbrev = teams.nba_abbrname(score_team)
-
-        # 3.B.iii comments
-        """
-        paragraphs = t.find_next_siblings('p', limit=2)
-        comments_score = '\n'.join([p.get_text() for p in paragraphs])
-        comments = comments_score
-        """
-        
-        # 3.B.iv entryname 
-        entryname = '_'.join([source, date, team_abbrev])
-        
-        case = {
-            "entryname":entryname, 
-            "teamname":team, 
-            "ranking": rank,
-            "author": author,
-            "source": source,
-            "date": date, 
-            "url":URL,
-            #"comments": comments
-        }
-        cases.append(case)
-    return(cases)
-
-def get_fox_soup(URL):
-
-    cases = []
-
-    headers={"User-Agent": "Mozilla/5.0"}
-    response = requests.get(URL, headers=headers)
-    #response = requests.get(URL)
-    fox_soup = BeautifulSoup(response.content, "lxml")
-    
-    #return fox_soup
-    teams_si = fox_soup.find_all('h2')
-    
-
-    # `url` has already been defined
-    # 2C source 
-    source = 'Fox'
-     
-    # 3.A.i. author 
-    #auth_si_class="link_13bb9r0"
-    author = fox_soup.find("div", {"class":'contributor-name'}).text.strip()
-
-    # 3.A.ii. date (format '241011')
-    div_tag = fox_soup.find("div", {"class":'info-text'})
-    date_fox = div_tag.find_all("span")[1]
-    #date = datemod.file_date(date_fox)
-    date_fox= date_fox.text.strip()[:-3]
-    #date = pd.to_datetime(date_fox)
-    date = datemod.file_date(date_fox)
-
-    # 3.B. entry parsing 
-
-    # featured in numbered list
-    pr_header = fox_soup.find(text='NBA POWER RANKINGS')
-    pr_list = pr_header.find_next("ol")
-    pr_list = pr_list.find_all('li')
-
-    for index, team_fox in enumerate(pr_list):
-
-        # 3.B.i. team 
-        # uniform team naming across sources (use 'teams.nba_tmname()')
-        team_fox = team_fox.get_text().strip()
-        team = teams.nba_tmname(team_fox)
-
-        # 3.B.i.1a get team abbreviation (use 'teams.nba_abbrname()')
-        team_abbrev = teams.nba_abbrname(team)
-
-        # 3.B.ii. rank 
-        rank = index + 1
-
-        # 3.B.iii comments
-        """comm_fox = ""
-        comments = comm_fox
-        """
-
-        # 3.B.iv entryname 
-        entryname = make_entryname(source, str(date), team_abbrev)
-        
-        case = {
-            "entryname":entryname, 
-            "teamname":team, 
-            "ranking": rank,
-            "author": author,
-            "source": source,
-            "date": date, 
-            "url":URL,
-            #"comments": comments
-        }
-        cases.append(case)
-    return(cases)
-
-def get_fox_soup2(URL):
-
-    cases = []
-
-    headers={"User-Agent": "Mozilla/5.0"}
-    response = requests.get(URL, headers=headers)
-    #response = requests.get(URL)
-    fox_soup = BeautifulSoup(response.content, "lxml")
-
-    #print(fox_soup)
-    #return fox_soup
-    
-    #return fox_soup
-    teams_fox = fox_soup.find_all('a', {"class": "entity-title"})
-
-    #print(teams_fox)
-    
-
-    # `url` has already been defined
-    # 2C source 
-    source = 'Fox'
-     
-    # 3.A.i. author 
-    #auth_si_class="link_13bb9r0"
-    author = fox_soup.find("div", {"class":'contributor-name'}).text.strip()
-
-    print(author)
-    # 3.A.ii. date (format '241011')
-    div_tag = fox_soup.find("div", {"class":'info-text'})
-    #ic(div_tag.text.strip())
-    #ic(div_tag)
-    date_fox = div_tag.find_all("span")[1].get_text().strip()
-    #date = datemod.file_date(date_fox)
-    date_fox= date_fox[:-3]
-    date = datemod.file_date(date_fox)
-    
-    # 3.B. entry parsing 
-
-    # featured in numbered list
-    pr_header = fox_soup.find(text='NBA POWER RANKINGS')
-
-    #pr_list = pr_header.select("ol")
-    pr_list = fox_soup.find_all('a', {'class':'entity-title'})
-
-    for index, team_fox in enumerate(pr_list):
-
-        # 3.B.i. team 
-        # uniform team naming across sources (use 'teams.nba_tmname()')
-        team_fox = team_fox.get_text().strip()
-        team = teams.nba_tmname(team_fox)
-
-        # 3.B.i.1a get team abbreviation (use 'teams.nba_abbrname()')
-        team_abbrev = teams.nba_abbrname(team)
-
-        # 3.B.ii. rank 
-        rank = index + 1
-
-        #ic(rank, team_abbrev)
-
-        # 3.B.iii comments
-        comm_fox = ""
-        comments = comm_fox
-
-        # 3.B.iv entryname 
-        entryname = make_entryname(source, str(date), team_abbrev)
-        
-        case = {
-            "entryname":entryname, 
-            "teamname":team, 
-            "ranking": rank,
-            "author": author,
-            "source": source,
-            "date": date, 
-            "url":URL,
-            "comments": comments
-        }
-        cases.append(case)
-    return(cases)
-
 def find_latest_file(folder_path,format=''):
     """Find most recent file in specified folder."""
     try:
         # Get all files in the folder
-        files = [f for f in os.listdir(folder_path) if os.path.isfile(os.path.join(folder_path, f))]
+        files = [f for f in os.listdir(folder_path) if os.path.isfile(os.path.join(folder_path, f)) and f.endswith('.csv')]
         
         if not files:
             return None  # Return None if no files are found
@@ -739,7 +95,7 @@ print(f"Today path: {get_today('file')}")
 
 def filename_already_exists(filename_input=get_today('file')):
     """Check if filename already exists"""
-    folder_path='Weekly_Powerrankings'
+    folder_path='Weekly_PowerRankings'
     file_path = find_latest_file(folder_path)
 
     filename_exists = filename_input == file_path
@@ -749,13 +105,31 @@ def filename_already_exists(filename_input=get_today('file')):
 def copy_and_rename(src_path, dest_path):
     """Copy and rename file to specified path."""
     # copy file
-    shutil.copy(src_path, dest_path)
+    batch_commit.copy_atomic(src_path, dest_path)
+    snapshot_meta.copy(src_path, dest_path)
     print(f"Successfully duplicated '{src_path}' and renamed to '{dest_path}'")
 
 def duplicate():
     #
     pass 
 
+_snapshots = None
+
+def get_snapshots():
+    """Get the Weekly_PowerRankings snapshot log, starting it from the newest full snapshot on first use."""
+    global _snapshots
+    if _snapshots is None:
+        log = snapshots.SnapshotLog('Weekly_PowerRankings')
+        if not log.initialized:
+            latest_file_path = find_latest_file('Weekly_PowerRankings', 'path')
+            if latest_file_path:
+                day = os.path.basename(latest_file_path)[:6]
+                log.init_from(latest_file_path, day if day.isdigit() else get_today())
+            else:
+                log.init_empty()
+        _snapshots = log
+    return _snapshots
+
 #if filename_already_exists(get_today('file')):
 #    # Pass
 #    pass
@@ -784,66 +158,31 @@ def duplicate():
 
 
 
-def get_rankings(URL):
-    """Input URL and then get rankings based on URL source."""
+def get_rankings(URL, content=None):
+    """Input URL (and optionally pre-fetched HTML) and then get rankings based on URL source."""
     dest = []
-    # 2C
-    source = urlparse(URL).netloc.split('.')[-2]
- 
-    if source == 'espn':
-        print(f"Source is {source}... now beginning sub-function")
-        soup = get_espn_soup(URL)
-    
-    elif source == 'bleacherreport':
-        print(f"Source is {source}... now beginning sub-function")
-        try:
-            soup = get_br_soup(URL)
-        
-        except Exception as e:
-            print(f"Error: Could not complete. Error message: ---{e}--- Trying method 2")
-            soup = get_br_soup2(URL)
-        
-    elif source == 'cbssports':
-        print(f"Source is {source}... now beginning sub-function")
-        try:
-            soup = get_cbs_soup(URL)
-
-        except Exception as e:
-            print(f"Error: Could not complete. Error message: ---{e}--- Trying method 2")
-            soup = get_cbs_soup2(URL)
-
-    elif source == 'si':
-        print(f"Source is {source}... Sports Illustrated not currently supported")
+    # 2C (unsupported domains stop here, before any plugin import or network call)
+    source = sources.check_source(URL)
+    if source is None:
         return None
 
-    elif source == 'theringer':
-        print(f"Source is {source}... The Ringer not currently supported")
-        return None
-    
-    elif source == 'yahoo':
-        print(f"Source is {source}... Yahoo not currently supported")
-        return None
-
-    elif source == 'thescore':
-        print(f"Source is {source}... now beginning sub-function")
-        soup = get_score_soup(URL)
+    print(f"Source is {source}... now beginning sub-function")
+    plugin = sources.load_source(source)
 
-    elif source == 'nba':
-        print(f"Source is {source}... now beginning sub-function")
-        soup = get_nba_soup(URL)
+    # fetch and parse once (only the elements this source reads); the page layout picks the extractor
+    if content is None:
+        content = fetch_html(URL)
+    import Modules.extract as extract
+    page = extract.targeted_soup(content, plugin.XPATHS)
 
-    elif source =='foxsports':
-        print(f"Source is {source}... now beginning sub-function")
-        try:
-            soup = get_fox_soup(URL)
-        
-        except:
-            soup = get_fox_soup2(URL)
-            
-    else: 
-        print('Source not yet defined')
+    extractor = sources.choose_strategy(plugin, page)
+    if extractor is None:
+        print(f"Error: {source} page layout not recognized by any parser")
         return None
 
+    print(f"Layout matches '{extractor.__name__}()'")
+    soup = extractor(URL, page)
+
     #print(type(soup))
     # Creating 'temp_dest'
     temp_dest =[]
@@ -860,6 +199,97 @@ def get_rankings(URL):
         dest.append(row)
     return dest
 
+#### BATCH INGEST ####
+    ## FETCH every URL concurrently (capped per host), PARSE each page in a process pool
+    ## as soon as its download lands, MERGE rows so one `writing_rankings()` call commits them all
+
+HOST_CONCURRENCY = 2
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+
+def read_url_list(url_inputs):
+    """Expand URL inputs, reading any file given as one URL per line."""
+    urls = []
+    for item in url_inputs:
+        if os.path.isfile(item):
+            with open(item, 'r') as url_file:
+                for line in url_file:
+                    line = line.strip()
+                    if line and not line.startswith('#'):
+                        urls.append(line)
+        else:
+            urls.append(item)
+
+    # drop repeats but keep input order
+    return list(dict.fromkeys(urls))
+
+def host_semaphore(URL):
+    """Get the shared semaphore limiting concurrent fetches to URL's host."""
+    host = urlparse(URL).netloc
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(HOST_CONCURRENCY)
+        return _host_semaphores[host]
+
+def fetch_html_limited(URL):
+    """Fetch URL while holding its host's concurrency slot."""
+    with host_semaphore(URL):
+        return fetch_html(URL)
+
+def fetch_and_parse(urls, max_fetchers=8, max_parsers=None):
+    """Fetch URLs concurrently and parse each in a process pool; return {URL: rankings} for the ones that worked."""
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=max_fetchers) as fetch_pool, \
+            ProcessPoolExecutor(max_workers=max_parsers) as parse_pool:
+        fetches = {fetch_pool.submit(fetch_html_limited, URL): URL for URL in urls}
+        parses = {}
+
+        for future in as_completed(fetches):
+            URL = fetches[future]
+            try:
+                content = future.result()
+            except Exception as e:
+                print(f"Error: Could not fetch {URL}. Error message: ---{e}---")
+                continue
+            parses[parse_pool.submit(get_rankings, URL, content)] = URL
+
+        for future in as_completed(parses):
+            URL = parses[future]
+            try:
+                results[URL] = future.result()
+            except Exception as e:
+                print(f"Error: Could not parse {URL}. Error message: ---{e}---")
+
+    return results
+
+def merge_rankings(urls, results):
+    """Merge rankings in input order, skipping sets already in the latest file (or earlier in this batch)."""
+    dest = []
+    seen = set()
+    index = entry_index.get_index()
+    index.sync(get_snapshots())
+    for URL in urls:
+        rankings = results.get(URL)
+        if not rankings:
+            continue
+        first_entryname = rankings[0]['entryname']
+        if first_entryname in seen or first_entryname in index:
+            print(f"Skipping {URL}: this set of rankings has already been added")
+            continue
+        seen.add(first_entryname)
+        dest.extend(rankings)
+    return dest
+
+def get_rankings_batch(urls, max_fetchers=8, max_parsers=None):
+    """Fetch URLs concurrently, parse them in a process pool, and merge rankings."""
+    urls = [URL for URL in urls if sources.check_source(URL)]
+    results = fetch_and_parse(urls, max_fetchers, max_parsers)
+    dest = merge_rankings(urls, results)
+
+    print(f"Collected {len(dest)} rows from {len(urls)} URLs")
+    return dest
+
 def count_csv_rows(file_path):
     """Count rows in CSV file."""
     try:
@@ -887,92 +317,135 @@ def entry_occurrences_in_file(file_path, entryname):
         print(f"An error occurred: {e}")
         return 0
 
-def append_rows(dest, dest_filename):
-    """Append rows to CSV."""
+def append_rows(dest, log, confirm=True):
+    """Validate rows per article, then append them to the read models and today's delta of the snapshot log (asking first unless confirm=False).
+
+    Returns the URLs whose rows were committed (empty if nothing valid and new, or canceled);
+    a failed write raises (one of `batch_commit.WRITE_ERRORS`) instead of committing part of the batch.
+    """
+    dest_filename = f"{log.folder} ({get_today()} delta)"
     fieldnames = ['entryname', 'source', 'author', 'date', 'url', 'teamname', 'ranking']
     #fieldnames = ['entryname', 'source', 'author', 'date', 'url', 'teamname', 'ranking', 'comments']
-    input_conf = input (f"{'-'*30}\nAppend {len(dest)} rows to destination: {dest_filename}? Y/N  ")
+    if confirm:
+        input_conf = input (f"{'-'*30}\nAppend {len(dest)} rows to destination: {dest_filename}? Y/N  ")
+    else:
+        input_conf = 'y'
+
     #print(input_conf)
     if  input_conf.lower() in ("y", "yes"):
-        # Check if dest is already in ranking file (by entryname)
-        first_entryname = (dest[0]['entryname'])
-        if entry_occurrences_in_file(find_latest_file('Weekly_PowerRankings','path'), first_entryname) != 0:
+        # Only complete, well-formed articles are committed
+        dest, rejected = batch_commit.validate_rankings(dest)
+        for url, problems in rejected.items():
+            print(f"\nATTENTION:\nRejected {url}: {'; '.join(problems)}")
+        if not dest:
+            print('\nNo valid rankings to append')
+            return []
+
+        # Check every row against the entryname index (set lookups, no rescan of the file)
+        index = entry_index.get_index()
+        index.sync(log)
+        new_rows, duplicates = index.new_rows(dest)
+        if not new_rows:
             print('\nATTENTION:\nThis set of rankings has already been added')
-            return 0
-            
-        else:
-            with open(dest_filename, 'a') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writerows(dest)
-                print(f"Successfully appended {len(dest)} rows to '{dest_filename}'\n{'-'*30}")
-            return 1
+            return []
+        if duplicates:
+            print(f"\nATTENTION:\nSkipping {len(duplicates)} rows already added: {', '.join(sorted({row['entryname'] for row in duplicates}))}")
+
+        # read models first: both skip rows they already hold, so if a later write fails
+        # the whole batch can simply be retried; the snapshot log (and entry index) last
+        # normalized articles/teams/ranks tables the Dash apps load (only once they have been built)
+        try:
+            written = rankings_tables.append(new_rows)
+            if written is not None:
+                print(f"Wrote {written} rows to the rankings tables")
+        except batch_commit.WRITE_ERRORS as e:
+            print(f"Error: Could not update rankings tables ({e}); nothing was committed. "
+                  f"If this persists, rebuild them from `python -m Modules.snapshots --export` with `python -m Modules.rankings_tables --rebuild`")
+            raise
+
+        # partitioned Parquet store the Dash apps read first (only this batch's partitions are written)
+        try:
+            written = rankings_store.append(new_rows)
+            if written is not None:
+                print(f"Wrote {written} rows to the rankings store")
+        except batch_commit.WRITE_ERRORS as e:
+            print(f"Error: Could not update rankings store ({e}); nothing was committed. "
+                  f"If this persists, rebuild it from `python -m Modules.snapshots --export` with `python -m Modules.rankings_store --rebuild`")
+            raise
+
+        # optional indexed database for the dashboards (only if it has been built)
+        try:
+            if rankings_db.append(new_rows) is not None:
+                print(f"Wrote {len(new_rows)} rows to the rankings database")
+        except batch_commit.WRITE_ERRORS as e:
+            print(f"Error: Could not update rankings database ({e}); nothing was committed. "
+                  f"If this persists, rebuild it from `python -m Modules.snapshots --export` with `python -m Modules.rankings_db --rebuild`")
+            raise
+
+        index.append(new_rows, log, get_today(), fieldnames)
+        print(f"Successfully appended {len(new_rows)} rows to '{dest_filename}'\n{'-'*30}")
+        return list(dict.fromkeys(row['url'] for row in new_rows))
         #print(f"Successfully appended {len(dest)} rows to '{dest_filename}'\n\n'{dest_filename}' now has {count_csv_rows('250313_powrrankings.csv')} rows\n{'-'*30}")
     else:
         print('Operation canceled')
-        return 0
+        return []
         
 
-def writing_rankings(rankings):
-    filename = get_today('file')
-    filepath = get_today('path')
+def writing_rankings(rankings, confirm=True):
+    """Commit rankings to the snapshot log; return (log, committed URLs), or None if nothing was written."""
+    # today's rows go to a delta file; the manifest knows the full snapshot (no daily copy)
+    log = get_snapshots()
 
-    if not filename_already_exists(filename):
-        latest_file_path = find_latest_file('Weekly_PowerRankings', 'path')
-        if latest_file_path:
-            if os.path.isfile(latest_file_path) and os.access(latest_file_path, os.R_OK):
-                copy_and_rename(latest_file_path, filepath)
-            else:
-                print(f"Error: '{latest_file_path}' is not accessible or readable.")
-        else:
-            print("No latest file found to copy.")
-            return
-
-    b = append_rows(rankings, filepath)
-    if b == 0:
+    b = append_rows(rankings, log, confirm)
+    if not b:
         print(f'\nNo rankings to write')
         return
     else:
-        row_count = int(count_csv_rows(filepath)-1)
-        power_rankings_count = row_count / 30
+        meta = log.meta
+        row_count = meta['rows']
+        power_rankings_count = snapshot_meta.set_count(meta)
         #print(f"File '{filename}' now has {count_csv_rows(filepath)} entries, or {power_rankings_count} power rankings")
-        print(f"File '{filename}' now has {row_count} entries, or {power_rankings_count} power rankings")
-        return filepath, b
+        print(f"Snapshot log '{log.folder}' now has {row_count} entries, or {power_rankings_count} power rankings")
+        log.compact_if_due()
+        return log, b
 
 
 
 #writing_rank
 
-def overwrite_latest(new_file):
-    """Overwrite Latest PR File with specified file."""
+def overwrite_latest(new_file, confirm=True):
+    """Overwrite Latest PR File with the current snapshot (asking first in a terminal unless confirm=False)."""
     try:
-        filepath, confirmation = new_file
+        log, confirmation = new_file
     except TypeError:
         try:
-            filepath = new_file
+            log = new_file
             confirmation = None
         
         except:
             print(f'\nNo file to overwrite\n\nEnding operation\n{"-"*40}')
             return
 
-    if confirmation == 0:
+    if not confirmation or log is None:
         print(f'\nNo file to overwrite\n\nEnding operation\n{"-"*40}')
         return
 
     latest_filename = 'Dash_Deploy/support/data/latest_powerrankings.csv'
 
-    # Validate the source file
-    if not os.path.isfile(filepath):
-        raise ValueError(f"The path {filepath} is not a valid file.")
+    # Validate the snapshot log
+    if not log.initialized:
+        raise ValueError(f"No snapshot log in {log.folder}.")
 
     # Validate the destination directory
     if not os.path.exists(os.path.dirname(latest_filename)):
         raise ValueError(f"The directory for {latest_filename} does not exist.")
 
-    # Count rows in both files
+    # Count rows in both (the log's manifest carries its metadata)
     try:
-        rows_outcome = count_csv_rows(latest_filename)-1
-        rows_new = count_csv_rows(filepath)-1
+        meta_outcome = snapshot_meta.load(latest_filename)
+        meta_new = log.meta
+        rows_outcome = meta_outcome['rows']
+        rows_new = meta_new['rows']
     except Exception as e:
         print(f'\nError counting rows: {e}\n\nEnding operation\n{"-"*40}')
         return
@@ -983,21 +456,22 @@ def overwrite_latest(new_file):
         return
 
     # Interactive confirmation
-    if sys.stdin.isatty():  # True if running in a terminal
+    if confirm and sys.stdin.isatty():  # True if running in a terminal
         confirmation = input(
-            f"Overwrite '{latest_filename}' ({rows_outcome} rows; {rows_outcome / 30:.2f} PR sets) "
-            f"with '{filepath}' ({rows_new} rows; {rows_new / 30:.2f} PR sets)? Y/N: "
+            f"Overwrite '{latest_filename}' ({rows_outcome} rows; {snapshot_meta.set_count(meta_outcome)} PR sets) "
+            f"with snapshot log '{log.folder}' ({rows_new} rows; {snapshot_meta.set_count(meta_new)} PR sets)? Y/N: "
         )
         if confirmation.lower() not in ('yes', 'y'):
             print("Aborted. Confirmation not received.")
             return
 
-    # Overwrite the file
-    shutil.copyfile(filepath, latest_filename)
+    # Overwrite the file (base + deltas written to a temp file, then renamed)
+    log.materialize(latest_filename)
+    snapshot_meta.save(latest_filename, dict(meta_new))
     print(
-        f"Confirmed\n'{filepath}' has overwritten '{latest_filename}'\n"
-        f"'{latest_filename}' had {rows_outcome} rows but now contains {count_csv_rows(latest_filename)-1} rows "
-        f"or {int((count_csv_rows(latest_filename) - 1) / 30)} complete PR sets."
+        f"Confirmed\nSnapshot log '{log.folder}' has overwritten '{latest_filename}'\n"
+        f"'{latest_filename}' had {rows_outcome} rows but now contains {meta_new['rows']} rows "
+        f"or {snapshot_meta.set_count(meta_new)} PR sets (latest {meta_new['max_date']})."
     )
 
 
@@ -1005,17 +479,59 @@ def overwrite_latest(new_file):
 #writing_rankings(get(rankgi))
 
 
-def main(URL_input):
-    return overwrite_latest(writing_rankings(get_rankings(URL_input)))
+def main(URL_input, confirm=True):
+    rankings = get_rankings(URL_input)
+    if not rankings:
+        print(f'\nNo rankings to write')
+        return
+    return overwrite_latest(writing_rankings(rankings, confirm), confirm)
     #return writing_rankings(get_rankings(URL_input))
     #print(writing_rankings(get_rankings('https://www.espn.com/nba/story/_/page/nbapowerrankings44254378/nba-power-rankings-30-teams-less-month-regular-season')))
     #return get_rankings(URL_input)
 
+def main_batch(URL_inputs, confirm=True):
+    """Ingest several URLs (or files of URLs) and commit them in a single write."""
+    rankings = get_rankings_batch(read_url_list(URL_inputs))
+    if not rankings:
+        print(f'\nNo rankings to write')
+        return
+    return overwrite_latest(writing_rankings(rankings, confirm), confirm)
+
+
+def parse_args(argv=None):
+    """Parse command line: URL(s) or URL file(s), plus response cache options."""
+    parser = argparse.ArgumentParser(description="Scrape NBA power rankings into the weekly file.")
+    parser.add_argument('urls', nargs='+', help="article URL(s), or file(s) listing one URL per line")
+    parser.add_argument('--yes', action='store_true',
+                        help="commit without prompts (each article must pass validation)")
+    parser.add_argument('--offline', action='store_true', help="replay cached responses only (no network)")
+    parser.add_argument('--cache-dir', default=response_cache.CACHE_DIR, help="response cache folder")
+    parser.add_argument('--cache-max-mb', type=int, default=response_cache.MAX_BYTES // (1024 * 1024),
+                        help="response cache eviction budget in MB")
+    return parser.parse_args(argv)
+
 
 if __name__ == '__main__':
     #print(get_rankings('https://www.espn.com/nba/story/_/page/nbapowerrankings44254378/nba-power-rankings-30-teams-less-month-regular-season'))
 
-    if len(sys.argv) >=1:
-        main(sys.argv[1])
-    else:
-        print("Please provide a url")
\ No newline at end of file
+    args = parse_args()
+
+    # unsupported domains are rejected before the HTTP stack or any parser is imported
+    urls = [URL for URL in read_url_list(args.urls) if sources.check_source(URL)]
+    if not urls:
+        sys.exit(1)
+
+    import Modules.scraper_http as http
+    http.configure(
+        cache=response_cache.ResponseCache(args.cache_dir, args.cache_max_mb * 1024 * 1024),
+        offline=args.offline,
+    )
+
+    # several URLs, or a file listing URLs, run as one batch
+    try:
+        if len(urls) > 1 or os.path.isfile(args.urls[0]):
+            main_batch(urls, confirm=not args.yes)
+        else:
+            main(urls[0], confirm=not args.yes)
+    except batch_commit.WRITE_ERRORS:
+        sys.exit(1)
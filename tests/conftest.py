@@ -0,0 +1,87 @@
+# conftest.py
+
+# Put the repo root on sys.path so tests import `Modules` the way the scrapers do,
+# and share a few builders for ranking rows.
+import csv
+import os
+import sys
+import types
+from datetime import date
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# the Dash apps import their helpers as `support.*` from the deploy root
+sys.path.insert(1, os.path.join(ROOT, 'Dash_Deploy'))
+
+# `import_module` takes today's 'YYMMDD' from `Modules/datemodule.py`, which isn't in the tree
+try:
+    import Modules.datemodule  # noqa: F401
+except ImportError:
+    datemodule = types.ModuleType('Modules.datemodule')
+    datemodule.file_date = lambda: date.today().strftime('%y%m%d')
+    sys.modules['Modules.datemodule'] = datemodule
+
+FIELDNAMES = ['entryname', 'source', 'author', 'date', 'url', 'teamname', 'ranking']
+TEAMS_CSV = os.path.join(ROOT, 'Dash_Deploy', 'support', 'data', 'nba_teams_data.csv')
+
+
+def read_teams():
+    with open(TEAMS_CSV, newline='') as csvfile:
+        return [(row['teamname'], row['abbrev']) for row in csv.DictReader(csvfile)][:30]
+
+
+def article_rows(url, date='250310', source='ESPN', author='Staff'):
+    """One complete, valid article: 30 teams ranked 1-30."""
+    return [{'entryname': f"{source}_{date}_{abbrev}", 'source': source, 'author': author, 'date': date,
+             'url': url, 'teamname': teamname, 'ranking': str(rank)}
+            for rank, (teamname, abbrev) in enumerate(read_teams(), 1)]
+
+
+def write_csv(path, rows):
+    with open(path, 'w', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+@pytest.fixture
+def history_csv(tmp_path):
+    """A rankings CSV holding one article, as `--rebuild` takes."""
+    path = tmp_path / 'latest_powerrankings.csv'
+    write_csv(path, article_rows('https://www.espn.com/nba/story/_/id/1/power-rankings', date='250303'))
+    return str(path)
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch, history_csv):
+    """Run import_module in tmp_path: a snapshot log started from history_csv, plus built tables, store and database there."""
+    import Modules.entry_index as entry_index
+    import Modules.rankings_db as rankings_db
+    import Modules.rankings_store as rankings_store
+    import Modules.rankings_tables as rankings_tables
+    import import_module
+
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('Weekly_PowerRankings')
+    os.replace(history_csv, os.path.join('Weekly_PowerRankings', '250303_powerrankings.csv'))
+
+    tables_dir, db_path = str(tmp_path / 'tables'), str(tmp_path / 'rankings.sqlite3')
+    store_dir = str(tmp_path / 'store')
+    base = os.path.join('Weekly_PowerRankings', '250303_powerrankings.csv')
+    rankings_tables.rebuild(base, tables_dir)
+    rankings_db.rebuild(base, db_path)
+    rankings_store.RankingsStore(store_dir).rebuild(base)
+
+    append_tables, append_db, append_store = rankings_tables.append, rankings_db.append, rankings_store.append
+    monkeypatch.setattr(rankings_tables, 'append', lambda rows: append_tables(rows, tables_dir))
+    monkeypatch.setattr(rankings_db, 'append', lambda rows: append_db(rows, db_path))
+    monkeypatch.setattr(rankings_store, 'append', lambda rows: append_store(rows, store_dir))
+    monkeypatch.setattr(import_module, '_snapshots', None)
+    monkeypatch.setattr(entry_index, '_index', None)
+
+    yield types.SimpleNamespace(root=tmp_path, tables_dir=tables_dir, db_path=db_path, store_dir=store_dir)
+
+    if entry_index._index is not None:
+        entry_index._index.close()
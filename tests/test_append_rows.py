@@ -0,0 +1,62 @@
+# test_append_rows.py
+
+# import_module.append_rows commits a batch to every store or to none: a failed
+# read-model write raises before the snapshot log is touched, and the retry
+# then writes each row exactly once.
+import csv
+import sqlite3
+
+import pytest
+
+import Modules.rankings_store as rankings_store
+import Modules.rankings_tables as rankings_tables
+import import_module
+from conftest import article_rows
+
+URL = 'https://www.espn.com/nba/story/_/id/2/power-rankings'
+
+
+def db_count(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM rankings").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def ranks_count(tables_dir):
+    with open(rankings_tables.table_path('ranks', tables_dir, '2024-25'), newline='') as csvfile:
+        return sum(1 for _ in csv.DictReader(csvfile))
+
+
+def store_count(store_dir):
+    return sum(part['rows'] for part in rankings_store.RankingsStore(store_dir).manifest['partitions'])
+
+
+def test_failed_read_model_write_fails_commit(workspace, monkeypatch):
+    log = import_module.get_snapshots()
+    rows_before = log.meta['rows']
+
+    def broken_db(rows):
+        raise sqlite3.OperationalError("database is locked")
+    append_db = import_module.rankings_db.append
+    monkeypatch.setattr(import_module.rankings_db, 'append', broken_db)
+
+    with pytest.raises(sqlite3.OperationalError):
+        import_module.append_rows(article_rows(URL), log, confirm=False)
+    assert log.meta['rows'] == rows_before
+    assert db_count(workspace.db_path) == 30
+
+    # the retry commits everything once (the tables and store already took the rows last time)
+    monkeypatch.setattr(import_module.rankings_db, 'append', append_db)
+    assert import_module.append_rows(article_rows(URL), log, confirm=False)
+    assert log.meta['rows'] == rows_before + 30
+    assert db_count(workspace.db_path) == 60
+    assert ranks_count(workspace.tables_dir) == 60
+    assert store_count(workspace.store_dir) == 60
+
+
+def test_nothing_new_is_not_an_error(workspace):
+    log = import_module.get_snapshots()
+    assert import_module.append_rows(article_rows(URL), log, confirm=False)
+    assert not import_module.append_rows(article_rows(URL), log, confirm=False)
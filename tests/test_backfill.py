@@ -0,0 +1,102 @@
+# test_backfill.py
+
+# Backfill against a local stand-in for espn.com (the `--mirror` layout): a
+# chunk whose write fails stops the run without checkpointing it, and the next
+# run resumes from that chunk. Articles already in the log count as done;
+# articles that fail validation count as failed attempts.
+import os
+import sqlite3
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import backfill_module as backfill
+import Modules.rankings_db as rankings_db
+import Modules.response_cache as response_cache
+import Modules.scraper_http as http
+from conftest import read_teams
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'pages', 'espn_250312.html')
+INDEX_URL = 'https://www.espn.com/nba/powerrankings/archive'
+ARTICLE_URL = 'https://www.espn.com/nba/story/_/id/{}/nba-power-rankings'
+
+# (article id, byline date, teams listed): 250303 is already in the history CSV, 250317 is missing a team
+ARTICLES = [
+    (1, 'Mar 3, 2025', 30),
+    (2, 'Mar 10, 2025', 30),
+    (3, 'Mar 17, 2025', 29),
+    (4, 'Mar 24, 2025', 30),
+    (5, 'Mar 31, 2025', 30),
+]
+
+
+def espn_page(byline, team_count):
+    """The fixture article with its byline date replaced and only the first team_count teams ranked."""
+    with open(FIXTURE, encoding='utf-8') as page_file:
+        page = page_file.read().replace('Mar 12, 2025', byline)
+    body = ''.join(f'<p>{rank}. {teamname}</p>' for rank, (teamname, _) in enumerate(read_teams()[:team_count], 1))
+    start, end = page.index('<p>1. '), page.index('</article>')
+    return page[:start] + body + page[end:]
+
+
+@pytest.fixture
+def espn_mirror(tmp_path):
+    """Serve saved pages as <mirror>/<host>/<path>, like `python -m http.server` in the module docs."""
+    site = tmp_path / 'mirror' / 'www.espn.com'
+    (site / 'nba' / 'powerrankings').mkdir(parents=True)
+    links = ''.join(f'<a href="{ARTICLE_URL.format(n)}">Week {n}</a>' for n, _, _ in ARTICLES)
+    (site / 'nba' / 'powerrankings' / 'archive').write_text(f'<html><body>{links}</body></html>')
+    for n, byline, team_count in ARTICLES:
+        folder = site / 'nba' / 'story' / '_' / 'id' / str(n)
+        folder.mkdir(parents=True)
+        (folder / 'nba-power-rankings').write_text(espn_page(byline, team_count), encoding='utf-8')
+
+    handler = partial(SimpleHTTPRequestHandler, directory=str(tmp_path / 'mirror'))
+    handler.log_message = lambda *args: None
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def statuses(checkpoint):
+    return [(article['status'], article['attempts']) for article in checkpoint.state['articles'].values()]
+
+
+def test_resume_after_interrupted_chunk(workspace, espn_mirror, monkeypatch):
+    monkeypatch.setattr(http, '_client', None)
+    http.configure(retries=0, backoff=0, mirror=espn_mirror,
+                   cache=response_cache.ResponseCache(str(workspace.root / 'cache')))
+    checkpoint_path = str(workspace.root / 'checkpoint.json')
+
+    # the database write of the fourth chunk fails
+    append_db = rankings_db.append
+    writes = []
+
+    def flaky_db(rows):
+        writes.append(rows)
+        if len(writes) == 2:
+            raise sqlite3.OperationalError("disk I/O error")
+        return append_db(rows)
+    monkeypatch.setattr(rankings_db, 'append', flaky_db)
+
+    checkpoint = backfill.Checkpoint(checkpoint_path)
+    backfill.discover({'espn': [INDEX_URL]}, checkpoint)
+    backfill.ingest(checkpoint, chunk_size=1)
+
+    # 1: already in history (nothing new, still done); 2: written; 3: rejected; 4: write failed -> stopped
+    assert statuses(backfill.Checkpoint(checkpoint_path)) == [('done', 1), ('done', 1), ('failed', 1), ('pending', 0), ('pending', 0)]
+
+    # the next run resumes with the interrupted chunk
+    monkeypatch.setattr(rankings_db, 'append', append_db)
+    resumed = backfill.Checkpoint(checkpoint_path)
+    backfill.discover({'espn': [INDEX_URL]}, resumed)
+    backfill.ingest(resumed, chunk_size=1, max_attempts=1)
+
+    assert statuses(resumed) == [('done', 1), ('done', 1), ('failed', 1), ('done', 1), ('done', 1)]
+    log = backfill.im.get_snapshots()
+    assert log.meta['rows'] == 30 * 4
+    assert sorted({row['date'] for row in log.iter_rows()}) == ['250303', '250310', '250324', '250331']
@@ -0,0 +1,34 @@
+# test_extract.py
+
+# Targeted extraction must give each source's extractor the same rows as a
+# full-page soup, on the committed fixture pages `benchmark_parsers.py` times.
+import contextlib
+import io
+import os
+
+import pytest
+
+import Modules.extract as extract
+import Modules.sources as sources
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'pages')
+PAGES = sorted(name for name in os.listdir(FIXTURES_DIR) if name.endswith('.html'))
+
+
+def extract_rows(plugin, page):
+    extractor = sources.choose_strategy(plugin, page)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return extractor('https://example.com/power-rankings', page)
+
+
+@pytest.mark.parametrize('filename', PAGES)
+def test_targeted_rows_match_full_tree(filename):
+    plugin = sources.load_source(filename.split('_', 1)[0])
+    with open(os.path.join(FIXTURES_DIR, filename), 'rb') as page_file:
+        content = page_file.read()
+
+    full = extract_rows(plugin, sources.make_soup(content))
+    targeted = extract_rows(plugin, extract.targeted_soup(content, plugin.XPATHS))
+
+    assert len(full) == 30
+    assert targeted == full
@@ -0,0 +1,116 @@
+# test_module_drift.py
+
+# `Modules/` (scraper, stdlib) and `Dash_Deploy/support/` (apps, pandas) each
+# have their own seasons, rankings_tables, rankings_store and rankings_db module, because the
+# deploy only ships Dash_Deploy/. They must agree: whatever the scraper
+# writes, the apps have to read back unchanged, on the same season calendar.
+import csv
+import os
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+import Modules.rankings_db as write_db
+import Modules.rankings_store as write_store
+import Modules.rankings_tables as write_tables
+import Modules.seasons as write_seasons
+import support.rankings_db as read_db
+import support.rankings_store as read_store
+import support.rankings_tables as read_tables
+import support.seasons as read_seasons
+from conftest import article_rows, write_csv
+
+SEASONS = list(write_seasons.week_one_sundays())
+
+
+@pytest.fixture
+def two_seasons_csv(tmp_path):
+    path = tmp_path / 'rankings.csv'
+    write_csv(path, article_rows('https://www.espn.com/a', date='240115')
+              + article_rows('https://www.cbssports.com/b', date='241104', source='CBS', author='Writer')
+              + article_rows('https://www.espn.com/c', date='250310'))
+    with open(path, newline='') as csvfile:
+        return str(path), list(csv.DictReader(csvfile))
+
+
+def expected_frame(rows):
+    """(source, author, date, url, teamname, ranking) of CSV rows, sorted."""
+    return sorted((r['source'], r['author'], pd.Timestamp(write_seasons.parse_file_date(r['date'])),
+                   r['url'], r['teamname'], int(r['ranking'])) for r in rows)
+
+
+def test_both_sides_use_the_same_files():
+    assert os.path.samefile(write_seasons.SEASONS_CSV, read_seasons.SEASONS_CSV)
+    assert os.path.samefile(write_tables.DATA_DIR, os.path.dirname(read_tables.TABLES_DIR))
+    assert os.path.normpath(write_tables.TABLES_DIR) == os.path.normpath(read_tables.TABLES_DIR)
+    assert read_tables.GITHUB_TABLES_URL.endswith('/Dash_Deploy/support/data/rankings_tables')
+    assert os.path.normpath(write_db.DB_FILE) == os.path.normpath(read_db.DB_FILE)
+    assert os.path.normpath(write_store.STORE_DIR) == os.path.normpath(read_store.STORE_DIR)
+    assert write_store.MANIFEST_FILE == read_store.MANIFEST_FILE
+    assert read_store.GITHUB_STORE_URL.endswith('/Dash_Deploy/support/data/rankings_store')
+
+
+def test_season_calendars_agree():
+    assert write_seasons.SEASON_ROLLOVER == read_seasons.SEASON_ROLLOVER
+    assert SEASONS == list(read_seasons.read_seasons().index)
+
+    first = date(int(SEASONS[0][:4]), 6, 1)
+    last = date(int(SEASONS[-1][:4]) + 1, 7, 1)
+    day = first
+    while day <= last:
+        assert write_seasons.season_of(day) == read_seasons.season_of(day), day
+        assert write_seasons.nba_week(day) == read_seasons.nba_week(day), day
+        day += timedelta(days=1)
+
+    for season in SEASONS:
+        weeks = read_seasons.season_weeks(season)
+        assert write_seasons.season_weeks(season) == [
+            (sunday.date(), int(week)) for sunday, week in zip(weeks['sunday'], weeks['nba_week'])]
+        first_day, last_day = read_seasons.season_bounds(season)
+        first_sunday, last_sunday = write_seasons.season_span(season)
+        assert (first_sunday, last_sunday + timedelta(days=6)) == (first_day.date(), last_day.date())
+
+
+def test_tables_read_back_what_was_written(tmp_path, two_seasons_csv):
+    path, rows = two_seasons_csv
+    tables_dir = str(tmp_path / 'tables')
+    write_tables.rebuild(path, tables_dir)
+    write_tables.append(article_rows('https://www.espn.com/d', date='250317'), tables_dir)
+    rows += article_rows('https://www.espn.com/d', date='250317')
+
+    assert read_tables.list_seasons(tables_dir) == ['2023-24', '2024-25']
+    for season in read_tables.list_seasons(tables_dir):
+        rk = read_tables.read_rankings(season, tables_dir)
+        got = sorted(zip(rk['source'], rk['author'], rk['date'], rk['url'], rk['teamname'], rk['ranking'].astype(int)))
+        assert got == expected_frame(r for r in rows if write_tables.group_by_season([r]).keys() == {season})
+
+
+def test_store_reads_back_what_was_written(tmp_path, two_seasons_csv):
+    path, rows = two_seasons_csv
+    store_dir = str(tmp_path / 'store')
+    write_store.RankingsStore(store_dir).rebuild(path)
+    assert write_store.append(article_rows('https://www.espn.com/d', date='250317'), store_dir) == 30
+    rows += article_rows('https://www.espn.com/d', date='250317')
+
+    assert read_store.list_seasons(store_dir) == ['2023-24', '2024-25']
+    for season in read_store.list_seasons(store_dir):
+        rk = read_store.read_season(season, store_dir)
+        got = sorted(zip(rk['source'], rk['author'], rk['date'], rk['url'], rk['teamname'], rk['ranking'].astype(int)))
+        assert got == expected_frame(r for r in rows if write_tables.group_by_season([r]).keys() == {season})
+    assert read_store.read_season('2019-20', store_dir) is None
+
+
+def test_database_reads_back_what_was_written(tmp_path, two_seasons_csv):
+    path, rows = two_seasons_csv
+    db_path = str(tmp_path / 'rankings.sqlite3')
+    write_db.rebuild(path, db_path)
+
+    df = read_db.read_rankings(path=db_path)
+    got = sorted(zip(df['source'], df['author'], df['date'], df['url'], df['teamname'], df['ranking']))
+    assert got == expected_frame(rows)
+
+    # each row's Sunday and week follow the apps' calendar
+    for day, sunday, week in zip(df['date'], df['sunday'], df['nba_week']):
+        assert sunday == read_seasons.most_recent_sunday(day)
+        assert week == read_seasons.nba_week(day)
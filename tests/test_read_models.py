@@ -0,0 +1,84 @@
+# test_read_models.py
+
+# The derived read models skip rows they already hold, so an append retried
+# after a failed commit never duplicates rankings.
+import csv
+import os
+import sqlite3
+
+import Modules.rankings_db as rankings_db
+import Modules.rankings_store as rankings_store
+import Modules.rankings_tables as rankings_tables
+from conftest import article_rows, write_csv
+
+
+def count_rows(path):
+    with open(path, newline='') as csvfile:
+        return sum(1 for _ in csv.DictReader(csvfile))
+
+
+def test_tables_append_is_idempotent(tmp_path, history_csv):
+    tables_dir = str(tmp_path / 'tables')
+    rankings_tables.rebuild(history_csv, tables_dir)
+    rows = article_rows('https://www.espn.com/nba/story/_/id/2/power-rankings')
+
+    assert rankings_tables.append(rows, tables_dir) == 30
+    assert rankings_tables.append(rows, tables_dir) == 0
+
+    assert count_rows(rankings_tables.table_path('articles', tables_dir, '2024-25')) == 2
+    assert count_rows(rankings_tables.table_path('ranks', tables_dir, '2024-25')) == 60
+
+
+def test_store_append_is_idempotent(tmp_path, history_csv):
+    store_dir = str(tmp_path / 'store')
+    rankings_store.RankingsStore(store_dir).rebuild(history_csv)
+    rows = article_rows('https://www.espn.com/nba/story/_/id/2/power-rankings')
+
+    # a part file the manifest never listed (an append that died before committing) is dropped
+    folder = os.path.join(store_dir, *rankings_store.partition_folder(rankings_store.partition_key(rows[0])).split('/'))
+    os.makedirs(folder)
+    open(os.path.join(folder, 'part-0.parquet'), 'wb').close()
+
+    assert rankings_store.append(rows, store_dir) == 30
+    assert rankings_store.append(rows, store_dir) == 0
+    assert len(os.listdir(folder)) == 1
+    store = rankings_store.RankingsStore(store_dir)
+    assert [part['rows'] for part in store.manifest['partitions']] == [30, 30]
+
+
+def test_db_append_is_idempotent(tmp_path, history_csv):
+    db_path = str(tmp_path / 'rankings.sqlite3')
+    rankings_db.rebuild(history_csv, db_path)
+    rows = article_rows('https://www.espn.com/nba/story/_/id/2/power-rankings')
+
+    rankings_db.append(rows, db_path)
+    rankings_db.append(rows, db_path)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*), COUNT(DISTINCT entryname) FROM rankings").fetchone() == (60, 60)
+    finally:
+        conn.close()
+
+
+def test_read_models_skip_the_same_repeats(tmp_path):
+    first = article_rows('https://www.cbssports.com/nba/news/power-rankings', source='CBS', author='Writer')
+    republished = article_rows('https://www.cbssports.com/nba/powerrankings/', source='CBS', author='Writer')
+    path = tmp_path / 'rankings.csv'
+    # an exact repeat, the same set under a second URL, and a team scraped twice with different ranks
+    write_csv(path, first + first[:5] + republished + [dict(first[0], ranking='9')])
+
+    tables_dir, db_path = str(tmp_path / 'tables'), str(tmp_path / 'rankings.sqlite3')
+    rankings_tables.rebuild(str(path), tables_dir)
+    rankings_db.rebuild(str(path), db_path)
+    store = rankings_store.RankingsStore(str(tmp_path / 'store'))
+    store.rebuild(str(path))
+
+    ranks = rankings_tables.read_table('ranks', tables_dir, '2024-25')
+    conn = sqlite3.connect(db_path)
+    try:
+        stored = conn.execute("SELECT url, entryname, ranking FROM rankings").fetchall()
+    finally:
+        conn.close()
+    assert len(ranks) == len(stored) == sum(part['rows'] for part in store.manifest['partitions']) == 60
+    assert (first[0]['url'], first[0]['entryname'], 1) in stored
@@ -0,0 +1,43 @@
+# test_response_cache.py
+
+# ResponseCache keeps its LRU order across runs: access times bumped by reads
+# are written back on flush/close and drive eviction in the next process.
+from Modules.response_cache import ResponseCache
+
+
+def test_access_times_survive_reopen(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    cache = ResponseCache(cache_dir)
+    cache.store("http://a/", b"a" * 10)
+    cache.store("http://b/", b"b" * 10)
+    cache.read("http://a/")
+    accessed = cache.lookup("http://a/")["accessed"]
+    cache.close()
+
+    assert ResponseCache(cache_dir).lookup("http://a/")["accessed"] == accessed
+
+
+def test_reads_without_close_are_not_lost_on_store(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    cache = ResponseCache(cache_dir)
+    cache.store("http://a/", b"a")
+    cache.read("http://a/")
+    accessed = cache.lookup("http://a/")["accessed"]
+    cache.store("http://b/", b"b")
+
+    assert ResponseCache(cache_dir).lookup("http://a/")["accessed"] == accessed
+
+
+def test_eviction_follows_reads_from_earlier_run(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    cache = ResponseCache(cache_dir, max_bytes=20)
+    cache.store("http://old/", b"o" * 10)
+    cache.store("http://new/", b"n" * 10)
+    # an offline replay touches the older page...
+    cache.read("http://old/")
+    cache.close()
+
+    # ...so the next run evicts the untouched one first
+    cache = ResponseCache(cache_dir, max_bytes=20)
+    cache.store("http://third/", b"t" * 10)
+    assert sorted(cache.urls()) == ["http://old/", "http://third/"]
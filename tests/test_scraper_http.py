@@ -0,0 +1,122 @@
+# test_scraper_http.py
+
+# ScraperClient against a local stand-in server: retries on 5xx, 304
+# revalidation served from the response cache, and refetching when a cached
+# body has gone missing.
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from Modules.response_cache import CacheMiss, ResponseCache
+from Modules.scraper_http import ScraperClient
+
+BODY = b"<html><body>rankings</body></html>"
+ETAG = '"v1"'
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """Serves BODY with an ETag; `/flaky` fails with 503 before succeeding."""
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.headers.get("If-None-Match")))
+
+        if self.path == "/flaky" and server.failures > 0:
+            server.failures -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    httpd.requests = []
+    httpd.failures = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def base_url(httpd):
+    return f"http://127.0.0.1:{httpd.server_address[1]}"
+
+
+def make_client(tmp_path, **kwargs):
+    return ScraperClient(backoff=0, timeout=5, cache=ResponseCache(str(tmp_path / "cache")), **kwargs)
+
+
+def test_retries_server_errors(server, tmp_path):
+    server.failures = 2
+    client = make_client(tmp_path, retries=3)
+
+    assert client.get(base_url(server) + "/flaky") == BODY
+    assert [path for path, _ in server.requests] == ["/flaky"] * 3
+
+
+def test_gives_up_after_retries(server, tmp_path):
+    server.failures = 5
+    client = make_client(tmp_path, retries=1)
+
+    with pytest.raises(Exception):
+        client.get(base_url(server) + "/flaky")
+
+
+def test_304_is_served_from_cache(server, tmp_path):
+    client = make_client(tmp_path)
+    url = base_url(server) + "/article"
+
+    assert client.get(url) == BODY
+    assert client.get(url) == BODY
+    # second request revalidated with the cached ETag instead of downloading again
+    assert server.requests == [("/article", None), ("/article", ETAG)]
+
+
+def test_304_with_missing_body_refetches(server, tmp_path):
+    client = make_client(tmp_path)
+    url = base_url(server) + "/article"
+    client.get(url)
+
+    # index still has the ETag, but the cached body is gone
+    entry = client.cache.lookup(url)
+    (tmp_path / "cache" / "objects" / entry["sha256"]).unlink()
+
+    assert client.get(url) == BODY
+    assert server.requests == [("/article", None), ("/article", ETAG), ("/article", None)]
+    assert client.cache.read(url) == BODY
+
+
+def test_offline_replays_cache(server, tmp_path):
+    url = base_url(server) + "/article"
+    make_client(tmp_path).get(url)
+
+    offline = make_client(tmp_path, offline=True)
+    assert offline.get(url) == BODY
+    with pytest.raises(CacheMiss):
+        offline.get(base_url(server) + "/never-fetched")
+    assert len(server.requests) == 1
+
+
+def test_bodies_are_not_kept_in_memory(server, tmp_path):
+    client = make_client(tmp_path)
+    client.get(base_url(server) + "/article")
+
+    assert not hasattr(client, "responses")
@@ -0,0 +1,71 @@
+# test_torn_appends.py
+
+# Appends write only the new rows and record the committed size; whatever a
+# crashed append left past that size is cut off before anything reads or
+# appends again.
+import csv
+import os
+
+import pytest
+
+import Modules.rankings_tables as rankings_tables
+import Modules.snapshot_meta as snapshot_meta
+import Modules.snapshots as snapshots
+from conftest import FIELDNAMES, article_rows
+
+URL = 'https://www.espn.com/nba/story/_/id/{}/power-rankings'
+
+
+def read_rows(path):
+    with open(path, newline='') as csvfile:
+        return list(csv.DictReader(csvfile))
+
+
+def test_snapshot_log_drops_torn_delta_tail(tmp_path, history_csv):
+    folder = str(tmp_path / 'log')
+    log = snapshots.SnapshotLog(folder)
+    log.init_from(history_csv, '250303')
+    log.append(article_rows(URL.format(2), date='250310'), '250310', FIELDNAMES)
+
+    delta_path = os.path.join(folder, log.manifest['deltas'][-1]['file'])
+    committed = os.path.getsize(delta_path)
+    assert log.manifest['deltas'][-1]['size'] == committed
+
+    # a crash mid-append leaves half a row behind the committed size
+    with open(delta_path, 'a') as delta_file:
+        delta_file.write('ESPN_250310_BOS,ESPN,Sta')
+
+    reopened = snapshots.SnapshotLog(folder)
+    assert os.path.getsize(delta_path) == committed
+    reopened.append(article_rows(URL.format(3), date='250310', source='CBS'), '250310', FIELDNAMES)
+
+    assert len(list(reopened.iter_rows())) == 90
+
+    # running metadata still describes the snapshot byte for byte
+    full = reopened.materialize(str(tmp_path / 'full.csv'))
+    expected = snapshot_meta.compute(full)
+    assert (reopened.meta['rows'], reopened.meta['size'], reopened.meta['crc32']) == \
+        (expected['rows'], expected['size'], expected['crc32'])
+
+
+def test_interrupted_tables_append_is_rolled_back(tmp_path, history_csv, monkeypatch):
+    tables_dir = str(tmp_path / 'tables')
+    rankings_tables.rebuild(history_csv, tables_dir)
+    rows = article_rows(URL.format(2), date='250310')
+
+    # the articles row is written, then the ranks write fails
+    append_table = rankings_tables.append_table
+
+    def crash_on_ranks(name, *args, **kwargs):
+        if name == 'ranks':
+            raise OSError("disk full")
+        return append_table(name, *args, **kwargs)
+    monkeypatch.setattr(rankings_tables, 'append_table', crash_on_ranks)
+    with pytest.raises(OSError):
+        rankings_tables.append(rows, tables_dir)
+    monkeypatch.setattr(rankings_tables, 'append_table', append_table)
+
+    # the retry discards the orphaned article row and writes the article whole
+    assert rankings_tables.append(rows, tables_dir) == 30
+    assert len(read_rows(rankings_tables.table_path('articles', tables_dir, '2024-25'))) == 2
+    assert len(read_rows(rankings_tables.table_path('ranks', tables_dir, '2024-25'))) == 60